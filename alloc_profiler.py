@@ -0,0 +1,210 @@
+"""
+Opt-in allocation profiler for The Last Bluebook
+Attributes per-frame Python allocations, new Surfaces and new fonts to game subsystems and tracks GC pauses
+"""
+import gc
+import time
+import tracemalloc
+from contextlib import nullcontext
+import pygame
+
+_NULL_SECTION = nullcontext()
+_HAS_RESET_PEAK = hasattr(tracemalloc, "reset_peak")  # Python 3.9+
+
+
+class SubsystemStats:
+    def __init__(self):
+        self.frames = 0            # Frames the subsystem ran in
+        self.transient_total = 0   # Sum of per-frame allocation high-water marks (bytes)
+        self.transient_max = 0
+        self.retained_total = 0    # Net memory kept after the subsystem ran (bytes)
+        self.surfaces_total = 0    # Surfaces created (including rendered text)
+        self.surfaces_max = 0
+        self.fonts_total = 0       # Font objects created
+
+
+class _Section:
+    """Context manager measuring allocations of one subsystem"""
+    def __init__(self, tracker, name):
+        self.tracker = tracker
+        self.name = name
+        self.start = 0
+        self.previous = None
+
+    def __enter__(self):
+        self.previous = self.tracker.current_section
+        self.tracker.current_section = self.name
+        self.start = tracemalloc.get_traced_memory()[0]
+        if _HAS_RESET_PEAK:
+            tracemalloc.reset_peak()
+        return self
+
+    def __exit__(self, *exc):
+        current, peak = tracemalloc.get_traced_memory()
+        if not _HAS_RESET_PEAK:
+            peak = max(current, self.start)  # Without reset_peak only the net growth can be measured
+        frame = self.tracker.frame_counts(self.name)
+        frame[0] += peak - self.start
+        frame[1] += current - self.start
+        self.tracker.current_section = self.previous
+        return False
+
+
+class AllocationTracker:
+    def __init__(self, enabled=False, budget_kb=None):
+        self.enabled = enabled
+        self.budget_kb = budget_kb  # Mean per-frame allocation allowed for each subsystem
+        self.sections = {}
+        self.stats = {}
+        self.current_section = None
+        self.frame = {}  # Subsystem -> [transient bytes, retained bytes, surfaces, fonts] for this frame
+        self.frames = 0
+
+        # GC pauses per generation: [collections, total seconds, max seconds]
+        self.gc_pauses = {0: [0, 0.0, 0.0], 1: [0, 0.0, 0.0], 2: [0, 0.0, 0.0]}
+        self.gc_start = 0.0
+
+        self._original_surface = None
+        self._original_sysfont = None
+
+    def start(self):
+        """Start tracing allocations and GC pauses"""
+        if not self.enabled:
+            return
+        tracemalloc.start(1)
+        gc.callbacks.append(self._gc_callback)
+        self._install_counters()
+
+    def stop(self):
+        if not self.enabled:
+            return
+        self._remove_counters()
+        if self._gc_callback in gc.callbacks:
+            gc.callbacks.remove(self._gc_callback)
+
+    def _gc_callback(self, phase, info):
+        if phase == "start":
+            self.gc_start = time.perf_counter()
+        else:
+            pause = time.perf_counter() - self.gc_start
+            stats = self.gc_pauses[info["generation"]]
+            stats[0] += 1
+            stats[1] += pause
+            stats[2] = max(stats[2], pause)
+
+    def _install_counters(self):
+        """Swap pygame.Surface and pygame.font.SysFont for versions that count creations"""
+        tracker = self
+        self._original_surface = pygame.Surface
+        self._original_sysfont = pygame.font.SysFont
+
+        class CountingSurface(self._original_surface):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                tracker.count("surface")
+
+        class CountingFont(pygame.font.Font):
+            def render(self, *args, **kwargs):
+                tracker.count("surface")
+                return super().render(*args, **kwargs)
+
+        def font_constructor(fontpath, size, bold, italic):
+            font = CountingFont(fontpath, size)
+            if bold:
+                font.set_bold(True)
+            if italic:
+                font.set_italic(True)
+            return font
+
+        original_sysfont = self._original_sysfont
+
+        def counting_sysfont(name, size, bold=False, italic=False, constructor=None):
+            tracker.count("font")
+            return original_sysfont(name, size, bold, italic, constructor or font_constructor)
+
+        pygame.Surface = CountingSurface
+        pygame.font.SysFont = counting_sysfont
+
+    def _remove_counters(self):
+        if self._original_surface is not None:
+            pygame.Surface = self._original_surface
+            pygame.font.SysFont = self._original_sysfont
+
+    def frame_counts(self, name):
+        counts = self.frame.get(name)
+        if counts is None:
+            counts = self.frame[name] = [0, 0, 0, 0]
+        return counts
+
+    def count(self, kind):
+        counts = self.frame_counts(self.current_section or "other")
+        if kind == "surface":
+            counts[2] += 1
+        else:
+            counts[3] += 1
+
+    def section(self, name):
+        """Attribute allocations in a with-block to a subsystem"""
+        if not self.enabled:
+            return _NULL_SECTION
+        section = self.sections.get(name)
+        if section is None:
+            section = self.sections[name] = _Section(self, name)
+        return section
+
+    def end_frame(self):
+        """Fold this frame's counts into the per-subsystem statistics"""
+        if not self.enabled:
+            return
+        self.frames += 1
+        for name, (transient, retained, surfaces, fonts) in self.frame.items():
+            stats = self.stats.get(name)
+            if stats is None:
+                stats = self.stats[name] = SubsystemStats()
+            stats.frames += 1
+            stats.transient_total += transient
+            stats.transient_max = max(stats.transient_max, transient)
+            stats.retained_total += retained
+            stats.surfaces_total += surfaces
+            stats.surfaces_max = max(stats.surfaces_max, surfaces)
+            stats.fonts_total += fonts
+        self.frame = {}
+
+    def write_report(self, path, top_sites=10):
+        """Write the summary report; returns the subsystems over the allocation budget"""
+        if not self.enabled:
+            return []
+        over_budget = []
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+
+        with open(path, "w") as f:
+            f.write("The Last Bluebook - allocation report\n")
+            f.write(f"Frames profiled: {self.frames}\n\n")
+            f.write(f"{'subsystem':<12} {'frames':>7} {'KB/frame':>9} {'max KB':>8} {'retained KB':>12} "
+                    f"{'surfaces/frame':>15} {'max':>5} {'fonts/frame':>12}\n")
+
+            for name in sorted(self.stats):
+                stats = self.stats[name]
+                frames = max(1, stats.frames)
+                mean_kb = stats.transient_total / frames / 1024
+                f.write(f"{name:<12} {stats.frames:>7} {mean_kb:>9.2f} {stats.transient_max / 1024:>8.2f} "
+                        f"{stats.retained_total / 1024:>12.2f} {stats.surfaces_total / frames:>15.2f} "
+                        f"{stats.surfaces_max:>5} {stats.fonts_total / frames:>12.2f}")
+                if self.budget_kb is not None and mean_kb > self.budget_kb:
+                    over_budget.append(name)
+                    f.write("  OVER BUDGET")
+                f.write("\n")
+
+            f.write("\nGC pauses\n")
+            for generation, (collections, total, longest) in self.gc_pauses.items():
+                f.write(f"  gen {generation}: {collections} collections, {total * 1000:.2f} ms total, "
+                        f"{longest * 1000:.3f} ms max\n")
+
+            f.write(f"\nTop {top_sites} allocation sites still alive at exit\n")
+            for stat in snapshot.statistics("lineno")[:top_sites]:
+                f.write(f"  {stat}\n")
+
+        return over_budget
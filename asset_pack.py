@@ -0,0 +1,97 @@
+"""
+Decoded asset packs for The Last Bluebook
+A pack holds every image already scaled and in the display's 32-bit pixel layout, and every sound
+effect as raw mixer samples. The cabinet host writes it once; each game instance memory-maps it
+read-only, so the pages are shared between instances and images are used without copying.
+"""
+import os
+import json
+import mmap
+import struct
+
+import pygame
+
+MAGIC = b"BLBKPACK"
+VERSION = 1
+HEADER = struct.Struct("<8sII")  # Magic, version, manifest length
+ALIGN = 64
+PIXEL_FORMAT = "BGRA"  # Same layout as convert_alpha() on the usual 32-bit displays
+
+
+def _aligned(offset):
+    return (offset + ALIGN - 1) // ALIGN * ALIGN
+
+
+def write_pack(path, images, sounds, effects):
+    """Write a pack
+
+    images: name -> Surface, sounds: key -> raw sample bytes, effects: name -> (sound key, category)
+    """
+    blobs = []
+    manifest = {"version": VERSION, "mixer": list(pygame.mixer.get_init()), "images": {}, "sounds": {},
+                "effects": {name: list(entry) for name, entry in effects.items()}}
+    for name, surface in images.items():
+        blobs.append(("images", name, pygame.image.tobytes(surface, PIXEL_FORMAT), surface.get_size()))
+    for key, raw in sounds.items():
+        blobs.append(("sounds", key, bytes(raw), None))
+
+    # Offsets depend on the manifest length, so lay the blobs out relative to the data start first
+    offset = 0
+    for section, name, data, size in blobs:
+        entry = [offset, len(data)] + (list(size) if size else [])
+        manifest[section][name] = entry
+        offset = _aligned(offset + len(data))
+    manifest_bytes = json.dumps(manifest).encode("utf-8")
+    data_start = _aligned(HEADER.size + len(manifest_bytes))
+
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(manifest_bytes)))
+        f.write(manifest_bytes)
+        for section, name, data, _ in blobs:
+            f.seek(data_start + manifest[section][name][0])
+            f.write(data)
+    os.replace(temp_path, path)  # Instances never see a half written pack
+
+
+class AssetPack:
+    """Read-only view of a pack mapped into memory"""
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "rb")
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.map)
+
+        magic, version, manifest_length = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} asset pack")
+        self.manifest = json.loads(bytes(self.view[HEADER.size:HEADER.size + manifest_length]))
+        self.data_start = _aligned(HEADER.size + manifest_length)
+
+    def _slice(self, offset, length):
+        start = self.data_start + offset
+        return self.view[start:start + length]
+
+    def image_names(self):
+        return list(self.manifest["images"])
+
+    def image(self, name):
+        """Get a Surface that uses the mapped pixels directly (never draw onto it)"""
+        offset, length, width, height = self.manifest["images"][name]
+        return pygame.image.frombuffer(self._slice(offset, length), (width, height), PIXEL_FORMAT)
+
+    def mixer_matches(self):
+        """Check the sounds were decoded for the same mixer format this process uses"""
+        return list(pygame.mixer.get_init() or []) == self.manifest["mixer"]
+
+    def effects(self):
+        """Get name -> (Sound, category); effects sharing a file share one Sound"""
+        sounds = {}
+        effects = {}
+        for name, (key, category) in self.manifest["effects"].items():
+            if key not in sounds:
+                offset, length = self.manifest["sounds"][key]
+                # pygame copies the samples into the mixer, but no decoding happens here
+                sounds[key] = pygame.mixer.Sound(buffer=self._slice(offset, length))
+            effects[name] = (sounds[key], category)
+        return effects
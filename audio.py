@@ -0,0 +1,179 @@
+"""
+Audio manager for The Last Bluebook
+Decodes every sound effect once, plays effects on reserved channel pools and streams the music
+"""
+import os
+import time
+import wave
+import pygame
+
+# Directory (relative to a sound's folder) holding pre-converted PCM WAV copies
+PCM_DIR_NAME = "pcm"
+
+# Channels reserved for each sound category
+DEFAULT_POOLS = {
+    "projectile": 4,  # Spawns come in bursts at high levels
+    "point": 2,
+    "level_up": 1,
+    "game_over": 1,
+}
+
+# Minimum time between two plays of the same effect (seconds)
+DEFAULT_MIN_INTERVALS = {
+    "projectile": 0.05,
+    "point": 0.03,
+}
+
+
+def pcm_path_for(path):
+    """Get the path of the pre-converted WAV copy of a sound file"""
+    folder, filename = os.path.split(path)
+    stem = os.path.splitext(filename)[0]
+    return os.path.join(folder, PCM_DIR_NAME, stem + ".wav")
+
+
+def write_pcm_wav(sound, path):
+    """Write a decoded sound to a WAV file using the current mixer format"""
+    frequency, size, channels = pygame.mixer.get_init()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with wave.open(path, "wb") as f:
+        f.setnchannels(channels)
+        f.setsampwidth(abs(size) // 8)
+        f.setframerate(frequency)
+        f.writeframes(sound.get_raw())
+
+
+class AudioManager:
+    def __init__(self, sounds_dir, pools=None, min_intervals=None):
+        self.sounds_dir = sounds_dir
+        self.pools = dict(DEFAULT_POOLS if pools is None else pools)
+        self.min_intervals = dict(DEFAULT_MIN_INTERVALS if min_intervals is None else min_intervals)
+
+        self.pcm_cache = {}       # Resolved path -> decoded Sound, shared by every effect using that file
+        self.effects = {}         # Effect name -> (Sound, category)
+        self.channels = {}        # Category -> list of reserved Channels
+        self.channel_started = {} # Channel id -> time the current voice started
+        self.last_played = {}     # Effect name -> last play time
+        self.stolen_voices = 0
+        self.skipped_plays = 0
+
+        self.music_volume = 0.5
+        self.music_loaded = False
+
+        self._reserve_channels()
+
+    def _reserve_channels(self):
+        """Reserve a dedicated block of mixer channels for every category"""
+        total = sum(self.pools.values())
+        # Leave a few unreserved channels for anything played outside the manager
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), total + 4))
+        pygame.mixer.set_reserved(total)
+
+        index = 0
+        for category, size in self.pools.items():
+            self.channels[category] = [pygame.mixer.Channel(index + i) for i in range(size)]
+            index += size
+
+    def _decode(self, path):
+        """Decode a sound file once, preferring its pre-converted WAV copy"""
+        if path in self.pcm_cache:
+            return self.pcm_cache[path]
+
+        pcm_path = pcm_path_for(path)
+        if os.path.exists(pcm_path):
+            sound = pygame.mixer.Sound(pcm_path)
+        else:
+            sound = pygame.mixer.Sound(path)
+        self.pcm_cache[path] = sound
+        return sound
+
+    def load(self, name, filename, category=None, fallback=None):
+        """Load an effect, falling back to another file or to silence if it can't be decoded"""
+        category = category or name
+        sound = None
+        for candidate in (filename, fallback):
+            if candidate is None:
+                continue
+            try:
+                sound = self._decode(os.path.join(self.sounds_dir, candidate))
+                break
+            except Exception as e:
+                print(f"Error loading sound {candidate}: {e}")
+
+        if sound is None:
+            # Create silent sound as fallback
+            sound = pygame.mixer.Sound(buffer=bytes([0]))
+
+        self.add(name, sound, category)
+        return sound
+
+    def add(self, name, sound, category=None):
+        """Register an already decoded effect"""
+        self.effects[name] = (sound, category or name)
+
+    def _pick_channel(self, category):
+        """Get a free channel from the category pool, stealing the oldest voice if all are busy"""
+        pool = self.channels.get(category)
+        if not pool:
+            return None
+
+        for channel in pool:
+            if not channel.get_busy():
+                return channel
+
+        # Voice stealing - cut off the voice that has been playing the longest
+        self.stolen_voices += 1
+        return min(pool, key=lambda channel: self.channel_started.get(id(channel), 0))
+
+    def play(self, name):
+        """Play an effect on its category pool, dropping rapid repeats"""
+        if name not in self.effects:
+            return False
+        sound, category = self.effects[name]
+
+        current_time = time.perf_counter()
+        if current_time - self.last_played.get(name, -1e9) < self.min_intervals.get(name, 0.0):
+            self.skipped_plays += 1
+            return False
+
+        channel = self._pick_channel(category)
+        if channel is None:
+            # No pool for this category - let the mixer find a free channel
+            sound.play()
+        else:
+            channel.play(sound)
+            self.channel_started[id(channel)] = current_time
+
+        self.last_played[name] = current_time
+        return True
+
+    def overlay_lines(self):
+        """Get a text line describing voice usage"""
+        pool_channels = [channel for pool in self.channels.values() for channel in pool]
+        busy = sum(channel.get_busy() for channel in pool_channels)
+        return [f"audio {busy}/{len(pool_channels)} voices  stolen {self.stolen_voices}  skipped {self.skipped_plays}"]
+
+    def load_music(self, path, volume=0.5):
+        """Open background music for streaming from disk (it is never fully decoded into memory)"""
+        if not os.path.exists(path):
+            return False
+        pygame.mixer.music.load(path)
+        self.music_volume = volume
+        pygame.mixer.music.set_volume(volume)
+        self.music_loaded = True
+        return True
+
+    def play_music(self):
+        """Start looping the background music if it isn't already playing"""
+        if self.music_loaded and not pygame.mixer.music.get_busy():
+            pygame.mixer.music.play(-1)  # -1 means loop indefinitely
+
+    def stop_music(self):
+        pygame.mixer.music.stop()
+
+    def toggle_music_mute(self):
+        """Mute or unmute the background music"""
+        if pygame.mixer.music.get_volume() > 0:
+            pygame.mixer.music.set_volume(0)
+        else:
+            pygame.mixer.music.set_volume(self.music_volume)
@@ -0,0 +1,147 @@
+"""
+Attract-mode autopilot for The Last Bluebook
+Predicts nearby projectiles over a short horizon in one NumPy batch, rasterizes them into a coarse
+danger grid per time step and picks the arrow keys whose path is safest while heading for the point
+"""
+import time
+from collections import defaultdict
+
+import numpy as np
+import pygame
+
+from input_timing import LatencyStats
+
+# The nine arrow key combinations (including standing still) as (dx, dy)
+DIRECTIONS = np.array([(dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1)], dtype=np.float64)
+
+
+class Autopilot:
+    def __init__(self, screen_size, player_size, player_speed, cell_size=20, horizon_steps=12,
+                 step_time=0.05, max_threats=96, margin=6, budget_ms=1.0):
+        self.screen_width, self.screen_height = screen_size
+        self.player_width, self.player_height = player_size
+        self.player_speed = player_speed  # Pixels per second along each held axis
+        self.cell_size = cell_size
+        self.grid_width = -(-self.screen_width // cell_size)
+        self.grid_height = -(-self.screen_height // cell_size)
+        self.margin = margin
+        self.step_time = step_time
+
+        # Limits the budget control adjusts between
+        self.max_horizon_steps = horizon_steps
+        self.max_max_threats = max_threats
+        self.horizon_steps = horizon_steps
+        self.max_threats = max_threats
+        self.budget_ms = budget_ms
+
+        self.direction = 4  # Index into DIRECTIONS; start standing still
+        self.keys = defaultdict(bool)
+        self.decision_time = LatencyStats()
+        self.decisions = 0
+        self.overruns = 0
+
+    def horizon(self):
+        """How far ahead (seconds) projectiles are predicted"""
+        return self.horizon_steps * self.step_time
+
+    def decide(self, player_x, player_y, target_x, target_y, threats):
+        """Choose the arrow keys for this frame
+
+        player_x/player_y are the player's top left, target is the point's center.
+        threats is a list of (x0, y0, vx, vy, age, width, height): start center, velocity in
+        pixels per second, seconds since the start position, and rect size.
+        """
+        start = time.perf_counter()
+        threats = np.array(threats, dtype=np.float64).reshape(-1, 7).T
+        x0, y0, vx, vy, age, width, height = threats
+        px = player_x + self.player_width / 2
+        py = player_y + self.player_height / 2
+
+        # Only the nearest threats fit in the budget
+        if len(x0) > self.max_threats:
+            distance = (x0 + vx * age - px) ** 2 + (y0 + vy * age - py) ** 2
+            keep = np.argpartition(distance, self.max_threats)[:self.max_threats]
+            x0, y0, vx, vy, age, width, height = (a[keep] for a in threats)
+
+        times = np.arange(1, self.horizon_steps + 1) * self.step_time
+        danger = self._danger_grid(x0, y0, vx, vy, age, width, height, times)
+        self.direction = self._best_direction(px, py, target_x, target_y, times, danger)
+
+        dx, dy = DIRECTIONS[self.direction]
+        self.keys[pygame.K_LEFT] = dx < 0
+        self.keys[pygame.K_RIGHT] = dx > 0
+        self.keys[pygame.K_UP] = dy < 0
+        self.keys[pygame.K_DOWN] = dy > 0
+
+        self._track_budget((time.perf_counter() - start) * 1000)
+        return self.keys
+
+    def _danger_grid(self, x0, y0, vx, vy, age, width, height, times):
+        """Count, per time step and cell, the projectiles the player's center there would touch"""
+        steps = len(times)
+        danger = np.zeros((steps, self.grid_height, self.grid_width), dtype=np.float32)
+        if len(x0) == 0:
+            return danger
+
+        # Predicted centers of every projectile at every step, shape (steps, threats)
+        t = age[None, :] + times[:, None]
+        cx = x0[None, :] + vx[None, :] * t
+        cy = y0[None, :] + vy[None, :] * t
+        gx = (cx // self.cell_size).astype(np.int64)
+        gy = (cy // self.cell_size).astype(np.int64)
+        k = np.broadcast_to(np.arange(steps)[:, None], gx.shape)
+        inside = (gx >= 0) & (gx < self.grid_width) & (gy >= 0) & (gy < self.grid_height)
+        np.add.at(danger, (k[inside], gy[inside], gx[inside]), 1.0)
+
+        # Grow each hit by the reach of the player's center: half the player plus half the projectile
+        reach_x = int(np.ceil((self.player_width / 2 + width.max() / 2 + self.margin) / self.cell_size))
+        reach_y = int(np.ceil((self.player_height / 2 + height.max() / 2 + self.margin) / self.cell_size))
+        grown = danger.copy()
+        for shift in range(1, reach_x + 1):
+            grown[:, :, shift:] += danger[:, :, :-shift]
+            grown[:, :, :-shift] += danger[:, :, shift:]
+        danger = grown.copy()
+        for shift in range(1, reach_y + 1):
+            danger[:, shift:, :] += grown[:, :-shift, :]
+            danger[:, :-shift, :] += grown[:, shift:, :]
+        return danger
+
+    def _best_direction(self, px, py, target_x, target_y, times, danger):
+        # Player center along each candidate path, shape (directions, steps)
+        travel = times[None, :] * self.player_speed
+        half_width = self.player_width / 2
+        half_height = self.player_height / 2
+        path_x = np.clip(px + DIRECTIONS[:, 0:1] * travel, half_width, self.screen_width - half_width)
+        path_y = np.clip(py + DIRECTIONS[:, 1:2] * travel, half_height, self.screen_height - half_height)
+
+        cells_x = np.minimum((path_x // self.cell_size).astype(np.int64), self.grid_width - 1)
+        cells_y = np.minimum((path_y // self.cell_size).astype(np.int64), self.grid_height - 1)
+        steps = np.arange(len(times))[None, :]
+        # Near-term danger matters most
+        weights = 0.85 ** np.arange(len(times))
+        risk = (danger[steps, cells_y, cells_x] * weights).sum(axis=1)
+
+        # Head for the point: closest approach along the path, normalized by the screen diagonal
+        diagonal = np.hypot(self.screen_width, self.screen_height)
+        approach = np.hypot(path_x - target_x, path_y - target_y).min(axis=1) / diagonal
+
+        cost = risk * 10 + approach
+        cost[self.direction] -= 0.01  # Slight preference for the current keys, to avoid dithering
+        return int(np.argmin(cost))
+
+    def _track_budget(self, elapsed_ms):
+        """Shrink the horizon and threat count when over budget, grow them back with headroom"""
+        self.decisions += 1
+        self.decision_time.add(elapsed_ms)
+        if elapsed_ms > self.budget_ms:
+            self.overruns += 1
+            self.max_threats = max(8, self.max_threats // 2)
+            self.horizon_steps = max(4, self.horizon_steps - 2)
+        elif elapsed_ms < self.budget_ms / 2:
+            self.max_threats = min(self.max_max_threats, self.max_threats + 4)
+            self.horizon_steps = min(self.max_horizon_steps, self.horizon_steps + 1)
+
+    def overlay_lines(self):
+        mean, p95, worst = self.decision_time.summary()
+        return [f"autopilot  decide avg {mean:.2f}  p95 {p95:.2f}  max {worst:.2f} / {self.budget_ms:g} ms"
+                f"  horizon {self.horizon_steps}  threats {self.max_threats}  overruns {self.overruns}"]
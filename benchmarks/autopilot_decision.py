@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Measure how long the attract-mode autopilot takes to decide
+Usage: python benchmarks/autopilot_decision.py [--decisions 500] [--budget-ms 1.0]
+
+Random scenes with a growing number of nearby projectiles are fed to the autopilot, once with
+the budget control off (raw cost of the full horizon) and once with it on.
+"""
+import os
+import sys
+import math
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from autopilot import Autopilot
+from input_timing import LatencyStats
+
+SCREEN_SIZE = (800, 600)
+CENTER = (400, 300)
+PLAYER_SIZE = (33, 50)
+PLAYER_SPEED = 5 * 60
+PROJECTILE_SPEED = 4 * 60
+THREAT_COUNTS = [0, 16, 64, 256, 1024]
+
+
+def make_scene(rng, count):
+    """Player, point and projectiles already in flight from the center"""
+    player = (rng.uniform(0, SCREEN_SIZE[0] - PLAYER_SIZE[0]), rng.uniform(0, SCREEN_SIZE[1] - PLAYER_SIZE[1]))
+    point = (rng.uniform(15, SCREEN_SIZE[0] - 15), rng.uniform(45, SCREEN_SIZE[1] - 15))
+    threats = []
+    for _ in range(count):
+        angle = rng.uniform(-math.pi, math.pi)
+        size = rng.choice([30, 12])
+        threats.append((CENTER[0], CENTER[1], math.cos(angle) * PROJECTILE_SPEED, math.sin(angle) * PROJECTILE_SPEED,
+                        rng.uniform(0, 1.5), 30, size))
+    return player, point, threats
+
+
+def measure(autopilot, scenes):
+    stats = LatencyStats(window=len(scenes))
+    for (player, point, threats) in scenes:
+        start = time.perf_counter()
+        autopilot.decide(player[0], player[1], point[0], point[1], threats)
+        stats.add((time.perf_counter() - start) * 1000)
+    return stats.summary()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--decisions", type=int, default=500)
+    parser.add_argument("--budget-ms", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{args.decisions} decisions per row, budget {args.budget_ms:g} ms")
+    print(f"{'threats':>8} {'budget':>7} {'avg ms':>8} {'p95 ms':>8} {'max ms':>8} {'horizon':>8} {'kept':>5}")
+    for count in THREAT_COUNTS:
+        scenes = [make_scene(rng, count) for _ in range(args.decisions)]
+        for budget in (math.inf, args.budget_ms):
+            autopilot = Autopilot(SCREEN_SIZE, PLAYER_SIZE, PLAYER_SPEED, budget_ms=budget)
+            mean, p95, worst = measure(autopilot, scenes)
+            label = "off" if budget == math.inf else "on"
+            print(f"{count:>8} {label:>7} {mean:>8.3f} {p95:>8.3f} {worst:>8.3f} "
+                  f"{autopilot.horizon_steps:>8} {autopilot.max_threats:>5}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
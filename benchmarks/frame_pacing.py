@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Compare frame pacing precision and CPU cost
+Usage: python benchmarks/frame_pacing.py [--frames 600] [--fps 60] [--work-ms 4]
+
+Runs a fake game loop (busy work of about --work-ms per frame) paced by pygame.time.Clock and
+by each FramePacer mode, and prints the frame interval jitter against the CPU time spent.
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pygame
+
+from pacing import FramePacer, JitterHistogram, PACING_MODES
+
+
+def fake_work(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def run(clock, frames, fps, work_ms):
+    """Run the loop and get (jitter histogram, CPU seconds, wall seconds)"""
+    jitter = JitterHistogram()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    last = None
+    for _ in range(frames):
+        clock.tick(fps)
+        now = time.perf_counter()
+        if last is not None:
+            jitter.add((now - last - 1 / fps) * 1000)
+        last = now
+        fake_work(work_ms / 1000)
+    return jitter, time.process_time() - cpu_start, time.perf_counter() - wall_start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--fps", type=int, default=60)
+    parser.add_argument("--work-ms", type=float, default=4.0)
+    args = parser.parse_args()
+
+    pygame.init()
+    clocks = [("pygame Clock", pygame.time.Clock())]
+    clocks += [(f"FramePacer {mode}", FramePacer(mode)) for mode in PACING_MODES]
+
+    print(f"{args.frames} frames at {args.fps} FPS with {args.work_ms:g} ms of work each")
+    print(f"{'pacer':<22} {'jitter avg':>11} {'p99':>8} {'max':>8} {'CPU':>6}")
+    for name, clock in clocks:
+        jitter, cpu, wall = run(clock, args.frames, args.fps, args.work_ms)
+        mean, p99, worst = jitter.summary()
+        print(f"{name:<22} {mean:>8.3f} ms {p99:>5.2f} ms {worst:>5.2f} ms {cpu / wall:>6.0%}")
+
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Measure time-to-first-frame for each packaged variant of the game
+Usage: python benchmarks/launch_time.py [--runs 10] [--source]
+
+Each build is launched with --first-frame-marker; the time from starting the process to the
+marker file appearing is the launch time, which includes one-file unpacking and interpreter startup.
+"""
+import os
+import sys
+import time
+import tempfile
+import argparse
+import subprocess
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+EXE_SUFFIX = ".exe" if sys.platform == "win32" else ""
+
+VARIANTS = {
+    "onefile": [os.path.join(ROOT, "dist", "TheLastBlueBook" + EXE_SUFFIX)],
+    "fast": [os.path.join(ROOT, "dist", "TheLastBlueBook-fast", "TheLastBlueBook-fast" + EXE_SUFFIX)],
+}
+
+
+def launch_once(command, cwd, timeout):
+    """Launch the game and return the seconds until its first frame was shown"""
+    with tempfile.TemporaryDirectory() as tmp:
+        marker = os.path.join(tmp, "first_frame")
+        start = time.perf_counter()
+        process = subprocess.Popen(command + ["--first-frame-marker", marker], cwd=cwd,
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            while not os.path.exists(marker):
+                if process.poll() is not None and not os.path.exists(marker):
+                    raise RuntimeError(f"{command[0]} exited with code {process.returncode} before the first frame")
+                if time.perf_counter() - start > timeout:
+                    raise RuntimeError(f"{command[0]} showed no frame within {timeout} s")
+                time.sleep(0.001)
+            elapsed = time.perf_counter() - start
+        finally:
+            try:
+                process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="Launches per variant (after one warm-up launch)")
+    parser.add_argument("--source", action="store_true", help="Also measure running main.py with this Python")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    variants = {name: command for name, command in VARIANTS.items() if os.path.exists(command[0])}
+    if args.source:
+        variants["source"] = [sys.executable, os.path.join(ROOT, "main.py")]
+    if not variants:
+        print("No builds found in dist/ - run build_exe.py --variant all first (or pass --source)")
+        return 1
+
+    print(f"{'variant':<10} {'min ms':>8} {'median ms':>10} {'max ms':>8}")
+    results = {}
+    for name, command in variants.items():
+        cwd = ROOT if name == "source" else os.path.dirname(command[0])
+        launch_once(command, cwd, args.timeout)  # Warm-up so every variant starts with a warm disk cache
+        times = sorted(launch_once(command, cwd, args.timeout) for _ in range(args.runs))
+        results[name] = times[len(times) // 2]
+        print(f"{name:<10} {times[0] * 1000:>8.1f} {results[name] * 1000:>10.1f} {times[-1] * 1000:>8.1f}")
+
+    fastest = min(results, key=results.get)
+    print(f"Fastest to first frame: {fastest}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark the cost of presenting the logical canvas at different window sizes and render scales
+Usage: python benchmarks/render_scale.py [--window 1920x1080] [--frames 300]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pygame
+from renderer import Renderer
+
+LOGICAL_SIZE = (800, 600)
+RENDER_SCALES = [0.25, 0.5, 0.75, 1.0]
+
+
+def draw_test_frame(canvas, sprites):
+    """Draw something shaped like a busy game frame"""
+    canvas.fill((0, 0, 0))
+    for image, pos in sprites:
+        canvas.blit(image, pos)
+
+
+def benchmark(window_size, render_scale, smooth, frames, sprites):
+    renderer = Renderer(LOGICAL_SIZE, window_size, render_scale, smooth=smooth)
+
+    # Warm up so surface allocation and driver setup are not measured
+    for _ in range(10):
+        draw_test_frame(renderer.canvas, sprites)
+        renderer.present()
+
+    draw_total = 0.0
+    present_total = 0.0
+    for _ in range(frames):
+        start = time.perf_counter()
+        draw_test_frame(renderer.canvas, sprites)
+        drawn = time.perf_counter()
+        renderer.present()
+        present_total += time.perf_counter() - drawn
+        draw_total += drawn - start
+
+    return renderer.scale_path, draw_total / frames * 1000, present_total / frames * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--window", action="append",
+                        help="Window size WIDTHxHEIGHT (repeatable, default: 800x600, 1600x1200, 1920x1080, 3840x2160)")
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    windows = args.window or ["800x600", "1600x1200", "1920x1080", "3840x2160"]
+
+    pygame.init()
+    pygame.display.set_mode(LOGICAL_SIZE)
+
+    random.seed(0)
+    sprite = pygame.Surface((30, 30), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, (255, 200, 0), (15, 15), 15)
+    sprites = [(sprite, (random.randint(0, 770), random.randint(0, 570))) for _ in range(200)]
+
+    print(f"{'window':>10} {'scale':>6} {'smooth':>6} {'path':>16} {'draw ms':>8} {'present ms':>11}")
+    for window in windows:
+        window_size = tuple(int(n) for n in window.lower().split("x"))
+        for render_scale in RENDER_SCALES:
+            for smooth in (True, False):
+                path, draw_ms, present_ms = benchmark(window_size, render_scale, smooth, args.frames, sprites)
+                print(f"{window:>10} {render_scale:>6g} {str(smooth):>6} {path:>16} {draw_ms:>8.3f} {present_ms:>11.3f}")
+
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Check that the headless replay simulation agrees with the game
+Usage: python benchmarks/replay_consistency_check.py [--runs 100] [--rates 60 30 120] [--seed 1]
+
+Plays the real game (main.py, on SDL's dummy video and audio drivers) with a noisy point-chasing
+bot, records every run, then re-simulates the recordings with simulation.py. Any run whose score,
+grade or level differs means the two have drifted apart; exits with status 1 if any does.
+"""
+import os
+import sys
+import random
+import argparse
+import tempfile
+import subprocess
+import collections
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+MAX_TICKS = 60 * 60 * 5  # Give up on a bot run after five minutes of game time
+
+
+def play(game, rng, runs, frame_steps):
+    """Play runs with the bot, stepping the game by a random frame time from frame_steps each frame"""
+    import pygame
+
+    keys = collections.defaultdict(bool)
+    for _ in range(runs):
+        game.game_state = game.STATE_START_SCREEN
+        game.start_game()
+        for frame in range(MAX_TICKS):
+            if frame % 8 == 0:
+                keys.clear()
+                player_x, player_y = game.player_pos
+                point_x, point_y = game.point_pos
+                if rng.random() < 0.8:
+                    keys[pygame.K_LEFT if point_x < player_x + 16 else pygame.K_RIGHT] = True
+                    keys[pygame.K_UP if point_y < player_y + 25 else pygame.K_DOWN] = True
+                else:
+                    keys[rng.choice([pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN])] = True
+            game.input_sampler.keys = keys
+            game.run_simulation(rng.choice(frame_steps))
+            if game.game_state == game.STATE_GAME_OVER:
+                break
+
+
+def check_rate(rate, runs, seed):
+    """Play and re-simulate runs at one simulation rate; returns the number of runs that disagree"""
+    from replay import load_run
+    from simulation import replay_run, sprite_sizes
+
+    with tempfile.TemporaryDirectory() as directory:
+        sys.argv = [sys.argv[0], "--record-runs", directory, "--sim-hz", str(rate)]
+        import main as game
+        game.asset_loader.run_blocking()
+        game.finish_loading()
+        game.high_score = float("inf")  # Never write highscore.json
+        play(game, random.Random(seed), runs, [1 / 60, 1 / 60, 1 / 30, 1 / 120])
+
+        sizes = sprite_sizes(game.images_dir)
+        paths = sorted(os.path.join(directory, name) for name in os.listdir(directory))
+        problems = []
+        for path in paths:
+            _, problem = replay_run(load_run(path), sizes)
+            if problem:
+                problems.append(f"{os.path.basename(path)}: {problem}")
+    print(f"{rate:>4} Hz: {len(paths) - len(problems)}/{len(paths)} runs agree")
+    for problem in problems[:10]:
+        print(f"  {problem}")
+    return len(problems) + (len(paths) < runs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=100, help="Runs per simulation rate")
+    parser.add_argument("--rates", type=int, nargs="+", default=[60, 30, 120])
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    if len(args.rates) == 1:
+        return 1 if check_rate(args.rates[0], args.runs, args.seed) else 0
+
+    # main.py reads its options when it is imported, so every rate gets a process of its own
+    failed = 0
+    for rate in args.rates:
+        command = [sys.executable, os.path.abspath(__file__), "--runs", str(args.runs), "--rates", str(rate),
+                   "--seed", str(args.seed)]
+        failed += subprocess.run(command).returncode != 0
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
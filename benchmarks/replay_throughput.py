@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Measure replay verification throughput on a synthetic backlog
+Usage: python benchmarks/replay_throughput.py [--runs 2000] [--workers 1 2 4] [--chunk-size 32]
+
+Plays runs headlessly with a simple bot that chases the point, writes them as recorded runs
+to a temporary directory, then verifies the whole backlog serially and with process pools.
+"""
+import os
+import sys
+import random
+import tempfile
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import replay
+import replay_verify
+from rules import grade_for_score
+from simulation import Simulation, sprite_sizes
+
+MAX_TICKS = 60 * 60 * 5  # Give up on a bot run after five minutes of game time
+
+
+def play_run(rng, sizes):
+    """Play one run with a noisy point-chasing bot and record it"""
+    seed = rng.getrandbits(64)
+    start_clock = 1.7e9 + rng.random() * 1e6
+    simulation = Simulation(seed, start_clock, 60, sizes)
+    inputs = []
+    keys = 0
+    while not simulation.game_over and len(inputs) < MAX_TICKS:
+        if len(inputs) % 8 == 0:
+            player = simulation.player_rect
+            point = simulation.point_rect
+            if rng.random() < 0.8:
+                keys = replay.LEFT if point.centerx < player.centerx else replay.RIGHT
+                keys |= replay.UP if point.centery < player.centery else replay.DOWN
+            else:
+                keys = rng.choice([0, replay.LEFT, replay.RIGHT, replay.UP, replay.DOWN])
+        inputs.append(format(keys, "x"))
+        simulation.tick(keys)
+
+    return {
+        "version": replay.VERSION, "seed": seed, "start_clock": start_clock, "sim_hz": 60,
+        "inputs": "".join(inputs),
+        "claim": {"score": simulation.score, "grade": grade_for_score(simulation.score),
+                  "level": simulation.difficulty_level},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=2000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument("--chunk-size", type=int, default=32)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    sizes = sprite_sizes(replay_verify.images_dir)
+    with tempfile.TemporaryDirectory() as directory:
+        for i in range(args.runs):
+            replay.save_run(os.path.join(directory, f"run-{i:06d}.json"), play_run(rng, sizes))
+        paths = replay_verify.run_paths([directory])
+        print(f"{len(paths)} synthetic runs, chunks of {args.chunk_size}")
+
+        print(f"{'workers':>8} {'seconds':>8} {'runs/s':>8} {'failed':>7}")
+        for workers in sorted(set(args.workers)):
+            results, seconds = replay_verify.verify(paths, workers, args.chunk_size)
+            failed = sum(1 for _, _, problem in results if problem)
+            print(f"{workers:>8} {seconds:>8.2f} {len(results) / seconds:>8.1f} {failed:>7}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Measure the run history archive on millions of synthetic runs
+Usage: python benchmarks/run_history_scale.py [--runs 2000000] [--json-runs 100000]
+
+Appends synthetic runs to a temporary archive, then times the full summary, a time-window query
+that the chunk min/max index can answer by skipping chunks, and a filtered histogram. For
+comparison it also times loading the same fields from one JSON object per run.
+"""
+import io
+import os
+import sys
+import json
+import time
+import tempfile
+import argparse
+import contextlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import numpy as np
+
+from rules import GRADE_LEVELS
+from run_history import RunHistory, LEVEL_TIME_FIELDS
+from run_history_report import summarize
+
+
+def synthetic_runs(rng, count, start_time):
+    """Runs with plausible scores and level timings, in end time order"""
+    score = rng.gamma(2.0, 12.0, count).astype(np.int32)
+    level = score // 5 + 1
+    percentage = score / 200 * 100
+    grade = np.clip(np.searchsorted([55, 60, 64.4, 68.8, 73.2, 77.6, 82, 86.4, 90.8, 95.2], percentage), 0, 10)
+    step = rng.uniform(2.0, 6.0, (count, 1))
+    columns = {
+        "end_time": start_time + np.cumsum(rng.exponential(30.0, count)),
+        "duration": (level + rng.uniform(0, 1, count)) * step[:, 0],
+        "score": score,
+        "percentage": percentage,
+        "grade": len(GRADE_LEVELS) - 1 - grade,
+        "level": level,
+        "killer_grade": np.clip(len(GRADE_LEVELS) - level // 3, 0, len(GRADE_LEVELS) - 1),
+        "max_multiplier": rng.integers(1, 6, count),
+        "multiplier_uptime": rng.uniform(0, 1, count),
+    }
+    for reached, field in enumerate(LEVEL_TIME_FIELDS, 2):
+        columns[field] = np.where(level >= reached, (reached - 1) * step[:, 0], np.nan)
+    return columns
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=2_000_000)
+    parser.add_argument("--json-runs", type=int, default=100_000)
+    parser.add_argument("--batch", type=int, default=250_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(1)
+    with tempfile.TemporaryDirectory() as directory:
+        history = RunHistory(os.path.join(directory, "history"))
+        start = time.perf_counter()
+        end_time = 1.7e9
+        for first in range(0, args.runs, args.batch):
+            columns = synthetic_runs(rng, min(args.batch, args.runs - first), end_time)
+            end_time = columns["end_time"][-1]
+            history.append(columns)
+        print(f"Appended {len(history)} runs in {time.perf_counter() - start:.2f} s")
+
+        history = RunHistory(history.directory, create=False)  # Cold open, as the report does
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            summarize(history, {})
+        print(f"Full summary: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        # The last day of runs: every other chunk is skipped from the index alone
+        window = {"end_time": (end_time - 86400, None)}
+        start = time.perf_counter()
+        matched = history.count(window)
+        score = history.aggregate("score", window)
+        print(f"Last day ({matched} runs, avg score {score['mean']:.1f}): {(time.perf_counter() - start) * 1000:.1f} ms")
+        assert matched == np.count_nonzero(np.asarray(history.column("end_time")) >= end_time - 86400)
+
+        where = {"level": (5, None), "killer_grade": 9}
+        start = time.perf_counter()
+        counts, _ = history.histogram("time_to_level_5", bins=20, where=where)
+        print(f"Filtered histogram ({counts.sum()} runs): {(time.perf_counter() - start) * 1000:.1f} ms")
+
+        # Row per run for comparison
+        columns = synthetic_runs(rng, args.json_runs, 1.7e9)
+        path = os.path.join(directory, "runs.jsonl")
+        with open(path, "w") as f:
+            for i in range(args.json_runs):
+                f.write(json.dumps({field: values[i].tolist() for field, values in columns.items()}) + "\n")
+        start = time.perf_counter()
+        with open(path) as f:
+            scores = np.array([json.loads(line)["score"] for line in f])
+        seconds = time.perf_counter() - start
+        print(f"JSON rows: {args.json_runs} runs loaded in {seconds:.2f} s "
+              f"(~{seconds * args.runs / args.json_runs:.0f} s for {args.runs})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Check swept collision at low simulation rates against a high-rate reference simulation
+Usage: python benchmarks/swept_collision_check.py [--cases 5000] [--seed 1]
+
+Random projectile/player encounters are simulated with discrete overlap tests at a high
+reference rate, then at lower rates with both discrete and swept tests. Swept collision must
+find every hit the reference finds; exits with status 1 if it misses any.
+"""
+import os
+import sys
+import math
+import random
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from collision import rects_overlap, swept_hit_time
+
+CENTER = (400, 300)
+PLAYER_SIZE = (33, 50)
+PROJECTILE_SIZES = [(30, 12), (30, 30)]
+PLAYER_SPEED = 5 * 60          # Pixels per second
+TURN_INTERVAL = 0.1            # Player changes direction this often (a whole number of ticks at every rate)
+DURATION = 2.0
+REFERENCE_HZ = 2400
+RATES = [60, 30, 20, 10]
+
+
+def make_case(rng):
+    """Create one random encounter"""
+    angle = rng.uniform(-math.pi, math.pi)
+    speed = rng.uniform(4, 40) * 60  # The game's 4 px/frame up to 10x faster
+    size = rng.choice(PROJECTILE_SIZES)
+
+    # Start the player somewhere around the projectile's path
+    distance = rng.uniform(80, 350)
+    offset = rng.uniform(-0.4, 0.4)
+    start = (CENTER[0] + math.cos(angle + offset) * distance - PLAYER_SIZE[0] / 2,
+             CENTER[1] + math.sin(angle + offset) * distance - PLAYER_SIZE[1] / 2)
+
+    directions = []
+    for _ in range(int(DURATION / TURN_INTERVAL) + 1):
+        dx, dy = rng.choice([(0, 0), (1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (-1, 1), (1, -1), (-1, -1)])
+        directions.append((dx * PLAYER_SPEED, dy * PLAYER_SPEED))
+
+    return {
+        "velocity": (math.cos(angle) * speed, math.sin(angle) * speed),
+        "size": size,
+        "player_start": start,
+        "player_velocities": directions,
+    }
+
+
+def player_position(case, t):
+    """Piecewise linear player path (exact at any time)"""
+    x, y = case["player_start"]
+    segment = min(int(t / TURN_INTERVAL), len(case["player_velocities"]) - 1)
+    for i in range(segment):
+        vx, vy = case["player_velocities"][i]
+        x += vx * TURN_INTERVAL
+        y += vy * TURN_INTERVAL
+    vx, vy = case["player_velocities"][segment]
+    remaining = t - segment * TURN_INTERVAL
+    return x + vx * remaining, y + vy * remaining
+
+
+def projectile_position(case, t):
+    """Top left of the projectile rect at time t"""
+    vx, vy = case["velocity"]
+    width, height = case["size"]
+    return CENTER[0] + vx * t - width / 2, CENTER[1] + vy * t - height / 2
+
+
+def discrete_hit(case, hz):
+    width, height = case["size"]
+    for tick in range(int(DURATION * hz) + 1):
+        t = tick / hz
+        px, py = projectile_position(case, t)
+        qx, qy = player_position(case, t)
+        if rects_overlap(px, py, width, height, qx, qy, *PLAYER_SIZE):
+            return True
+    return False
+
+
+def swept_hit(case, hz):
+    width, height = case["size"]
+    previous_projectile = projectile_position(case, 0)
+    previous_player = player_position(case, 0)
+    for tick in range(1, int(DURATION * hz) + 1):
+        t = tick / hz
+        px, py = projectile_position(case, t)
+        qx, qy = player_position(case, t)
+        if swept_hit_time(previous_projectile[0], previous_projectile[1], width, height,
+                          px - previous_projectile[0], py - previous_projectile[1],
+                          previous_player[0], previous_player[1], *PLAYER_SIZE,
+                          qx - previous_player[0], qy - previous_player[1]) is not None:
+            return True
+        previous_projectile = (px, py)
+        previous_player = (qx, qy)
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cases", type=int, default=3000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    cases = [make_case(rng) for _ in range(args.cases)]
+    reference = [discrete_hit(case, REFERENCE_HZ) for case in cases]
+    print(f"{len(cases)} encounters, {sum(reference)} hits in the {REFERENCE_HZ} Hz reference")
+
+    print(f"{'rate':>6} {'discrete missed':>16} {'discrete extra':>15} {'swept missed':>13} {'swept extra':>12}")
+    failed = False
+    for hz in RATES:
+        counts = {"discrete": [0, 0], "swept": [0, 0]}
+        for case, expected in zip(cases, reference):
+            for name, test in (("discrete", discrete_hit), ("swept", swept_hit)):
+                hit = test(case, hz)
+                if expected and not hit:
+                    counts[name][0] += 1
+                elif hit and not expected:
+                    counts[name][1] += 1
+        print(f"{hz:>4}Hz {counts['discrete'][0]:>16} {counts['discrete'][1]:>15} "
+              f"{counts['swept'][0]:>13} {counts['swept'][1]:>12}")
+        failed = failed or counts["swept"][0] > 0
+
+    # Swept "extra" hits are grazes shorter than one reference tick, so only misses are failures
+    print("FAIL: swept collision missed hits found by the reference" if failed else "PASS")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
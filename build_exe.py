@@ -2,6 +2,10 @@
 """
 Build script for TheLastBlueBook.py
 Creates an executable with PyInstaller while implementing techniques to reduce antivirus flags
+
+Variants:
+  onefile - single executable from TheLastBlueBook.spec (unpacks to a temp directory on every launch)
+  fast    - launch-optimized one-dir build: optimized bytecode, pre-converted audio, unused modules excluded
 """
 import os
 import sys
@@ -9,10 +13,120 @@ import shutil
 import subprocess
 import time
 import hashlib
+import argparse
+
+APP_NAME = "TheLastBlueBook"
+FAST_NAME = APP_NAME + "-fast"
+STAGING_DIR = os.path.join("build", "fast-assets")
+
+# Modules pulled in by pygame or the standard library that the game never uses
+EXCLUDED_MODULES = [
+    "pygame.examples",
+    "pygame.tests",
+    "pygame.docs",
+    "pygame.camera",
+    "pygame.midi",
+    "pygame.movie",
+    "pygame.sndarray",
+    "pygame.surfarray",
+    "pygame.pixelcopy",
+    "pygame.ftfont",
+    "tkinter",
+    "unittest",
+    "pydoc",
+    "doctest",
+]
+
+def executable_name(name):
+    return name + ".exe" if sys.platform == "win32" else name
+
+def file_hash(path):
+    """Calculate the SHA-256 hash of a file"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(4096), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def directory_size(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        for filename in files:
+            total += os.path.getsize(os.path.join(root, filename))
+    return total
+
+def prepare_fast_assets():
+    """Copy the assets into a staging directory with every MP3 pre-decoded to PCM WAV"""
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+    from audio import pcm_path_for, write_pcm_wav
+
+    # Use the same mixer format as the game so the WAVs need no conversion at load
+    pygame.mixer.pre_init(44100, -16, 2, 512)
+    pygame.mixer.init()
+
+    if os.path.exists(STAGING_DIR):
+        shutil.rmtree(STAGING_DIR)
+    shutil.copytree("images", os.path.join(STAGING_DIR, "images"))
+    shutil.copytree("sounds", os.path.join(STAGING_DIR, "sounds"))
+
+    sounds_dir = os.path.join(STAGING_DIR, "sounds")
+    for filename in sorted(os.listdir(sounds_dir)):
+        if filename.endswith(".mp3") and filename != "background_music.mp3":  # Music keeps streaming
+            path = os.path.join(sounds_dir, filename)
+            write_pcm_wav(pygame.mixer.Sound(path), pcm_path_for(path))
+            print(f"Pre-converted {filename} to PCM")
+
+    pygame.mixer.quit()
+
+def build_onefile():
+    """Build the single-file executable from the spec file"""
+    print("Building executable with PyInstaller...")
+    subprocess.run([
+        sys.executable,
+        "-m",
+        "PyInstaller",
+        f"{APP_NAME}.spec",
+        "--clean"
+    ], check=True)
+    return os.path.join("dist", executable_name(APP_NAME))
+
+def build_fast():
+    """Build the launch-optimized one-dir variant"""
+    prepare_fast_assets()
+
+    print("Building launch-optimized one-dir executable with PyInstaller...")
+    separator = os.pathsep
+    command = [
+        sys.executable,
+        "-m",
+        "PyInstaller",
+        "main.py",
+        "--name", FAST_NAME,
+        "--onedir",           # No unpacking to a temp directory at launch
+        "--windowed",
+        "--noupx",            # Compressed binaries would have to be unpacked at every launch
+        "--optimize", "1",    # Bytecode is compiled once at build time with asserts stripped
+        "--icon", os.path.join("images", "icon.png"),
+        "--add-data", f"{os.path.join(STAGING_DIR, 'images')}{separator}images",
+        "--add-data", f"{os.path.join(STAGING_DIR, 'sounds')}{separator}sounds",
+        "--add-data", f"highscore.json{separator}.",
+        "--clean",
+        "--noconfirm",
+    ]
+    for module in EXCLUDED_MODULES:
+        command += ["--exclude-module", module]
+    subprocess.run(command, check=True)
+    return os.path.join("dist", FAST_NAME, executable_name(FAST_NAME))
 
 def main():
+    parser = argparse.ArgumentParser(description="Build TheLastBlueBook executable")
+    parser.add_argument("--variant", choices=["onefile", "fast", "all"], default="onefile",
+                        help="onefile (default), fast (one-dir, launch-optimized) or all")
+    args = parser.parse_args()
+
     print("Building TheLastBlueBook executable...")
-    
+
     # Ensure PyInstaller is installed
     try:
         import PyInstaller
@@ -20,42 +134,36 @@ def main():
     except ImportError:
         print("Installing PyInstaller...")
         subprocess.run([sys.executable, "-m", "pip", "install", "pyinstaller"], check=True)
-    
+
     # Clean previous build directories
     for dir_to_clean in ['build', 'dist']:
         if os.path.exists(dir_to_clean):
             print(f"Cleaning {dir_to_clean} directory...")
             shutil.rmtree(dir_to_clean)
-    
-    # Build the executable
-    print("Building executable with PyInstaller...")
-    subprocess.run([
-        sys.executable, 
-        "-m", 
-        "PyInstaller", 
-        "TheLastBlueBook.spec",
-        "--clean"
-    ], check=True)
-    
-    # Verify the build was successful
-    exe_path = os.path.join("dist", "TheLastBlueBook.exe")
-    if os.path.exists(exe_path):
-        print(f"Build successful! Executable created at: {exe_path}")
-        
-        # Calculate and display file hash for verification
-        file_hash = hashlib.sha256()
-        with open(exe_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                file_hash.update(chunk)
-        print(f"SHA-256 hash: {file_hash.hexdigest()}")
-        
-        # Get file size
-        file_size = os.path.getsize(exe_path) / (1024 * 1024)  # Convert to MB
-        print(f"File size: {file_size:.2f} MB")
-    else:
-        print("Build failed! Executable not found.")
-        return 1
-    
+
+    builders = {"onefile": build_onefile, "fast": build_fast}
+    variants = list(builders) if args.variant == "all" else [args.variant]
+
+    for variant in variants:
+        start = time.perf_counter()
+        exe_path = builders[variant]()
+
+        # Verify the build was successful
+        if os.path.exists(exe_path):
+            print(f"Build successful! Executable created at: {exe_path} ({time.perf_counter() - start:.1f} s)")
+
+            # Calculate and display file hash for verification
+            print(f"SHA-256 hash: {file_hash(exe_path)}")
+
+            # Get file size (the whole directory for one-dir builds)
+            size_path = os.path.dirname(exe_path) if variant == "fast" else None
+            size = directory_size(size_path) if size_path else os.path.getsize(exe_path)
+            print(f"{'Directory' if size_path else 'File'} size: {size / (1024 * 1024):.2f} MB")
+        else:
+            print("Build failed! Executable not found.")
+            return 1
+
+    print("Compare launch times with: python benchmarks/launch_time.py")
     return 0
 
 if __name__ == "__main__":
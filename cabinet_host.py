@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Run several instances of The Last Bluebook on one host
+Usage: python cabinet_host.py [--instances 2] [--pack PATH] [--report-interval 60] [-- game options...]
+
+Decodes every image and sound once into an asset pack that all instances memory-map, starts one
+instance per display (sharing displays when there are fewer than instances), restarts any instance
+that exits, and periodically reports each instance's memory use. Options after "--" are passed to
+every instance.
+"""
+import os
+import sys
+import time
+import signal
+import argparse
+import tempfile
+import subprocess
+
+base_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+def game_command():
+    """Get the command that starts the game (the executable itself when frozen)"""
+    if getattr(sys, "frozen", False):
+        return [sys.executable]
+    return [sys.executable, os.path.join(base_dir, "main.py")]
+
+
+def build_pack(path):
+    """Decode the assets into a pack with a headless game process"""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    start = time.perf_counter()
+    subprocess.run(game_command() + ["--build-asset-pack", path], env=env, check=True,
+                   stdout=subprocess.DEVNULL)
+    print(f"Asset pack written to {path} ({os.path.getsize(path) / 1024:.0f} KB) "
+          f"in {time.perf_counter() - start:.2f} s")
+
+
+def display_count():
+    """Count the connected displays (1 when SDL can't tell)"""
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    try:
+        import pygame
+    except ImportError:
+        return 1
+    try:
+        pygame.display.init()
+        return max(1, pygame.display.get_num_displays())
+    except pygame.error:
+        return 1
+    finally:
+        pygame.display.quit()
+
+
+def memory_usage(pid):
+    """Get resident, proportional and shared memory in KB (Linux only; None elsewhere)"""
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            fields = dict(line.split(":", 1) for line in f if ":" in line and not line.startswith(" "))
+    except OSError:
+        return None
+    kb = {name: int(value.split()[0]) for name, value in fields.items() if value.strip().endswith("kB")}
+    return kb.get("Rss", 0), kb.get("Pss", 0), kb.get("Shared_Clean", 0) + kb.get("Shared_Dirty", 0)
+
+
+class Instance:
+    """One game process, restarted whenever it exits"""
+    def __init__(self, index, command, min_uptime=10.0, max_backoff=30.0):
+        self.index = index
+        self.command = command
+        self.min_uptime = min_uptime  # Exiting sooner than this counts as a crash loop
+        self.max_backoff = max_backoff
+        self.process = None
+        self.started = 0.0
+        self.restarts = 0
+        self.quick_exits = 0
+        self.restart_at = 0.0
+
+    def start(self):
+        self.process = subprocess.Popen(self.command)
+        self.started = time.time()
+
+    def poll(self, now):
+        """Restart the instance if it has exited (backing off if it keeps dying)"""
+        if self.process is not None:
+            code = self.process.poll()
+            if code is None:
+                return
+            uptime = now - self.started
+            print(f"Instance {self.index} (pid {self.process.pid}) exited with {code} after {uptime:.0f} s")
+            self.process = None
+            self.quick_exits = self.quick_exits + 1 if uptime < self.min_uptime else 0
+            self.restart_at = now + min(self.max_backoff, 2 ** self.quick_exits - 1)
+
+        if now >= self.restart_at:
+            if self.started:
+                self.restarts += 1
+            self.start()
+
+    def stop(self):
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+    def report_line(self, now):
+        if self.process is None:
+            return f"  {self.index:>3} {'-':>7} {'restarting':>10}"
+        memory = memory_usage(self.process.pid)
+        uptime = now - self.started
+        line = f"  {self.index:>3} {self.process.pid:>7} {uptime:>9.0f}s {self.restarts:>8}"
+        if memory is None:
+            return line + f" {'n/a':>9} {'n/a':>9} {'n/a':>9}"
+        rss, pss, shared = memory
+        return line + f" {rss / 1024:>7.1f}MB {pss / 1024:>7.1f}MB {shared / 1024:>7.1f}MB"
+
+
+def report(instances, now):
+    print(f"  {'#':>3} {'pid':>7} {'uptime':>10} {'restarts':>8} {'rss':>9} {'pss':>9} {'shared':>9}")
+    for instance in instances:
+        print(instance.report_line(now))
+
+
+def main():
+    argv = sys.argv[1:]
+    game_args = []
+    if "--" in argv:
+        game_args = argv[argv.index("--") + 1:]
+        argv = argv[:argv.index("--")]
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--instances", type=int, default=2)
+    parser.add_argument("--pack", default=os.path.join(tempfile.gettempdir(), "the-last-bluebook-assets.pack"),
+                        help="Where to write the shared asset pack")
+    parser.add_argument("--same-display", action="store_true",
+                        help="Open every instance on display 0 instead of one display each")
+    parser.add_argument("--report-interval", type=float, default=60.0,
+                        help="Seconds between memory reports")
+    parser.add_argument("--run-for", type=float, default=None,
+                        help="Stop everything after this many seconds (for testing)")
+    args = parser.parse_args(argv)
+
+    build_pack(args.pack)
+
+    displays = 1 if args.same_display else display_count()
+    if displays < args.instances and not args.same_display:
+        print(f"Only {displays} display(s) for {args.instances} instances, so some instances share a display")
+
+    instances = []
+    for index in range(args.instances):
+        display = index % displays
+        command = game_command() + ["--asset-pack", args.pack, "--display", str(display)] + game_args
+        instances.append(Instance(index, command))
+
+    stopping = []
+    signal.signal(signal.SIGTERM, lambda *_: stopping.append(True))
+
+    start = time.time()
+    next_report = start + min(5.0, args.report_interval)
+    try:
+        while not stopping:
+            now = time.time()
+            for instance in instances:
+                instance.poll(now)
+            if now >= next_report:
+                report(instances, now)
+                next_report = now + args.report_interval
+            if args.run_for is not None and now - start >= args.run_for:
+                break
+            time.sleep(0.5)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        report(instances, time.time())
+        for instance in instances:
+            instance.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
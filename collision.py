@@ -0,0 +1,53 @@
+"""
+Continuous (swept) collision detection for The Last Bluebook
+Rects are tested over the whole movement between two simulation ticks, so fast projectiles
+and low tick rates can't tunnel through the player
+"""
+import math
+
+
+def rects_overlap(ax, ay, aw, ah, bx, by, bw, bh):
+    """Same test as pygame.Rect.colliderect: touching edges don't count"""
+    return ax < bx + bw and ax + aw > bx and ay < by + bh and ay + ah > by
+
+
+def _axis_interval(a_min, a_size, b_min, b_size, velocity):
+    """Get the open interval of t where two segments overlap on one axis"""
+    # Overlap while (a_min - b_max) + v t < 0 and (a_max - b_min) + v t > 0
+    near = a_min - (b_min + b_size)
+    far = (a_min + a_size) - b_min
+    if velocity == 0:
+        if near < 0 < far:
+            return -math.inf, math.inf
+        return math.inf, -math.inf
+    t1 = -near / velocity
+    t2 = -far / velocity
+    return min(t1, t2), max(t1, t2)
+
+
+def swept_hit_time(ax, ay, aw, ah, adx, ady, bx, by, bw, bh, bdx, bdy):
+    """Get the first time in [0, 1] two moving rects overlap, or None if they never do
+
+    Rect a starts at (ax, ay) and moves by (adx, ady) over the step; rect b likewise.
+    Both are assumed to move in a straight line at constant speed during the step.
+    """
+    # Work in b's frame of reference so only a moves
+    vx = adx - bdx
+    vy = ady - bdy
+
+    x_enter, x_exit = _axis_interval(ax, aw, bx, bw, vx)
+    y_enter, y_exit = _axis_interval(ay, ah, by, bh, vy)
+
+    enter = max(x_enter, y_enter)
+    leave = min(x_exit, y_exit)
+    if enter >= leave or enter > 1 or leave <= 0:
+        return None
+    return max(enter, 0.0)
+
+
+def swept_rects_hit(a_start, a_end, b_start, b_end):
+    """Check two pygame-style rects (anything with x, y, width and height) for overlap during a step"""
+    return swept_hit_time(
+        a_start.x, a_start.y, a_start.width, a_start.height, a_end.x - a_start.x, a_end.y - a_start.y,
+        b_start.x, b_start.y, b_start.width, b_start.height, b_end.x - b_start.x, b_end.y - b_start.y,
+    ) is not None
@@ -0,0 +1,159 @@
+"""
+Deferred work for The Last Bluebook
+Work that does not have to happen in the frame that triggered it (saving the high score, sound cues,
+loading fonts) is queued here and run in the slack left before the next frame's deadline, highest
+priority first. Each task has a maximum deferral; once that has passed it runs even if the frame
+has no slack left, so nothing waits forever.
+"""
+import time
+import heapq
+import itertools
+
+# Priorities, most urgent first
+HIGH = 0
+NORMAL = 1
+LOW = 2
+
+DEFAULT_COST = 0.0005  # Assumed run time of a task that has never run
+
+
+class DeferredTask:
+    __slots__ = ("name", "key", "fn", "args", "priority", "submitted", "due", "done")
+
+    def __init__(self, name, key, fn, args, priority, submitted, due):
+        self.name = name
+        self.key = key
+        self.fn = fn
+        self.args = args
+        self.priority = priority
+        self.submitted = submitted
+        self.due = due
+        self.done = False
+
+
+class WorkScheduler:
+    """Cooperative scheduler that runs queued tasks in the slack before frame deadlines"""
+    def __init__(self, enabled=True, reserve_ms=1.0, clock=time.perf_counter):
+        self.enabled = enabled
+        self.reserve = reserve_ms / 1000  # Slack left untouched for the frame pacer
+        self.clock = clock
+        self.by_priority = []  # Heap of (priority, sequence, task)
+        self.by_due = []       # Heap of (due, sequence, task); both skip tasks already done
+        self.sequence = itertools.count()
+        self.pending = {}      # Key -> task, so repeated submissions coalesce
+        self.costs = {}        # Task name -> smoothed run time in seconds
+        self.depth = 0
+
+        # Metrics
+        self.peak_depth = 0
+        self.run_count = 0
+        self.forced_count = 0     # Tasks run past their maximum deferral
+        self.slack_total = 0.0    # Seconds of slack offered
+        self.slack_used = 0.0     # Seconds of it spent on tasks
+        self.max_deferral = 0.0   # Longest a task has waited
+        self.last_slack_ms = 0.0
+        self.last_used_ms = 0.0
+
+    def submit(self, name, fn, *args, priority=NORMAL, max_delay=0.5, key=None):
+        """Queue fn(*args) to run within max_delay seconds
+
+        Submitting again with the same key before the task has run replaces its arguments but keeps
+        the original deadline.
+        """
+        if not self.enabled:
+            fn(*args)
+            return
+
+        if key is not None and key in self.pending:
+            task = self.pending[key]
+            task.fn = fn
+            task.args = args
+            return
+
+        now = self.clock()
+        task = DeferredTask(name, key, fn, args, priority, now, now + max_delay)
+        sequence = next(self.sequence)
+        heapq.heappush(self.by_priority, (priority, sequence, task))
+        heapq.heappush(self.by_due, (task.due, sequence, task))
+        if key is not None:
+            self.pending[key] = task
+        self.depth += 1
+        self.peak_depth = max(self.peak_depth, self.depth)
+
+    def run(self, deadline):
+        """Run overdue tasks, then as many others as fit before deadline (a clock() time)"""
+        start = self.clock()
+        slack = max(0.0, deadline - self.reserve - start)
+        self.last_slack_ms = slack * 1000
+        self.last_used_ms = 0.0
+        if not self.depth:
+            return 0
+        self.slack_total += slack
+
+        ran = 0
+        while self.by_due and self.by_due[0][0] <= start:
+            task = heapq.heappop(self.by_due)[2]
+            if not task.done:
+                self._execute(task)
+                self.forced_count += 1
+                ran += 1
+
+        while self.by_priority:
+            task = self.by_priority[0][2]
+            if task.done:
+                heapq.heappop(self.by_priority)
+                continue
+            if self.clock() + self.costs.get(task.name, DEFAULT_COST) > deadline - self.reserve:
+                break
+            heapq.heappop(self.by_priority)
+            self._execute(task)
+            ran += 1
+
+        used = self.clock() - start
+        self.slack_used += min(used, slack)
+        self.last_used_ms = used * 1000
+        self._compact()
+        return ran
+
+    def flush(self):
+        """Run everything still queued, e.g. before quitting"""
+        while self.by_priority:
+            task = heapq.heappop(self.by_priority)[2]
+            if not task.done:
+                self._execute(task)
+        self.by_due.clear()
+
+    def _execute(self, task):
+        task.done = True
+        self.depth -= 1
+        if task.key is not None:
+            del self.pending[task.key]
+
+        before = self.clock()
+        self.max_deferral = max(self.max_deferral, before - task.submitted)
+        task.fn(*task.args)
+        elapsed = self.clock() - before
+
+        previous = self.costs.get(task.name)
+        self.costs[task.name] = elapsed if previous is None else previous * 0.8 + elapsed * 0.2
+        self.run_count += 1
+
+    def _compact(self):
+        """Drop finished tasks from the heap they were not popped from"""
+        if len(self.by_due) > 2 * self.depth + 16:
+            self.by_due = [entry for entry in self.by_due if not entry[2].done]
+            heapq.heapify(self.by_due)
+        if len(self.by_priority) > 2 * self.depth + 16:
+            self.by_priority = [entry for entry in self.by_priority if not entry[2].done]
+            heapq.heapify(self.by_priority)
+
+    def overlay_lines(self):
+        if not self.enabled:
+            return ["deferred off (runs inline)"]
+        usage = self.slack_used / self.slack_total * 100 if self.slack_total else 0.0
+        return [
+            f"deferred {self.depth} queued (peak {self.peak_depth})  run {self.run_count}"
+            f"  forced {self.forced_count}",
+            f"slack {self.last_used_ms:.2f} / {self.last_slack_ms:.1f} ms  {usage:.1f}% used"
+            f"  max wait {self.max_deferral * 1000:.0f} ms",
+        ]
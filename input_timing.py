@@ -0,0 +1,88 @@
+"""
+Input sampling and input-to-display latency tracking for The Last Bluebook
+"""
+import time
+from collections import deque
+import pygame
+
+
+class LatencyStats:
+    """Rolling window of latency samples in milliseconds"""
+    def __init__(self, window=240):
+        self.samples = deque(maxlen=window)
+
+    def add(self, value_ms):
+        self.samples.append(value_ms)
+
+    def summary(self):
+        """Get mean, 95th percentile and max of the current window"""
+        if not self.samples:
+            return 0.0, 0.0, 0.0
+        ordered = sorted(self.samples)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        return sum(ordered) / len(ordered), p95, ordered[-1]
+
+
+class InputSampler:
+    def __init__(self, window=240):
+        self.keys = None
+        self.sample_time = 0.0       # When the keyboard state for this frame was read
+        self.last_drain_time = None  # When events were last pulled off the queue
+        self.event_drain_start = 0.0  # Start of the window the latest events arrived in
+        self.had_key_event = False   # Whether a key was pressed/released since the last frame
+        self.pending_events = []     # Event that woke an idle wait, handed out by the next poll
+
+        # Keyboard state read -> frame presented
+        self.sample_latency = LatencyStats(window)
+        # Worst case for a key event: it arrived just after the previous drain
+        self.event_latency = LatencyStats(window)
+
+    def poll_events(self):
+        """Drain the event queue, remembering when it happened"""
+        current_time = time.perf_counter()
+        events = self.pending_events + pygame.event.get()
+        self.pending_events = []
+        self.had_key_event = any(event.type in (pygame.KEYDOWN, pygame.KEYUP) for event in events)
+        self.event_drain_start = self.last_drain_time if self.last_drain_time is not None else current_time
+        self.last_drain_time = current_time
+        return events
+
+    def wait_for_event(self, timeout_ms):
+        """Block until an event arrives or the timeout passes; True if an event arrived"""
+        event = pygame.event.wait(timeout_ms)
+        # Whatever arrives next arrived after this, so latency is measured from the wake up
+        self.last_drain_time = time.perf_counter()
+        if event.type == pygame.NOEVENT:
+            return False
+        self.pending_events.append(event)
+        return True
+
+    def sample(self):
+        """Read the keyboard state as late as possible, right before the update step"""
+        pygame.event.pump()
+        self.keys = pygame.key.get_pressed()
+        self.sample_time = time.perf_counter()
+        return self.keys
+
+    def record_present(self, sample_time, key_event_start=None):
+        """Record latencies once a frame built from input sampled at sample_time has been flipped
+
+        key_event_start is the start of the window the frame's key events arrived in (None if none did).
+        Both come from the frame's snapshot, so a frame presented later than it was simulated is still
+        matched to its own input.
+        """
+        if not sample_time:
+            return
+        present_time = time.perf_counter()
+        self.sample_latency.add((present_time - sample_time) * 1000)
+        if key_event_start is not None:
+            self.event_latency.add((present_time - key_event_start) * 1000)
+
+    def overlay_lines(self):
+        """Get text lines describing the current latency statistics"""
+        sample_mean, sample_p95, sample_max = self.sample_latency.summary()
+        event_mean, event_p95, event_max = self.event_latency.summary()
+        return [
+            f"input->present  avg {sample_mean:.1f}  p95 {sample_p95:.1f}  max {sample_max:.1f} ms",
+            f"key event->present (worst case)  avg {event_mean:.1f}  p95 {event_p95:.1f}  max {event_max:.1f} ms",
+        ]
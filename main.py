@@ -1,1087 +1,1728 @@
-import pygame
-import sys
-import math
-import random
-import time
-import os
-import json
-
-# Initialize Pygame
-pygame.init()
-pygame.mixer.init()  # Initialize the mixer for sound effects
-
-# Constants
-SCREEN_WIDTH = 800
-SCREEN_HEIGHT = 600
-FPS = 60
-CENTER_X = SCREEN_WIDTH // 2
-CENTER_Y = SCREEN_HEIGHT // 2
-
-# Game states
-STATE_START_SCREEN = 0
-STATE_PLAYING = 1
-STATE_GAME_OVER = 2
-
-# Colors
-BLACK = (0, 0, 0)
-WHITE = (255, 255, 255)
-RED = (255, 0, 0)
-GREEN = (0, 255, 0)
-BLUE = (0, 0, 255)
-YELLOW = (255, 200, 0)
-PURPLE = (128, 0, 128)
-ORANGE = (255, 165, 0)
-CYAN = (0, 255, 255)
-MAGENTA = (255, 0, 255)
-
-# Use custom image icon
-def resource_path(relative_path):
-    """Get absolute path to resource, works for dev and PyInstaller"""
-    try:
-        base_path = sys._MEIPASS
-    except AttributeError:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
-
-icon = pygame.image.load(resource_path("images/icon.png"))
-
-# Create the game window
-pygame.display.set_icon(icon)
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("The Last Bluebook")  # Optional: also set the window title
-clock = pygame.time.Clock()
-
-# Create directories if they don't exist
-sounds_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sounds")
-images_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "images")
-os.makedirs(sounds_dir, exist_ok=True)
-os.makedirs(images_dir, exist_ok=True)
-
-# Load images or use defaults
-try:
-    # Try to load player image
-    player_image_path = os.path.join(images_dir, "player.png")
-    if os.path.exists(player_image_path):
-        player_image = pygame.image.load(player_image_path).convert()
-    else:
-        player_image = pygame.Surface((50, 50))
-        player_image.fill(RED)
-    
-    # Try to load generator image
-    generator_image_path = os.path.join(images_dir, "generator.png")
-    if os.path.exists(generator_image_path):
-        generator_image = pygame.image.load(generator_image_path).convert_alpha()
-    else:
-        generator_image = pygame.Surface((20, 20))
-        generator_image.fill(GREEN)
-    
-    # Try to load projectile images for different grades
-    projectile_images = {}
-    grade_levels = ["1.00", "1.25", "1.50", "1.75", "2.00", "2.25", "2.50", "2.75", "3.00", "4.00", "5.00"]
-    
-    # Load all grade-specific projectile images if they exist
-    for grade in grade_levels:
-        grade_image_path = os.path.join(images_dir, f"projectile_{grade}.png")
-        if os.path.exists(grade_image_path):
-            projectile_images[grade] = pygame.image.load(grade_image_path).convert_alpha()
-    
-    # Default projectile image if no grade-specific images are found
-    projectile_image_path = os.path.join(images_dir, "projectile.png")
-    if os.path.exists(projectile_image_path):
-        default_projectile_image = pygame.image.load(projectile_image_path).convert_alpha()
-    else:
-        default_projectile_image = pygame.Surface((30, 30), pygame.SRCALPHA)
-        pygame.draw.circle(default_projectile_image, YELLOW, (15, 15), 15)
-    
-    # Try to load point image
-    point_image_path = os.path.join(images_dir, "point.png")
-    if os.path.exists(point_image_path):
-        point_image = pygame.image.load(point_image_path).convert_alpha()
-    else:
-        point_image = pygame.Surface((40, 40), pygame.SRCALPHA)
-        pygame.draw.circle(point_image, PURPLE, (20, 20), 20)
-        
-except Exception as e:
-    print(f"Error loading images: {e}")
-    # Create default images if loading fails
-    player_image = pygame.Surface((50, 50))
-    player_image.fill(RED)
-    
-    generator_image = pygame.Surface((20, 20))
-    generator_image.fill(GREEN)
-    
-    default_projectile_image = pygame.Surface((30, 30), pygame.SRCALPHA)
-    pygame.draw.circle(default_projectile_image, YELLOW, (15, 15), 15)
-    
-    projectile_images = {}  # Empty dictionary for grade-specific projectiles
-    
-    point_image = pygame.Surface((40, 40), pygame.SRCALPHA)
-    pygame.draw.circle(point_image, PURPLE, (20, 20), 20)
-
-# Resize images to match the original sizes
-player_size = 50
-player_image = pygame.transform.scale(player_image, (0.67 * player_size, player_size))
-
-generator_size = 50
-generator_image = pygame.transform.scale(generator_image, (generator_size, generator_size))
-
-projectile_size = 15
-# Resize all projectile images
-if projectile_images:
-    for grade in projectile_images:
-        projectile_images[grade] = pygame.transform.scale(projectile_images[grade], (projectile_size*2, projectile_size*2*0.4))
-default_projectile_image = pygame.transform.scale(default_projectile_image, (projectile_size*2, projectile_size*2))
-
-point_size = 15
-point_image = pygame.transform.scale(point_image, (point_size*2, point_size*2))
-
-# Create sound files if they don't exist
-try:
-    # Game over sounds - just two variants
-    game_over_fail_sound = pygame.mixer.Sound(os.path.join(sounds_dir, "game_over_fail.mp3"))  # For 5.00 and 4.00
-    game_over_pass_sound = pygame.mixer.Sound(os.path.join(sounds_dir, "game_over_pass.mp3"))  # For 3.00 and better
-    
-    # Fallback game over sound
-    fallback_game_over_sound = pygame.mixer.Sound(os.path.join(sounds_dir, "game_over.wav"))
-    
-    # Point gain sound
-    point_sound = pygame.mixer.Sound(os.path.join(sounds_dir, "point.mp3"))
-    # Level up sound
-    level_up_sound = pygame.mixer.Sound(os.path.join(sounds_dir, "level_up.mp3"))
-    # Projectile launch sound
-    projectile_sound = pygame.mixer.Sound(os.path.join(sounds_dir, "projectile.mp3"))
-    
-    # Background music
-    background_music_path = os.path.join(sounds_dir, "background_music.mp3")
-    if os.path.exists(background_music_path):
-        pygame.mixer.music.load(background_music_path)
-        pygame.mixer.music.set_volume(0.5)  # Set volume to 50%
-        pygame.mixer.music.play(-1)  # -1 means loop indefinitely
-    else:
-        print("Background music file not found. Please add it to the sounds directory.")
-except Exception as e:
-    print(f"Error loading sound files: {e}")
-    # Create silent sounds as fallback
-    fallback_game_over_sound = pygame.mixer.Sound(buffer=bytes([0]))
-    game_over_fail_sound = pygame.mixer.Sound(buffer=bytes([0]))
-    game_over_pass_sound = pygame.mixer.Sound(buffer=bytes([0]))
-    point_sound = pygame.mixer.Sound(buffer=bytes([0]))
-    level_up_sound = pygame.mixer.Sound(buffer=bytes([0]))
-    projectile_sound = pygame.mixer.Sound(buffer=bytes([0]))
-
-# Game variables
-player_pos = [SCREEN_WIDTH // 4, SCREEN_HEIGHT // 4]  # Start player away from center
-player_speed = 5
-game_state = STATE_START_SCREEN
-score = 0
-high_score = 0
-difficulty_level = 1
-
-# Score multiplier variables
-score_multiplier = 1
-max_multiplier = 5
-multiplier_timer = 0
-multiplier_duration = 5.0  # 5 seconds to collect the next point
-last_point_time = 0
-
-# Highscore file
-highscore_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "highscore.json")
-
-# Projectile variables
-projectiles = []
-projectile_speed = 4
-last_projectile_time = time.time()
-base_projectile_interval = 1.0  # Base interval (1 projectile per second)
-projectile_interval = base_projectile_interval  # Current interval
-max_angle_deviation = 60  # Maximum angle deviation in degrees (±60° = 120° total range)
-
-# Point object variables
-point_pos = [0, 0]
-min_distance_from_center = 150  # Minimum distance from center
-
-# Particle system variables
-particle_colors = {
-    1: WHITE,      # 1x multiplier
-    2: GREEN,      # 2x multiplier
-    3: BLUE,       # 3x multiplier
-    4: ORANGE,     # 4x multiplier
-    5: PURPLE      # 5x multiplier
-}
-particles = []
-max_particles = 40  # Maximum number of particles to display at once
-
-# Sprite classes
-class ScorePopup:
-    def __init__(self, x, y, value, color):
-        self.x = x
-        self.y = y
-        self.value = value
-        self.color = color
-        self.creation_time = time.time()
-        self.lifetime = 1.5  # Lifetime in seconds
-        self.alpha = 255     # Start fully opaque
-        self.scale = 1.0     # Start at normal size
-        self.y_offset = 0    # For upward movement
-    
-    def update(self):
-        # Calculate elapsed time
-        elapsed = time.time() - self.creation_time
-        remaining_life = max(0, 1 - (elapsed / self.lifetime))
-        
-        # Update alpha (fade out)
-        self.alpha = int(255 * remaining_life)
-        
-        # Update scale (grow slightly then shrink)
-        if elapsed < 0.3:
-            # Grow to 1.5x in the first 0.3 seconds
-            self.scale = 1.0 + (0.5 * (elapsed / 0.3))
-        else:
-            # Shrink back to 1.0x over the remaining time
-            self.scale = 1.5 - (0.5 * ((elapsed - 0.3) / (self.lifetime - 0.3)))
-        
-        # Move upward
-        self.y_offset = -40 * (elapsed / self.lifetime)
-        
-        # Return True if still alive
-        return elapsed < self.lifetime
-    
-    def draw(self, surface):
-        # Create a font with the current scale
-        base_size = 28
-        font = pygame.font.SysFont(None, int(base_size * self.scale))
-        
-        # Render the text with the current alpha
-        text = f"+{self.value}"
-        text_surface = font.render(text, True, self.color)
-        
-        # Create a surface with per-pixel alpha
-        alpha_surface = pygame.Surface(text_surface.get_size(), pygame.SRCALPHA)
-        
-        # Fill with transparent color
-        alpha_surface.fill((0, 0, 0, 0))
-        
-        # Blit the text onto the alpha surface with the current alpha
-        alpha_surface.blit(text_surface, (0, 0))
-        alpha_surface.set_alpha(self.alpha)
-        
-        # Calculate position with offset
-        pos_x = self.x - alpha_surface.get_width() // 2
-        pos_y = self.y - alpha_surface.get_height() // 2 + self.y_offset
-        
-        # Draw to the main surface
-        surface.blit(alpha_surface, (pos_x, pos_y))
-
-class Particle:
-    def __init__(self, x, y, color):
-        self.x = x
-        self.y = y
-        self.size = random.randint(1, 3)
-        self.color = color
-        self.speed_x = random.uniform(-1, 1)
-        self.speed_y = random.uniform(-1, 1)
-        self.lifetime = random.uniform(0.5, 1.5)  # Lifetime in seconds
-        self.creation_time = time.time()
-        self.alpha = 255  # Start fully opaque
-    
-    def update(self):
-        # Update position
-        self.x += self.speed_x
-        self.y += self.speed_y
-        
-        # Calculate remaining lifetime as a percentage
-        elapsed = time.time() - self.creation_time
-        remaining_life = max(0, 1 - (elapsed / self.lifetime))
-        
-        # Fade out as lifetime decreases
-        self.alpha = int(255 * remaining_life)
-        
-        # Return True if particle is still alive
-        return elapsed < self.lifetime
-    
-    def draw(self, surface):
-        # Create a surface with per-pixel alpha
-        particle_surface = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        
-        # Get color with alpha
-        color_with_alpha = (*self.color, self.alpha)
-        
-        # Draw the particle
-        pygame.draw.circle(particle_surface, color_with_alpha, (self.size, self.size), self.size)
-        
-        # Blit to the main surface
-        surface.blit(particle_surface, (int(self.x - self.size), int(self.y - self.size)))
-
-class Player(pygame.sprite.Sprite):
-    def __init__(self, x, y):
-        super().__init__()
-        self.image = player_image
-        self.rect = self.image.get_rect()
-        self.rect.topleft = (x, y)
-        self.last_particle_time = 0
-        self.particle_interval = 0.05  # Time between particle spawns in seconds
-    
-    def update(self, x, y):
-        self.rect.topleft = (x, y)
-        
-        # Generate particles based on multiplier
-        if score_multiplier > 1:
-            current_time = time.time()
-            if current_time - self.last_particle_time >= self.particle_interval:
-                self.generate_particles()
-                self.last_particle_time = current_time
-    
-    def generate_particles(self):
-        """Generate particles around the player based on current multiplier"""
-        global particles
-        
-        # Get color based on multiplier
-        color = particle_colors.get(score_multiplier, WHITE)
-        
-        # Number of particles to generate increases with multiplier
-        num_particles = score_multiplier
-        
-        # Generate particles around the player
-        for _ in range(num_particles):
-            # Calculate random position around the player
-            offset_x = random.randint(-10, 10) + self.rect.width // 2
-            offset_y = random.randint(-10, 10) + self.rect.height // 2
-            
-            # Create new particle
-            new_particle = Particle(
-                self.rect.left + offset_x,
-                self.rect.top + offset_y,
-                color
-            )
-            
-            # Add to particles list, maintaining maximum count
-            particles.append(new_particle)
-            if len(particles) > max_particles:
-                particles.pop(0)  # Remove oldest particle
-    
-class Generator(pygame.sprite.Sprite):
-    def __init__(self):
-        super().__init__()
-        self.image = generator_image
-        self.rect = self.image.get_rect()
-        self.rect.center = (CENTER_X, CENTER_Y)
-
-class Projectile(pygame.sprite.Sprite):
-    def __init__(self, target_x, target_y):
-        super().__init__()
-        
-        # Determine which projectile image to use based on current difficulty level
-        self.image = self.get_projectile_image_for_level(difficulty_level)
-        self.rect = self.image.get_rect()
-        self.rect.center = (CENTER_X, CENTER_Y)
-        self.x = CENTER_X
-        self.y = CENTER_Y
-        
-        # Calculate direction vector toward player
-        dx = target_x - self.x
-        dy = target_y - self.y
-        
-        # Calculate the angle to the player
-        base_angle = math.atan2(dy, dx)
-        
-        # Add random deviation within ±max_angle_deviation degrees
-        angle_deviation = math.radians(random.uniform(-max_angle_deviation, max_angle_deviation))
-        final_angle = base_angle + angle_deviation
-        
-        # Calculate new direction vector with the randomized angle
-        self.dx = math.cos(final_angle) * projectile_speed
-        self.dy = math.sin(final_angle) * projectile_speed
-    
-    def get_projectile_image_for_level(self, level):
-        """Get the appropriate projectile image based on the current difficulty level"""
-        # Convert level to grade
-        percentage = (score / 200) * 100
-        
-        if percentage >= 95.2:
-            grade = "1.00"
-        elif percentage >= 90.8:
-            grade = "1.25"
-        elif percentage >= 86.4:
-            grade = "1.50"
-        elif percentage >= 82:
-            grade = "1.75"
-        elif percentage >= 77.6:
-            grade = "2.00"
-        elif percentage >= 73.2:
-            grade = "2.25"
-        elif percentage >= 68.8:
-            grade = "2.50"
-        elif percentage >= 64.4:
-            grade = "2.75"
-        elif percentage >= 60:
-            grade = "3.00"
-        elif percentage >= 55:
-            grade = "4.00"
-        else:
-            grade = "5.00"
-        
-        # Return the appropriate image if it exists, otherwise use default
-        if grade in projectile_images:
-            return projectile_images[grade]
-        return default_projectile_image
-    
-    def update(self):
-        self.x += self.dx
-        self.y += self.dy
-        self.rect.center = (self.x, self.y)
-        
-        # Check if projectile is out of bounds
-        if (self.x < -projectile_size or self.x > SCREEN_WIDTH + projectile_size or
-            self.y < -projectile_size or self.y > SCREEN_HEIGHT + projectile_size):
-            return False  # Remove this projectile
-        return True
-    
-    def check_collision(self, player_rect):
-        # Use pygame's built-in collision detection
-        return self.rect.colliderect(player_rect)
-
-class Point(pygame.sprite.Sprite):
-    def __init__(self, x, y):
-        super().__init__()
-        self.image = point_image
-        self.rect = self.image.get_rect()
-        self.rect.center = (x, y)
-    
-    def update(self, x, y):
-        self.rect.center = (x, y)
-
-# Create sprite instances
-player = Player(player_pos[0], player_pos[1])
-generator = Generator()
-point = Point(0, 0)  # Will be positioned later
-
-# Sprite groups
-all_sprites = pygame.sprite.Group()
-projectile_sprites = pygame.sprite.Group()
-all_sprites.add(generator)
-all_sprites.add(player)
-all_sprites.add(point)
-
-def get_grade_info(score):
-    """Get grade and message based on score percentage"""
-    percentage = (score / 200) * 100
-    
-    if percentage > 100:
-        grade = "1.00"
-        message = "SUMMA-SOBRA NA SA TOTAL! WOWOWOW!"
-    elif percentage >= 95.2:
-        grade = "1.00"
-        message = "HALIMAW! SUMMA CUM LAUDE!"
-    elif percentage >= 90.8:
-        grade = "1.25"
-        message = "FLAT UNO NA UNTA AHGHHDFHFGH"
-    elif percentage >= 86.4:
-        grade = "1.50"
-        message = "Sarap! wan-poynt-payb!"
-    elif percentage >= 82:
-        grade = "1.75"
-        message = "Wow college scholar!"
-    elif percentage >= 77.6:
-        grade = "2.00"
-        message = "Dos por dos. So goods!"
-    elif percentage >= 73.2:
-        grade = "2.25"
-        message = "Hapit na flat dos!"
-    elif percentage >= 68.8:
-        grade = "2.50"
-        message = "Okay lang. Okay nato"
-    elif percentage >= 64.4:
-        grade = "2.75"
-        message = "Yes dili Tres!"
-    elif percentage >= 60:
-        grade = "3.00"
-        message = "Importante Pasar! Amen!"
-    elif percentage >= 55:
-        grade = "4.00"
-        message = "Conditional! Take Removal!"
-    else:
-        grade = "5.00"
-        message = "SINGKO! RETAKE!"
-    
-    return percentage, grade, message
-
-def load_high_score():
-    """Load high score from file"""
-    global high_score
-    try:
-        if os.path.exists(highscore_file):
-            with open(highscore_file, 'r') as f:
-                data = json.load(f)
-                high_score = data.get('high_score', 0)
-    except Exception as e:
-        print(f"Error loading high score: {e}")
-        high_score = 0
-
-def save_high_score():
-    """Save high score to file"""
-    try:
-        with open(highscore_file, 'w') as f:
-            json.dump({'high_score': high_score}, f)
-    except Exception as e:
-        print(f"Error saving high score: {e}")
-
-def generate_point_position():
-    """Generate a random position for the point object away from the center"""
-    while True:
-        x = random.randint(point_size, SCREEN_WIDTH - point_size)
-        y = random.randint(point_size + 30, SCREEN_HEIGHT - point_size)
-
-        # Check distance from center
-        dx = x - CENTER_X
-        dy = y - CENTER_Y
-        distance = math.sqrt(dx*dx + dy*dy)
-
-        if distance >= min_distance_from_center:
-            return [x, y]
-
-def update_difficulty():
-    """Update difficulty based on score"""
-    global projectile_interval, difficulty_level
-
-    new_level = (score // 5) + 1
-
-    if new_level > difficulty_level:
-        # Level up - increase difficulty
-        difficulty_level = new_level
-        projectile_interval = base_projectile_interval / (1 + (difficulty_level - 1) * 0.2)
-        level_up_sound.play()
-        return True
-
-    return False
-
-def update_multiplier():
-    """Update the score multiplier based on time since last point"""
-    global score_multiplier, multiplier_timer
-    
-    if score_multiplier > 1:
-        current_time = time.time()
-        elapsed = current_time - last_point_time
-        
-        # Calculate remaining time for multiplier
-        multiplier_timer = max(0, multiplier_duration - elapsed)
-        
-        # Reset multiplier if timer runs out
-        if multiplier_timer <= 0:
-            score_multiplier = 1
-
-def start_game():
-    """Start a new game"""
-    global player_pos, projectiles, game_state, score, last_projectile_time, point_pos
-    global difficulty_level, projectile_interval, score_multiplier, last_point_time
-    global projectile_sprites, particles, score_popups
-
-    player_pos = [SCREEN_WIDTH // 4, SCREEN_HEIGHT // 4]
-    player.update(player_pos[0], player_pos[1])
-    
-    # Clear projectiles, particles, and score popups
-    projectiles = []
-    particles = []
-    score_popups = []
-    projectile_sprites.empty()
-    
-    game_state = STATE_PLAYING
-    score = 0
-    difficulty_level = 1
-    projectile_interval = base_projectile_interval
-    last_projectile_time = time.time()
-    
-    # Generate new point position
-    point_pos = generate_point_position()
-    point.update(point_pos[0], point_pos[1])
-    
-    score_multiplier = 1
-    last_point_time = time.time()
-    
-    # Restart background music if it's not playing
-    if not pygame.mixer.music.get_busy():
-        pygame.mixer.music.play(-1)
-
-def reset_game():
-    """Reset the game state after game over"""
-    global game_state, high_score
-    
-    # Update high score if needed
-    if score > high_score:
-        high_score = score
-        save_high_score()
-    
-    # Return to start screen
-    game_state = STATE_START_SCREEN
-
-def handle_events():
-    """Handle user input events"""
-    global player_pos, game_state
-    
-    player_moved = False
-    
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            return False
-        
-        # Check for restart on game over
-        if game_state == STATE_GAME_OVER and event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_r:
-                reset_game()
-        
-        # Music controls - M key to mute/unmute
-        if event.type == pygame.KEYDOWN and event.key == pygame.K_m:
-            if pygame.mixer.music.get_volume() > 0:
-                pygame.mixer.music.set_volume(0)  # Mute
-            else:
-                pygame.mixer.music.set_volume(0.5)  # Unmute to 50%
-    
-    # Handle continuous key presses
-    keys = pygame.key.get_pressed()
-    
-    if game_state == STATE_START_SCREEN:
-        # Start the game when player moves
-        if keys[pygame.K_LEFT] or keys[pygame.K_RIGHT] or keys[pygame.K_UP] or keys[pygame.K_DOWN]:
-            start_game()
-    
-    if game_state == STATE_PLAYING:
-        if keys[pygame.K_LEFT]:
-            player_pos[0] -= player_speed
-            player_moved = True
-        if keys[pygame.K_RIGHT]:
-            player_pos[0] += player_speed
-            player_moved = True
-        if keys[pygame.K_UP]:
-            player_pos[1] -= player_speed
-            player_moved = True
-        if keys[pygame.K_DOWN]:
-            player_pos[1] += player_speed
-            player_moved = True
-        
-        # Keep player on screen
-        player_pos[0] = max(0, min(player_pos[0], SCREEN_WIDTH - player_size))
-        player_pos[1] = max(0, min(player_pos[1], SCREEN_HEIGHT - player_size))
-        
-        # Update player sprite position
-        player.update(player_pos[0], player_pos[1])
-    
-    return True
-
-def check_point_collision():
-    """Check if player has collected the point"""
-    global score, point_pos, score_multiplier, last_point_time, score_popups
-    
-    # Use sprite collision detection
-    if player.rect.colliderect(point.rect):
-        current_time = time.time()
-        
-        # Add score with multiplier (score_multiplier points per collection)
-        score += score_multiplier
-        
-        # Create a score popup at the point's position
-        popup_color = particle_colors.get(score_multiplier, WHITE)
-        score_popups.append(ScorePopup(point_pos[0], point_pos[1], score_multiplier, popup_color))
-
-        # Check if this point was collected within the multiplier time window
-        if current_time - last_point_time < multiplier_duration:
-            # Increase multiplier (up to max)
-            score_multiplier = min(score_multiplier + 1, max_multiplier)
-        else:
-            # Reset multiplier if too much time has passed
-            score_multiplier = 1
-        
-        # Update last point time
-        last_point_time = current_time
-        
-        # Generate new point
-        point_pos = generate_point_position()
-        point.update(point_pos[0], point_pos[1])
-        point_sound.play()  # Play point sound
-        
-        # Check if difficulty should increase
-        update_difficulty()
-        return True
-    
-    return False
-
-def update():
-    """Update game state"""
-    global projectiles, last_projectile_time, game_state, projectile_sprites, particles, score_popups
-    
-    if game_state != STATE_PLAYING:
-        return
-    
-    # Update multiplier timer
-    update_multiplier()
-    
-    # Update particles
-    i = 0
-    while i < len(particles):
-        if particles[i].update():
-            i += 1
-        else:
-            particles.pop(i)
-    
-    # Update score popups
-    i = 0
-    while i < len(score_popups):
-        if score_popups[i].update():
-            i += 1
-        else:
-            score_popups.pop(i)
-    
-    # Generate new projectile based on current interval
-    current_time = time.time()
-    if current_time - last_projectile_time >= projectile_interval:
-        # Create a new projectile aimed at the player's current position
-        new_projectile = Projectile(player_pos[0] + player_size/2, player_pos[1] + player_size/2)
-        projectiles.append(new_projectile)
-        projectile_sprites.add(new_projectile)
-        last_projectile_time = current_time
-        
-        # Play projectile launch sound
-        projectile_sound.play()
-
-    # Update projectiles and check for collisions
-    i = 0
-    while i < len(projectiles):
-        if projectiles[i].update():
-            # Check for collision with player
-            if projectiles[i].check_collision(player.rect):
-                game_state = STATE_GAME_OVER
-                
-                # Play appropriate game over sound based on score/grade
-                percentage = (score / 200) * 100
-                
-                # Just two sound effects - one for failing grades, one for passing grades
-                if percentage >= 60:  # 3.00 and better (passing)
-                    try:
-                        game_over_pass_sound.play()
-                    except:
-                        fallback_game_over_sound.play()
-                else:  # 4.00 and 5.00 (failing or conditional)
-                    try:
-                        game_over_fail_sound.play()
-                    except:
-                        fallback_game_over_sound.play()
-                
-                # Update high score if needed
-                global high_score
-                if score > high_score:
-                    high_score = score
-                    save_high_score()
-            i += 1
-        else:
-            # Remove projectile if it's out of bounds
-            projectile_sprites.remove(projectiles[i])
-            projectiles.pop(i)
-
-    # Check if player collected a point
-    check_point_collision()
-
-def draw_start_screen():
-    """Draw the start screen"""
-    screen.fill(BLACK)
-    
-    # Draw author
-    font_author = pygame.font.SysFont(None, 20)
-    author_text = font_author.render("Developed by: ThatDott", True, WHITE)
-    author_rect = author_text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/6 + 4))
-    
-    # Draw title
-    font_title = pygame.font.SysFont(None, 72)
-    title_text = font_title.render("THE LAST BLUEBOOK", True, WHITE)
-    title_rect = title_text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/6 - 30))
-    
-    # Draw context
-    font_context = pygame.font.SysFont(None, 28)
-    context_text = [
-        "Finals week. Last sem. 200-items exam.",
-        "Ikaw ang last bluebook para mosalba sa imong grado!.",
-        "Collect correct answers to increase your score.",
-        "Dodge the flying grades — from Singko all the way to Uno!",
-        "The longer you survive, the higher the grades that chase you.",
-        "Reach 60% or more to pass... kung dili, Singko!",
-    ]
-    
-    # Draw instructions
-    font_instructions = pygame.font.SysFont(None, 24)
-    instructions = [
-        "ARROW KEYS: Move your bluebook",
-        "Collect CORRECT ANSWERS to increase your score",
-        "Avoid flying GRADES – all can end your exam",
-        "Every 5 points, the exam gets harder!",
-        "Collect answers quickly to boost your multiplier",
-        "Press M to mute/unmute the background music"
-    ]
-    
-    # Draw player and projectile examples with labels
-    screen.blit(player_image, (SCREEN_WIDTH/2 + 98, SCREEN_HEIGHT/2 + 90))
-    screen.blit(point_image, (SCREEN_WIDTH/2 + 215, SCREEN_HEIGHT/2 + 100))
-    
-    # Use the appropriate projectile image for the example
-    example_projectile = default_projectile_image
-    if "5.00" in projectile_images:
-        example_projectile = projectile_images["5.00"]  # Start with the worst grade
-    screen.blit(example_projectile, (SCREEN_WIDTH/2 + 305, SCREEN_HEIGHT/2 + 118))
-    
-    label_font = pygame.font.SysFont(None, 20)
-    textbook_label = label_font.render("YOU", True, WHITE)
-    correct_label = label_font.render("COLLECT", True, WHITE)
-    wrong_label = label_font.render("AVOID", True, WHITE)
-    
-    screen.blit(textbook_label, (SCREEN_WIDTH/2 + 100, SCREEN_HEIGHT/2 + 150))
-    screen.blit(correct_label, (SCREEN_WIDTH/2 + 200, SCREEN_HEIGHT/2 + 150))
-    screen.blit(wrong_label, (SCREEN_WIDTH/2 + 300, SCREEN_HEIGHT/2 + 150))
-    
-    # Draw high score
-    high_score_text = font_instructions.render(f"Best Score: {high_score}", True, WHITE)
-    high_score_rect = high_score_text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT - 30))
-    
-    # Draw start instruction
-    start_text = font_instructions.render("Move to start the exam!", True, YELLOW)
-    start_rect = start_text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT - 60))
-    
-    # Render everything
-    screen.blit(author_text, author_rect)
-    screen.blit(title_text, title_rect)
-    
-    # Render context
-    for i, line in enumerate(context_text):
-        context_line = font_context.render(line, True, WHITE)
-        context_rect = context_line.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/4 + i * 30))
-        screen.blit(context_line, context_rect)
-    
-    # Render instructions
-    for i, line in enumerate(instructions):
-        instruction_text = font_instructions.render(line, True, WHITE)
-        instruction_rect = instruction_text.get_rect(left=50, top=SCREEN_HEIGHT/2 + 60 + i * 25)
-        screen.blit(instruction_text, instruction_rect)
-    
-    screen.blit(high_score_text, high_score_rect)
-    screen.blit(start_text, start_rect)
-
-def draw_multiplier_bar():
-    """Draw the multiplier timer bar and current multiplier"""
-    # Get multiplier color based on level
-    if score_multiplier == 1:
-        multiplier_color = WHITE  # Lowest multiplier (1x)
-    elif score_multiplier == 2:
-        multiplier_color = GREEN  # 2x multiplier
-    elif score_multiplier == 3:
-        multiplier_color = BLUE   # 3x multiplier
-    elif score_multiplier == 4:
-        multiplier_color = ORANGE # 4x multiplier
-    else:
-        multiplier_color = PURPLE # Highest multiplier (5x)
-    
-    # Always draw multiplier text with color based on level
-    font = pygame.font.SysFont(None, 36)
-    multiplier_text = font.render(f"{score_multiplier}x", True, multiplier_color)
-    multiplier_rect = multiplier_text.get_rect(topleft=(20, 20))
-    screen.blit(multiplier_text, multiplier_rect)
-    
-    # Draw timer bar background
-    bar_width = 150
-    bar_height = 15
-    bar_x = 60
-    bar_y = 30
-    pygame.draw.rect(screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 1)
-    
-    # Draw timer bar fill only if multiplier > 1
-    if score_multiplier > 1:
-        fill_width = int((multiplier_timer / multiplier_duration) * bar_width)
-        if fill_width > 0:
-            pygame.draw.rect(screen, multiplier_color, (bar_x, bar_y, fill_width, bar_height))
-            
-        # Add pulsing effect to the multiplier text when active
-        pulse_scale = 1.0 + 0.2 * math.sin(time.time() * 8)  # Pulsing between 0.8 and 1.2 times original size
-        pulse_font = pygame.font.SysFont(None, int(36 * pulse_scale))
-        pulse_text = pulse_font.render(f"{score_multiplier}x", True, multiplier_color)
-        pulse_rect = pulse_text.get_rect(center=multiplier_rect.center)
-        screen.blit(pulse_text, pulse_rect)
-
-def draw_game():
-    """Draw the game screen"""
-    # Clear the screen
-    screen.fill(BLACK)
-    
-    # Draw all particles
-    for particle in particles:
-        particle.draw(screen)
-
-    # Draw all sprites
-    all_sprites.draw(screen)
-    projectile_sprites.draw(screen)
-    
-    # Draw all score popups
-    for popup in score_popups:
-        popup.draw(screen)
-
-    # Get percentage only (not grade or message during gameplay)
-    percentage = (score / 200) * 100
-    
-    # Draw score, percentage, level and high score
-    font = pygame.font.SysFont(None, 36)
-    score_text = font.render(f"Score: {score} ({percentage:.1f}%)  Level: {difficulty_level}", True, WHITE)
-    score_rect = score_text.get_rect(center=(SCREEN_WIDTH/2, 30))
-    
-    high_score_text = font.render(f"High Score: {high_score}", True, WHITE)
-    high_score_rect = high_score_text.get_rect(topright=(SCREEN_WIDTH - 20, 20))
-    
-    screen.blit(score_text, score_rect)
-    screen.blit(high_score_text, high_score_rect)
-    
-    # Draw multiplier bar if active
-    draw_multiplier_bar()
-
-def draw_game_over():
-    """Draw the game over screen"""
-    # Draw the game in the background
-    draw_game()
-    
-    # Draw semi-transparent overlay
-    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 128))  # Black with alpha
-    screen.blit(overlay, (0, 0))
-    
-    # Get grade information
-    percentage, grade, message = get_grade_info(score)
-    
-    # Draw game over message
-    font_large = pygame.font.SysFont(None, 72)
-    font_small = pygame.font.SysFont(None, 36)
-    
-    game_over_text = font_large.render("GAME OVER", True, WHITE)
-    game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2 - 80))
-    
-    final_score_text = font_small.render(f"Final Score: {score} ({percentage:.1f}%)", True, WHITE)
-    final_score_rect = final_score_text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2 - 20))
-    
-    grade_text = font_small.render(f"Grade: {grade}", True, WHITE)
-    grade_rect = grade_text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2 + 10))
-    
-    message_text = font_small.render(message, True, YELLOW)
-    message_rect = message_text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2 + 40))
-    
-    # Show if high score was achieved
-    if score == high_score and score > 0:
-        new_high_text = font_small.render("NEW HIGH SCORE!", True, YELLOW)
-        new_high_rect = new_high_text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2 + 70))
-        screen.blit(new_high_text, new_high_rect)
-    
-    restart_text = font_small.render("Press 'R' to Return to Start", True, WHITE)
-    restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2 + 110))
-    
-    screen.blit(game_over_text, game_over_rect)
-    screen.blit(final_score_text, final_score_rect)
-    screen.blit(grade_text, grade_rect)
-    screen.blit(message_text, message_rect)
-    screen.blit(restart_text, restart_rect)
-
-def draw():
-    """Draw everything to the screen based on game state"""
-    if game_state == STATE_START_SCREEN:
-        draw_start_screen()
-    elif game_state == STATE_PLAYING:
-        draw_game()
-    elif game_state == STATE_GAME_OVER:
-        draw_game_over()
-    
-    # Update the display
-    pygame.display.flip()
-
-def main():
-    """Main game loop"""
-    global point_pos
-    
-    # Load high score
-    load_high_score()
-    
-    # Initialize point position
-    point_pos = generate_point_position()
-    point.update(point_pos[0], point_pos[1])
-
-    running = True
-    
-    while running:
-        # Handle events
-        running = handle_events()
-        
-        # Update game state
-        update()
-        
-        # Draw everything
-        draw()
-        
-        # Control the game speed
-        clock.tick(FPS)
-    
-    # Clean up
-    pygame.mixer.music.stop()  # Stop music before quitting
-    pygame.quit()
-    sys.exit()
-
-if __name__ == "__main__":
-    main()
-# Particle system variables
-particle_colors = {
-    1: WHITE,      # 1x multiplier
-    2: GREEN,      # 2x multiplier
-    3: BLUE,       # 3x multiplier
-    4: ORANGE,     # 4x multiplier
-    5: PURPLE      # 5x multiplier
-}
-particles = []
-max_particles = 40  # Maximum number of particles to display at once
-
-# Score popup variables
-score_popups = []
-
-# Point object variables
-point_pos = [0, 0]
-min_distance_from_center = 150  # Minimum distance from center
-class Player(pygame.sprite.Sprite):
-    def __init__(self, x, y):
-        super().__init__()
-        self.image = player_image
-        self.rect = self.image.get_rect()
-        self.rect.topleft = (x, y)
-        self.last_particle_time = 0
-        self.particle_interval = 0.05  # Time between particle spawns in seconds
-    
-    def update(self, x, y):
-        self.rect.topleft = (x, y)
-        
-        # Generate particles based on multiplier
-        if score_multiplier > 1:
-            current_time = time.time()
-            if current_time - self.last_particle_time >= self.particle_interval:
-                self.generate_particles()
-                self.last_particle_time = current_time
-    
-    def generate_particles(self):
-        """Generate particles around the player based on current multiplier"""
-        global particles
-        
-        # Get color based on multiplier
-        color = particle_colors.get(score_multiplier, WHITE)
-        
-        # Number of particles to generate increases with multiplier
-        num_particles = score_multiplier
-        
-        # Generate particles around the player
-        for _ in range(num_particles):
-            # Calculate random position around the player
-            offset_x = random.randint(-10, 10) + self.rect.width // 2
-            offset_y = random.randint(-10, 10) + self.rect.height // 2
-            
-            # Create new particle
-            new_particle = Particle(
-                self.rect.left + offset_x,
-                self.rect.top + offset_y,
-                color
-            )
-            
-            # Add to particles list, maintaining maximum count
-            particles.append(new_particle)
-            if len(particles) > max_particles:
-                particles.pop(0)  # Remove oldest particle
+import time
+process_start = time.perf_counter()  # Taken before anything else so imports are profiled too
+
+import pygame
+import sys
+import math
+import random
+import os
+import json
+import argparse
+
+from audio import AudioManager
+from input_timing import InputSampler
+from renderer import Renderer
+from stress import StressRamp
+from alloc_profiler import AllocationTracker
+from startup import StartupProfiler, AssetLoader
+from trajectory import ExpiryHeap, SpawnIndex, exit_time, radial_band
+from collision import swept_hit_time, swept_rects_hit
+from pipeline import FrameSnapshot, SnapshotBuffer, CanvasBuffer, RenderThread
+import telemetry as tm
+from quality import QualityGovernor
+from pacing import FramePacer, PACING_MODES
+from autopilot import Autopilot
+from replay import RunRecorder
+from run_history import RunHistoryRecorder
+from asset_pack import AssetPack, write_pack
+from deferred import WorkScheduler, HIGH, LOW
+from timers import TimerScheduler
+from rules import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, CENTER_X, CENTER_Y, FPS, PLAYER_SIZE, PLAYER_SPEED, PROJECTILE_SIZE,
+    POINT_SIZE, PROJECTILE_SPEED, BASE_PROJECTILE_INTERVAL, MULTIPLIER_DURATION, MAX_MULTIPLIER, GRADE_LEVELS,
+    score_percentage, grade_for_score, level_for_score, projectile_interval_for_level, next_multiplier,
+    point_position, projectile_velocity,
+)
+
+def parse_args():
+    """Parse command line options (unknown options are ignored)"""
+    parser = argparse.ArgumentParser(description="The Last Bluebook")
+    parser.add_argument("--window", default=None,
+                        help="Window size as WIDTHxHEIGHT (default: the logical 800x600)")
+    parser.add_argument("--fullscreen", action="store_true", help="Run fullscreen")
+    parser.add_argument("--display", type=int, default=0, help="Index of the display to open the window on")
+    parser.add_argument("--asset-pack", default=None,
+                        help="Use images and sounds from a pack decoded by the cabinet host instead of decoding them")
+    parser.add_argument("--build-asset-pack", default=None, metavar="PATH",
+                        help="Decode every image and sound into a pack at PATH and quit")
+    parser.add_argument("--render-scale", type=float, default=1.0,
+                        help="Resolution the canvas is scaled at, relative to the window (e.g. 0.5)")
+    parser.add_argument("--no-smooth", action="store_true",
+                        help="Use nearest-neighbour scaling instead of smoothscale")
+    parser.add_argument("--pacing", choices=list(PACING_MODES), default="balanced",
+                        help="Frame pacing: plain sleep, or sleep plus a calibrated spin-wait (more CPU, less jitter)")
+    parser.add_argument("--vsync", action="store_true",
+                        help="Ask for a vsynced display and let the flip do the final wait")
+    parser.add_argument("--pacing-report", default=None,
+                        help="Write the frame interval jitter histogram here at exit")
+    parser.add_argument("--attract", action="store_true",
+                        help="Start straight into attract mode (the autopilot plays until a key is pressed)")
+    parser.add_argument("--attract-after", type=float, default=60.0,
+                        help="Seconds on the start screen without input before attract mode starts (0 disables)")
+    parser.add_argument("--no-idle", action="store_true",
+                        help="Keep running at full frame rate on the start and game over screens")
+    parser.add_argument("--sim-hz", type=float, default=None,
+                        help="Run the simulation in fixed steps at this rate instead of once per frame (e.g. 30)")
+    parser.add_argument("--frame-budget", type=float, default=None,
+                        help="Frame time budget in ms for the adaptive quality governor (default: 1000/FPS)")
+    parser.add_argument("--fixed-quality", action="store_true",
+                        help="Keep full effects quality instead of stepping it down when frames go over budget")
+    parser.add_argument("--no-defer", action="store_true",
+                        help="Run non-critical work (high score saves, sound cues, font loading) inline instead of in frame slack")
+    parser.add_argument("--pipelined", action="store_true",
+                        help="Draw on a separate render thread from snapshots published by the simulation")
+    parser.add_argument("--telemetry", nargs="?", const="telemetry", default=None, metavar="DIR",
+                        help="Log gameplay events to rotating binary files in DIR (default: telemetry)")
+    parser.add_argument("--record-runs", nargs="?", const="runs", default=None, metavar="DIR",
+                        help="Save every run (seed and per-tick inputs) to DIR for replay verification"
+                             " (default: runs); implies fixed simulation steps")
+    parser.add_argument("--run-history", nargs="?", const="history", default=None, metavar="DIR",
+                        help="Append every finished run's statistics to a columnar archive in DIR (default: history)")
+    parser.add_argument("--stress", action="store_true",
+                        help="Bullet hell stress mode: ramp spawns up and write a scaling report")
+    parser.add_argument("--stress-report", default="stress_report.txt",
+                        help="Where the stress mode writes its report (samples go next to it as CSV)")
+    parser.add_argument("--profile-alloc", action="store_true",
+                        help="Track per-frame allocations per subsystem and write a report at exit")
+    parser.add_argument("--alloc-report", default="alloc_report.txt",
+                        help="Where the allocation profiler writes its report")
+    parser.add_argument("--alloc-budget", type=float, default=None,
+                        help="Flag subsystems allocating more than this many KB per frame on average")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Print how long each startup phase took")
+    parser.add_argument("--first-frame-marker", default=None,
+                        help="Write this file and quit as soon as the first frame is shown (launch benchmark)")
+    args, _ = parser.parse_known_args()
+    if args.pipelined and args.profile_alloc:
+        # Allocation tracing is process-wide, so sections on two threads would mix
+        parser.error("--profile-alloc can't be combined with --pipelined")
+    return args
+
+args = parse_args()
+
+startup_profiler = StartupProfiler(process_start)
+startup_profiler.record("import", time.perf_counter() - process_start)
+
+# Initialize Pygame
+with startup_profiler.phase("pygame.init"):
+    pygame.mixer.pre_init(44100, -16, 2, 512)  # Small buffer keeps effect latency low
+    pygame.init()
+    pygame.mixer.init()  # Initialize the mixer for sound effects
+
+# Game states
+STATE_START_SCREEN = 0
+STATE_PLAYING = 1
+STATE_GAME_OVER = 2
+
+# Colors
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+BLUE = (0, 0, 255)
+YELLOW = (255, 200, 0)
+PURPLE = (128, 0, 128)
+ORANGE = (255, 165, 0)
+CYAN = (0, 255, 255)
+MAGENTA = (255, 0, 255)
+
+# Use custom image icon
+def resource_path(relative_path):
+    """Get absolute path to resource, works for dev and PyInstaller"""
+    try:
+        base_path = sys._MEIPASS
+    except AttributeError:
+        base_path = os.path.abspath(".")
+    return os.path.join(base_path, relative_path)
+
+# Create the game window - the game draws to a fixed logical canvas scaled to fit the window
+with startup_profiler.phase("display"):
+    icon = pygame.image.load(resource_path("images/icon.png"))
+    pygame.display.set_icon(icon)
+    window_size = tuple(int(n) for n in args.window.lower().split("x")) if args.window else None
+    display = args.display
+    if not 0 <= display < pygame.display.get_num_displays():
+        print(f"Display {display} not found ({pygame.display.get_num_displays()} connected), using display 0")
+        display = 0
+    renderer = Renderer((SCREEN_WIDTH, SCREEN_HEIGHT), window_size, args.render_scale,
+                        smooth=not args.no_smooth, fullscreen=args.fullscreen, vsync=args.vsync,
+                        display=display)
+    screen = renderer.canvas
+    pygame.display.set_caption("The Last Bluebook")  # Optional: also set the window title
+clock = FramePacer(args.pacing, args.vsync)
+
+# Create directories if they don't exist
+sounds_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sounds")
+images_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "images")
+os.makedirs(sounds_dir, exist_ok=True)
+os.makedirs(images_dir, exist_ok=True)
+
+# Sprite sizes
+generator_size = 50
+
+# Images are filled in by load_images() on the asset loader thread
+player_image = None
+generator_image = None
+projectile_images = {}
+default_projectile_image = None
+point_image = None
+
+def load_images():
+    """Decode and resize every image (runs on the asset loader thread)"""
+    global player_image, generator_image, projectile_images, default_projectile_image, point_image
+    
+    # Load images or use defaults
+    try:
+        # Try to load player image
+        player_image_path = os.path.join(images_dir, "player.png")
+        if os.path.exists(player_image_path):
+            player_image = pygame.image.load(player_image_path)
+        else:
+            player_image = pygame.Surface((50, 50))
+            player_image.fill(RED)
+        
+        # Try to load generator image
+        generator_image_path = os.path.join(images_dir, "generator.png")
+        if os.path.exists(generator_image_path):
+            generator_image = pygame.image.load(generator_image_path)
+        else:
+            generator_image = pygame.Surface((20, 20))
+            generator_image.fill(GREEN)
+        
+        # Try to load projectile images for different grades
+        projectile_images = {}
+        
+        # Load all grade-specific projectile images if they exist
+        for grade in GRADE_LEVELS:
+            grade_image_path = os.path.join(images_dir, f"projectile_{grade}.png")
+            if os.path.exists(grade_image_path):
+                projectile_images[grade] = pygame.image.load(grade_image_path)
+        
+        # Default projectile image if no grade-specific images are found
+        projectile_image_path = os.path.join(images_dir, "projectile.png")
+        if os.path.exists(projectile_image_path):
+            default_projectile_image = pygame.image.load(projectile_image_path)
+        else:
+            default_projectile_image = pygame.Surface((30, 30), pygame.SRCALPHA)
+            pygame.draw.circle(default_projectile_image, YELLOW, (15, 15), 15)
+        
+        # Try to load point image
+        point_image_path = os.path.join(images_dir, "point.png")
+        if os.path.exists(point_image_path):
+            point_image = pygame.image.load(point_image_path)
+        else:
+            point_image = pygame.Surface((40, 40), pygame.SRCALPHA)
+            pygame.draw.circle(point_image, PURPLE, (20, 20), 20)
+            
+    except Exception as e:
+        print(f"Error loading images: {e}")
+        # Create default images if loading fails
+        player_image = pygame.Surface((50, 50))
+        player_image.fill(RED)
+        
+        generator_image = pygame.Surface((20, 20))
+        generator_image.fill(GREEN)
+        
+        default_projectile_image = pygame.Surface((30, 30), pygame.SRCALPHA)
+        pygame.draw.circle(default_projectile_image, YELLOW, (15, 15), 15)
+        
+        projectile_images = {}  # Empty dictionary for grade-specific projectiles
+        
+        point_image = pygame.Surface((40, 40), pygame.SRCALPHA)
+        pygame.draw.circle(point_image, PURPLE, (20, 20), 20)
+
+    # Resize images to match the original sizes
+    player_image = pygame.transform.scale(player_image, (0.67 * PLAYER_SIZE, PLAYER_SIZE))
+    generator_image = pygame.transform.scale(generator_image, (generator_size, generator_size))
+    
+    # Resize all projectile images
+    if projectile_images:
+        for grade in projectile_images:
+            projectile_images[grade] = pygame.transform.scale(projectile_images[grade], (PROJECTILE_SIZE*2, PROJECTILE_SIZE*2*0.4))
+    default_projectile_image = pygame.transform.scale(default_projectile_image, (PROJECTILE_SIZE*2, PROJECTILE_SIZE*2))
+    
+    point_image = pygame.transform.scale(point_image, (POINT_SIZE*2, POINT_SIZE*2))
+
+def load_images_from_pack():
+    """Use the pre-scaled images mapped from the asset pack (no decoding or copying)"""
+    global player_image, generator_image, projectile_images, default_projectile_image, point_image
+    
+    player_image = asset_pack.image("player")
+    generator_image = asset_pack.image("generator")
+    default_projectile_image = asset_pack.image("default_projectile")
+    point_image = asset_pack.image("point")
+    projectile_images = {grade: asset_pack.image(f"projectile_{grade}") for grade in GRADE_LEVELS
+                         if f"projectile_{grade}" in asset_pack.manifest["images"]}
+
+def convert_images():
+    """Convert the loaded images to the display format (must run on the main thread)"""
+    global player_image, generator_image, default_projectile_image, point_image
+    
+    # Pack images are already in the display layout - converting would copy them into this process
+    if asset_pack:
+        return
+    
+    player_image = player_image.convert()
+    generator_image = generator_image.convert_alpha()
+    for grade in projectile_images:
+        projectile_images[grade] = projectile_images[grade].convert_alpha()
+    default_projectile_image = default_projectile_image.convert_alpha()
+    point_image = point_image.convert_alpha()
+
+# Sound effects - each file is decoded once and played on its own channel pool
+audio = AudioManager(sounds_dir)
+
+def load_sounds():
+    """Decode every sound effect (runs on the asset loader thread)"""
+    # Game over sounds - just two variants, both falling back to the generic game over sound
+    audio.load("game_over_fail", "game_over_fail.mp3", "game_over", fallback="game_over.wav")  # For 5.00 and 4.00
+    audio.load("game_over_pass", "game_over_pass.mp3", "game_over", fallback="game_over.wav")  # For 3.00 and better
+    
+    # Point gain sound
+    audio.load("point", "point.mp3")
+    # Level up sound
+    audio.load("level_up", "level_up.mp3")
+    # Projectile launch sound
+    audio.load("projectile", "projectile.mp3")
+
+def load_sounds_from_pack():
+    """Use the sound effects decoded into the asset pack"""
+    if not asset_pack.mixer_matches():
+        print("Asset pack sounds don't match this mixer format, decoding them instead")
+        load_sounds()
+        return
+    for name, (sound, category) in asset_pack.effects().items():
+        audio.add(name, sound, category)
+
+def write_asset_pack(path):
+    """Write every loaded image and sound effect to an asset pack"""
+    images = {"player": player_image, "generator": generator_image,
+              "default_projectile": default_projectile_image, "point": point_image}
+    for grade, image in projectile_images.items():
+        images[f"projectile_{grade}"] = image
+    
+    # Effects sharing a decoded file share one copy of its samples
+    sound_keys = {}
+    sounds = {}
+    effects = {}
+    for name, (sound, category) in audio.effects.items():
+        if id(sound) not in sound_keys:
+            sound_keys[id(sound)] = f"sound{len(sound_keys)}"
+            sounds[sound_keys[id(sound)]] = sound.get_raw()
+        effects[name] = (sound_keys[id(sound)], category)
+    write_pack(path, images, sounds, effects)
+
+# Assets decoded once by the cabinet host and shared between its game instances
+asset_pack = None
+if args.asset_pack:
+    try:
+        asset_pack = AssetPack(args.asset_pack)
+    except (OSError, ValueError) as e:
+        print(f"Error opening asset pack, decoding assets instead: {e}")
+
+def profiled(name, function):
+    """Wrap a loading job so it is timed as a startup phase"""
+    def run():
+        with startup_profiler.phase(name):
+            function()
+    return run
+
+asset_loader = AssetLoader()
+if asset_pack:
+    asset_loader.add("images", 1, profiled("image pack", load_images_from_pack))
+    asset_loader.add("sounds", 1, profiled("sound pack", load_sounds_from_pack))
+else:
+    asset_loader.add("images", 1, profiled("image decode/scale", load_images))
+    asset_loader.add("sounds", 2, profiled("audio decode", load_sounds))
+
+# Game variables
+player_pos = [SCREEN_WIDTH // 4, SCREEN_HEIGHT // 4]  # Start player away from center
+game_state = STATE_START_SCREEN
+score = 0
+high_score = 0
+difficulty_level = 1
+
+# Score multiplier variables
+score_multiplier = 1
+last_point_time = 0
+
+# Simulation stepping - once per frame by default, or fixed steps with --sim-hz
+# Recorded runs must replay exactly, so they always use fixed steps
+sim_hz = args.sim_hz or (FPS if args.record_runs else None)
+sim_step = 1.0 / sim_hz if sim_hz else None
+tick_scale = FPS * sim_step if sim_step else 1.0  # Per-frame speeds are multiplied by this per tick
+max_ticks_per_frame = 5
+sim_accumulator = 0.0
+sim_clock = time.time()              # Time of the current simulation tick
+
+# Cadences (projectile spawns, multiplier expiry, particle trails) fire from timers advanced once per tick
+timers = TimerScheduler(sim_clock)
+spawn_timer = None
+multiplier_expiry = None
+particle_timer = None
+
+# Gameplay randomness (projectile aim, point placement) is reseeded every run so runs can be replayed
+game_rng = random.Random()
+run_seed = 0
+run_recorder = RunRecorder(args.record_runs)
+run_history = RunHistoryRecorder(args.run_history)
+
+# Input sampling and debug overlay
+input_sampler = InputSampler()
+
+# Attract mode - the autopilot plays demo runs while nobody is at the cabinet
+attract_mode = False
+autopilot = Autopilot((SCREEN_WIDTH, SCREEN_HEIGHT), (PLAYER_SIZE, PLAYER_SIZE), PLAYER_SPEED * FPS)
+last_input_time = time.time()
+game_over_time = 0.0
+demo_restart_delay = 3.0  # Seconds the game over screen shows between demo runs
+
+# Idle mode - the start and game over screens block on input and redraw only occasionally
+idle_enabled = not args.no_idle
+idle_redraw_ms = 250
+show_debug_overlay = False  # Toggled with F3
+
+# Time spent in each subsystem during the last frame (seconds)
+frame_timings = {"update": 0.0, "collision": 0.0, "draw": 0.0}
+
+# Bullet hell stress mode (None when playing normally)
+stress_ramp = StressRamp() if args.stress else None
+
+# Pipelined rendering - the render thread draws snapshots published by the main loop,
+# and the main loop presents what it drew
+snapshot_id = 0
+snapshot_buffer = SnapshotBuffer() if args.pipelined else None
+canvas_buffer = None
+render_thread = None  # Created once the assets are loaded
+
+# Adaptive quality - the stress mode measures the engine at full quality
+quality = QualityGovernor(args.frame_budget or 1000 / FPS, enabled=not (args.fixed_quality or args.stress))
+
+# Per-subsystem allocation profiler (does nothing unless enabled)
+alloc_tracker = AllocationTracker(args.profile_alloc, args.alloc_budget)
+
+# Gameplay event log (does nothing unless enabled)
+telemetry = tm.Telemetry(args.telemetry)
+
+# Non-critical work runs in the slack before each frame's deadline
+deferred = WorkScheduler(enabled=not args.no_defer)
+fonts = {}  # Size -> default font, loaded once
+
+# Highscore file
+highscore_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "highscore.json")
+
+# Projectile variables
+projectiles = SpawnIndex()           # Every projectile in spawn order, for finding those near the player
+projectile_expiry = ExpiryHeap()     # Projectiles keyed by the time they leave the screen
+projectile_clock = time.time()       # Time of the last simulation update, used to place projectiles
+previous_projectile_clock = projectile_clock  # Time of the update before, for swept collision
+projectile_interval = BASE_PROJECTILE_INTERVAL  # Current interval
+
+# Point object variables
+point_pos = [0, 0]
+
+# Particle system variables
+particle_colors = {
+    1: WHITE,      # 1x multiplier
+    2: GREEN,      # 2x multiplier
+    3: BLUE,       # 3x multiplier
+    4: ORANGE,     # 4x multiplier
+    5: PURPLE      # 5x multiplier
+}
+particles = []
+max_particles = 40  # Maximum number of particles to display at once
+
+# Score popup variables
+score_popups = []
+
+# Sprite classes
+class ScorePopup:
+    def __init__(self, x, y, value, color):
+        self.x = x
+        self.y = y
+        self.value = value
+        self.color = color
+        self.creation_time = timers.now
+        self.lifetime = 1.5  # Lifetime in seconds
+        self.alpha = 255     # Start fully opaque
+        self.scale = 1.0     # Start at normal size
+        self.y_offset = 0    # For upward movement
+    
+    def update(self):
+        # Calculate elapsed time
+        elapsed = timers.now - self.creation_time
+        remaining_life = max(0, 1 - (elapsed / self.lifetime))
+        
+        # Update alpha (fade out)
+        self.alpha = int(255 * remaining_life)
+        
+        # At reduced quality popups only fade
+        if not quality.settings.popup_animation:
+            self.scale = 1.0
+            self.y_offset = 0
+            return elapsed < self.lifetime
+        
+        # Update scale (grow slightly then shrink)
+        if elapsed < 0.3:
+            # Grow to 1.5x in the first 0.3 seconds
+            self.scale = 1.0 + (0.5 * (elapsed / 0.3))
+        else:
+            # Shrink back to 1.0x over the remaining time
+            self.scale = 1.5 - (0.5 * ((elapsed - 0.3) / (self.lifetime - 0.3)))
+        
+        # Move upward
+        self.y_offset = -40 * (elapsed / self.lifetime)
+        
+        # Return True if still alive
+        return elapsed < self.lifetime
+    
+    def snapshot(self):
+        """Get what is needed to draw the popup"""
+        return (self.x, self.y, self.value, self.color, self.alpha, self.scale, self.y_offset)
+
+def get_font(size):
+    """Get the default font at a size, loading it on first use"""
+    font = fonts.get(size)
+    if font is None:
+        font = fonts[size] = pygame.font.SysFont(None, size)
+    return font
+
+def warm_fonts(immediately=False):
+    """Load every font size the game draws with, so none loads mid-frame
+    
+    The fonts are queued as deferred work unless immediately is set. Pipelined mode loads them
+    before the render thread starts, since SDL_ttf can't be used from two threads at once.
+    """
+    sizes = {20, 24, 32, 72}
+    # Score popups grow from 28 to 1.5x (42) and the multiplier text (36) pulses between 0.8x and 1.2x (28 to 43)
+    sizes.update(range(28, 44))
+    for size in sorted(sizes):
+        if size in fonts:
+            continue
+        if immediately:
+            get_font(size)
+        else:
+            deferred.submit("load font", get_font, size, priority=LOW, max_delay=5.0, key=("font", size))
+
+def draw_score_popup(surface, x, y, value, color, alpha, scale, y_offset):
+    """Draw a score popup from its snapshot"""
+    # Create a font with the current scale
+    base_size = 28
+    font = get_font(int(base_size * scale))
+    
+    # Render the text with the current alpha
+    text = f"+{value}"
+    text_surface = font.render(text, True, color)
+    
+    # Create a surface with per-pixel alpha
+    alpha_surface = pygame.Surface(text_surface.get_size(), pygame.SRCALPHA)
+    
+    # Fill with transparent color
+    alpha_surface.fill((0, 0, 0, 0))
+    
+    # Blit the text onto the alpha surface with the current alpha
+    alpha_surface.blit(text_surface, (0, 0))
+    alpha_surface.set_alpha(alpha)
+    
+    # Calculate position with offset
+    pos_x = x - alpha_surface.get_width() // 2
+    pos_y = y - alpha_surface.get_height() // 2 + y_offset
+    
+    # Draw to the main surface
+    surface.blit(alpha_surface, (pos_x, pos_y))
+
+class Particle:
+    def __init__(self, x, y, color):
+        self.x = x
+        self.y = y
+        self.size = random.randint(1, 3)
+        self.color = color
+        self.speed_x = random.uniform(-1, 1)
+        self.speed_y = random.uniform(-1, 1)
+        self.lifetime = random.uniform(0.5, 1.5)  # Lifetime in seconds
+        self.creation_time = timers.now
+        self.alpha = 255  # Start fully opaque
+    
+    def update(self):
+        # Update position
+        self.x += self.speed_x * tick_scale
+        self.y += self.speed_y * tick_scale
+        
+        # Calculate remaining lifetime as a percentage
+        elapsed = timers.now - self.creation_time
+        remaining_life = max(0, 1 - (elapsed / self.lifetime))
+        
+        # Fade out as lifetime decreases
+        self.alpha = int(255 * remaining_life)
+        
+        # Return True if particle is still alive
+        return elapsed < self.lifetime
+    
+    def snapshot(self):
+        """Get what is needed to draw the particle"""
+        return (self.x, self.y, self.size, self.color, self.alpha)
+
+def draw_particle(surface, x, y, size, color, alpha):
+    """Draw a particle from its snapshot"""
+    # Create a surface with per-pixel alpha
+    particle_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+    
+    # Get color with alpha
+    color_with_alpha = (*color, alpha)
+    
+    # Draw the particle
+    pygame.draw.circle(particle_surface, color_with_alpha, (size, size), size)
+    
+    # Blit to the main surface
+    surface.blit(particle_surface, (int(x - size), int(y - size)))
+
+class Player(pygame.sprite.Sprite):
+    def __init__(self, x, y):
+        super().__init__()
+        self.image = player_image
+        self.rect = self.image.get_rect()
+        self.rect.topleft = (x, y)
+    
+    def update(self, x, y):
+        self.rect.topleft = (x, y)
+    
+    def emit_particles(self):
+        """Particle timer callback - leave a trail while a multiplier is active"""
+        if score_multiplier > 1:
+            with alloc_tracker.section("particles"):
+                self.generate_particles()
+    
+    def generate_particles(self):
+        """Generate particles around the player based on current multiplier"""
+        global particles
+        
+        # Get color based on multiplier
+        color = particle_colors.get(score_multiplier, WHITE)
+        
+        # Number of particles to generate increases with multiplier
+        num_particles = score_multiplier
+        
+        # Generate particles around the player
+        for _ in range(num_particles):
+            # Calculate random position around the player
+            offset_x = random.randint(-10, 10) + self.rect.width // 2
+            offset_y = random.randint(-10, 10) + self.rect.height // 2
+            
+            # Create new particle
+            new_particle = Particle(
+                self.rect.left + offset_x,
+                self.rect.top + offset_y,
+                color
+            )
+            
+            # Add to particles list, maintaining maximum count
+            particles.append(new_particle)
+            if len(particles) > max_particles:
+                particles.pop(0)  # Remove oldest particle
+    
+class Generator(pygame.sprite.Sprite):
+    def __init__(self):
+        super().__init__()
+        self.image = generator_image
+        self.rect = self.image.get_rect()
+        self.rect.center = (CENTER_X, CENTER_Y)
+    
+    def fire(self, target_x, target_y, spawn_time, count=1):
+        """Launch projectiles aimed (with random deviation) at the target"""
+        return [Projectile(target_x, target_y, spawn_time) for _ in range(count)]
+
+class Projectile(pygame.sprite.Sprite):
+    def __init__(self, target_x, target_y, spawn_time):
+        super().__init__()
+        
+        # Determine which projectile image to use based on current difficulty level
+        self.image = self.get_projectile_image_for_level(difficulty_level)
+        self.rect = self.image.get_rect()
+        self.rect.center = (CENTER_X, CENTER_Y)
+        self.x = CENTER_X
+        self.y = CENTER_Y
+        self.spawn_time = spawn_time
+        self.in_flight = True  # Not Sprite.alive(), which only tracks group membership
+        
+        # Velocity (pixels per second) toward the player, with a random deviation
+        self.dx, self.dy = projectile_velocity(game_rng, target_x, target_y)
+        
+        # The projectile leaves the screen (plus a margin) at a time known up front
+        self.exit_time = exit_time(spawn_time, self.x, self.y, self.dx, self.dy,
+                                   -PROJECTILE_SIZE, -PROJECTILE_SIZE,
+                                   SCREEN_WIDTH + PROJECTILE_SIZE, SCREEN_HEIGHT + PROJECTILE_SIZE)
+    
+    def get_projectile_image_for_level(self, level):
+        """Get the appropriate projectile image based on the current difficulty level"""
+        # Convert level to grade
+        grade = grade_for_score(score)
+        
+        self.grade = grade
+        
+        # Return the appropriate image if it exists, otherwise use default
+        if grade in projectile_images:
+            return projectile_images[grade]
+        return default_projectile_image
+    
+    def position(self, t):
+        """Get the center of the projectile at time t"""
+        elapsed = t - self.spawn_time
+        return self.x + self.dx * elapsed, self.y + self.dy * elapsed
+    
+    def move_to(self, t):
+        """Place the sprite where the projectile is at time t"""
+        self.rect.center = self.position(t)
+    
+    def check_collision(self, previous_player_rect, player_rect, start_time, end_time):
+        """Check whether the projectile touched the player at any point between two updates"""
+        # Projectiles spawned during the step start at their spawn time
+        start_time = max(start_time, self.spawn_time)
+        start_x, start_y = self.position(start_time)
+        end_x, end_y = self.position(end_time)
+        width, height = self.rect.size
+        return swept_hit_time(
+            start_x - width / 2, start_y - height / 2, width, height, end_x - start_x, end_y - start_y,
+            previous_player_rect.x, previous_player_rect.y, previous_player_rect.width, previous_player_rect.height,
+            player_rect.x - previous_player_rect.x, player_rect.y - previous_player_rect.y,
+        ) is not None
+
+class Point(pygame.sprite.Sprite):
+    def __init__(self, x, y):
+        super().__init__()
+        self.image = point_image
+        self.rect = self.image.get_rect()
+        self.rect.center = (x, y)
+    
+    def update(self, x, y):
+        self.rect.center = (x, y)
+
+# Sprite instances and groups are created once the images are loaded
+player = None
+previous_player_rect = None
+generator = None
+point = None
+all_sprites = pygame.sprite.Group()
+projectile_sprites = pygame.sprite.Group()
+
+def create_sprites():
+    """Create the sprite instances and groups"""
+    global player, generator, point, previous_player_rect
+    
+    player = Player(player_pos[0], player_pos[1])
+    generator = Generator()
+    point = Point(0, 0)  # Will be positioned later
+    previous_player_rect = player.rect.copy()
+    autopilot.player_width, autopilot.player_height = player.rect.size
+    
+    all_sprites.add(generator)
+    all_sprites.add(player)
+    all_sprites.add(point)
+
+grade_messages = {
+    "1.00": "HALIMAW! SUMMA CUM LAUDE!",
+    "1.25": "FLAT UNO NA UNTA AHGHHDFHFGH",
+    "1.50": "Sarap! wan-poynt-payb!",
+    "1.75": "Wow college scholar!",
+    "2.00": "Dos por dos. So goods!",
+    "2.25": "Hapit na flat dos!",
+    "2.50": "Okay lang. Okay nato",
+    "2.75": "Yes dili Tres!",
+    "3.00": "Importante Pasar! Amen!",
+    "4.00": "Conditional! Take Removal!",
+    "5.00": "SINGKO! RETAKE!",
+}
+
+def get_grade_info(score):
+    """Get grade and message based on score percentage"""
+    percentage = score_percentage(score)
+    grade = grade_for_score(score)
+    
+    if percentage > 100:
+        message = "SUMMA-SOBRA NA SA TOTAL! WOWOWOW!"
+    else:
+        message = grade_messages[grade]
+    
+    return percentage, grade, message
+
+def load_high_score():
+    """Load high score from file"""
+    global high_score
+    try:
+        if os.path.exists(highscore_file):
+            with open(highscore_file, 'r') as f:
+                data = json.load(f)
+                high_score = data.get('high_score', 0)
+    except Exception as e:
+        print(f"Error loading high score: {e}")
+        high_score = 0
+
+def save_high_score():
+    """Save high score to file"""
+    try:
+        with open(highscore_file, 'w') as f:
+            json.dump({'high_score': high_score}, f)
+    except Exception as e:
+        print(f"Error saving high score: {e}")
+
+def generate_point_position():
+    """Generate a random position for the point object away from the center"""
+    return point_position(game_rng)
+
+def update_difficulty():
+    """Update difficulty based on score"""
+    global projectile_interval, difficulty_level
+
+    new_level = level_for_score(score)
+
+    if new_level > difficulty_level:
+        # Level up - increase difficulty
+        difficulty_level = new_level
+        projectile_interval = projectile_interval_for_level(difficulty_level)
+        telemetry.record(sim_clock, tm.LEVEL_UP, level=difficulty_level, a=projectile_interval)
+        if not stress_ramp:
+            timers.set_delay(spawn_timer, projectile_interval)
+        run_history.level_up(difficulty_level, sim_clock)
+        deferred.submit("level up sound", audio.play, "level_up", priority=HIGH, max_delay=0.05)
+        return True
+
+    return False
+
+def apply_quality(settings):
+    """Apply a quality level chosen by the governor"""
+    global max_particles
+    
+    max_particles = settings.max_particles
+    if len(particles) > max_particles:
+        del particles[:len(particles) - max_particles]  # Drop the oldest
+    if particle_timer:
+        timers.set_delay(particle_timer, settings.particle_interval)
+    renderer.set_render_scale(args.render_scale * settings.render_scale)
+
+quality.on_change = apply_quality
+
+def expire_multiplier():
+    """Multiplier timer callback - no point was collected in time"""
+    global score_multiplier
+    
+    if score_multiplier > 1:
+        telemetry.record(sim_clock, tm.MULTIPLIER_RESET, level=difficulty_level, a=score_multiplier, b=0)
+        score_multiplier = 1
+        run_history.multiplier_changed(score_multiplier, sim_clock)
+
+def start_game():
+    """Start a new game"""
+    global player_pos, game_state, score, point_pos, projectile_clock
+    global previous_projectile_clock, previous_player_rect, sim_clock, sim_accumulator
+    global difficulty_level, projectile_interval, score_multiplier, last_point_time
+    global projectile_sprites, particles, score_popups, run_seed
+    global spawn_timer, multiplier_expiry, particle_timer
+
+    player_pos = [SCREEN_WIDTH // 4, SCREEN_HEIGHT // 4]
+    player.update(player_pos[0], player_pos[1])
+    previous_player_rect = player.rect.copy()
+    
+    # Clear projectiles, particles, and score popups
+    projectiles.clear()
+    projectile_expiry.clear()
+    particles = []
+    score_popups = []
+    projectile_sprites.empty()
+    
+    run_seed = random.getrandbits(64)
+    game_rng.seed(run_seed)
+    
+    game_state = STATE_PLAYING
+    score = 0
+    difficulty_level = 1
+    projectile_interval = BASE_PROJECTILE_INTERVAL
+    sim_clock = time.time()
+    sim_accumulator = 0.0
+    projectile_clock = sim_clock
+    previous_projectile_clock = sim_clock
+    
+    # Start this run's timers
+    timers.reset(sim_clock)
+    spawn_timer = timers.every(stress_ramp.spawn_interval if stress_ramp else projectile_interval, spawn_projectiles)
+    particle_timer = timers.every(quality.settings.particle_interval, player.emit_particles)
+    multiplier_expiry = timers.timer(MULTIPLIER_DURATION, expire_multiplier)  # Started by each point collected
+    
+    # Generate new point position
+    point_pos = generate_point_position()
+    point.update(point_pos[0], point_pos[1])
+    
+    score_multiplier = 1
+    last_point_time = sim_clock
+    telemetry.start_run(sim_clock)
+    
+    # Demo and stress runs are never submitted
+    if not (attract_mode or stress_ramp):
+        run_recorder.start(run_seed, sim_clock, sim_hz)
+        run_history.start(sim_clock)
+    
+    # Restart background music if it's not playing
+    audio.play_music()
+
+def reset_game():
+    """Reset the game state after game over"""
+    global game_state, high_score
+    
+    # Update high score if needed
+    if score > high_score:
+        high_score = score
+        deferred.submit("save high score", save_high_score, max_delay=1.0, key="save high score")
+    
+    # Return to start screen
+    game_state = STATE_START_SCREEN
+
+def start_attract():
+    """Let the autopilot play a demo run"""
+    global attract_mode
+    
+    attract_mode = True
+    telemetry.paused = True
+    start_game()
+
+def stop_attract():
+    """Hand the cabinet back to a player - demo runs never count for the high score"""
+    global attract_mode, game_state, last_input_time
+    
+    attract_mode = False
+    telemetry.paused = False
+    game_state = STATE_START_SCREEN
+    last_input_time = time.time()
+
+def autopilot_threats():
+    """Get the projectiles that can reach the player within the autopilot's horizon"""
+    horizon = autopilot.horizon()
+    speed = PROJECTILE_SPEED * FPS
+    near, far = radial_band(player.rect, CENTER_X, CENTER_Y, PROJECTILE_SIZE + PLAYER_SPEED * FPS * horizon)
+    return [(p.x, p.y, p.dx, p.dy, sim_clock - p.spawn_time, p.rect.width, p.rect.height)
+            for p in projectiles.spawned_between(sim_clock - far / speed, sim_clock + horizon - near / speed)]
+
+def handle_events():
+    """Handle user input events"""
+    global game_state, show_debug_overlay, last_input_time
+    
+    for event in input_sampler.poll_events():
+        if event.type == pygame.QUIT:
+            return False
+        
+        if event.type == pygame.VIDEORESIZE:
+            renderer.handle_resize()
+        
+        if event.type == pygame.KEYDOWN:
+            last_input_time = time.time()
+            
+            # Any key ends the demo
+            if attract_mode:
+                stop_attract()
+                continue
+        
+        # Check for restart on game over
+        if game_state == STATE_GAME_OVER and event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_r:
+                reset_game()
+        
+        # Music controls - M key to mute/unmute
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_m:
+            audio.toggle_music_mute()
+        
+        # F3 shows input latency and other debug information
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            show_debug_overlay = not show_debug_overlay
+    
+    # Handle continuous key presses, sampled right before the update step
+    keys = input_sampler.sample()
+    
+    if attract_mode:
+        if game_state == STATE_PLAYING:
+            autopilot.decide(player_pos[0], player_pos[1], point_pos[0], point_pos[1], autopilot_threats())
+        elif time.time() - game_over_time >= demo_restart_delay:
+            start_game()
+        return True
+    
+    if game_state == STATE_START_SCREEN:
+        # Start the game when player moves
+        if keys[pygame.K_LEFT] or keys[pygame.K_RIGHT] or keys[pygame.K_UP] or keys[pygame.K_DOWN]:
+            last_input_time = time.time()
+            start_game()
+        elif args.attract_after and time.time() - last_input_time >= args.attract_after:
+            start_attract()
+    
+    return True
+
+def move_player(keys):
+    """Move the player for one simulation tick from the sampled key state"""
+    global previous_player_rect
+    
+    player_moved = False
+    step = PLAYER_SPEED * tick_scale
+    
+    # Remember where the player was, for swept collision
+    previous_player_rect = player.rect.copy()
+    
+    if keys[pygame.K_LEFT]:
+        player_pos[0] -= step
+        player_moved = True
+    if keys[pygame.K_RIGHT]:
+        player_pos[0] += step
+        player_moved = True
+    if keys[pygame.K_UP]:
+        player_pos[1] -= step
+        player_moved = True
+    if keys[pygame.K_DOWN]:
+        player_pos[1] += step
+        player_moved = True
+    
+    # Keep player on screen
+    player_pos[0] = max(0, min(player_pos[0], SCREEN_WIDTH - PLAYER_SIZE))
+    player_pos[1] = max(0, min(player_pos[1], SCREEN_HEIGHT - PLAYER_SIZE))
+    
+    # Update player sprite position
+    player.update(player_pos[0], player_pos[1])
+    
+    return player_moved
+
+def step_simulation():
+    """Run one simulation tick"""
+    global sim_clock
+    
+    sim_clock = time.time() if sim_step is None else sim_clock + sim_step
+    if game_state == STATE_PLAYING:
+        keys = autopilot.keys if attract_mode else input_sampler.keys
+        run_recorder.record_tick(keys[pygame.K_LEFT], keys[pygame.K_RIGHT], keys[pygame.K_UP], keys[pygame.K_DOWN])
+        move_player(keys)
+    update()
+    
+    # The run is over - save it with the result it claims
+    if run_recorder.recording and game_state == STATE_GAME_OVER:
+        _, grade, _ = get_grade_info(score)
+        run_recorder.finish(score, grade, difficulty_level)
+
+def run_simulation(frame_seconds):
+    """Advance the simulation - one tick per frame, or fixed steps when --sim-hz is set"""
+    global sim_accumulator
+    
+    if sim_step is None:
+        step_simulation()
+        return
+    
+    # Don't try to catch up on more than a few ticks after a stall
+    sim_accumulator = min(sim_accumulator + frame_seconds, sim_step * max_ticks_per_frame)
+    while sim_accumulator >= sim_step:
+        step_simulation()
+        sim_accumulator -= sim_step
+
+def check_point_collision():
+    """Check if player has collected the point"""
+    global score, point_pos, score_multiplier, last_point_time, score_popups
+    
+    # Swept collision over the player's movement this tick
+    if swept_rects_hit(previous_player_rect, player.rect, point.rect, point.rect):
+        current_time = sim_clock
+        
+        # Add score with multiplier (score_multiplier points per collection)
+        score += score_multiplier
+        telemetry.record(sim_clock, tm.PICKUP, level=difficulty_level, a=score_multiplier, b=score)
+        
+        # Create a score popup at the point's position
+        popup_color = particle_colors.get(score_multiplier, WHITE)
+        score_popups.append(ScorePopup(point_pos[0], point_pos[1], score_multiplier, popup_color))
+
+        # Increase the multiplier if this point was collected within its time window, otherwise reset it
+        multiplier = next_multiplier(score_multiplier, current_time - last_point_time)
+        if multiplier == 1 and score_multiplier > 1:
+            telemetry.record(sim_clock, tm.MULTIPLIER_RESET, level=difficulty_level, a=score_multiplier, b=1)
+        score_multiplier = multiplier
+        run_history.multiplier_changed(score_multiplier, current_time)
+        
+        # Update last point time and give the multiplier another full window
+        last_point_time = current_time
+        timers.restart(multiplier_expiry)
+        
+        # Generate new point
+        point_pos = generate_point_position()
+        point.update(point_pos[0], point_pos[1])
+        audio.play("point")  # Play point sound
+        
+        # Check if difficulty should increase
+        update_difficulty()
+        return True
+    
+    return False
+
+def update():
+    """Update game state"""
+    global game_state, particles, score_popups, projectile_clock, previous_projectile_clock
+    
+    if game_state != STATE_PLAYING:
+        return
+    
+    update_start = time.perf_counter()
+    
+    # Fire the timers that came due this tick (multiplier expiry, particle trail, projectile spawns)
+    if stress_ramp and spawn_timer.delay != stress_ramp.spawn_interval:
+        timers.set_delay(spawn_timer, stress_ramp.spawn_interval)
+    previous_projectile_clock = projectile_clock
+    projectile_clock = sim_clock
+    timers.advance(sim_clock)
+    
+    # Update particles
+    with alloc_tracker.section("particles"):
+        i = 0
+        while i < len(particles):
+            if particles[i].update():
+                i += 1
+            else:
+                particles.pop(i)
+    
+    # Update score popups
+    with alloc_tracker.section("popups"):
+        i = 0
+        while i < len(score_popups):
+            if score_popups[i].update():
+                i += 1
+            else:
+                score_popups.pop(i)
+    
+    with alloc_tracker.section("projectiles"):
+        retire_projectiles()
+    
+    collision_start = time.perf_counter()
+    frame_timings["update"] = collision_start - update_start
+
+    # Check for collisions with the player
+    with alloc_tracker.section("projectiles"):
+        check_projectile_collisions()
+
+    # Check if player collected a point
+    check_point_collision()
+    
+    frame_timings["collision"] = time.perf_counter() - collision_start
+
+def spawn_projectiles():
+    """Spawn timer callback - launch projectiles aimed at the player"""
+    # The stress mode fires bursts
+    burst = stress_ramp.burst if stress_ramp else 1
+    current_time = sim_clock
+    
+    # Create new projectiles aimed at the player's current position
+    with alloc_tracker.section("projectiles"):
+        new_projectiles = generator.fire(player_pos[0] + PLAYER_SIZE/2, player_pos[1] + PLAYER_SIZE/2,
+                                         current_time, burst)
+        for projectile in new_projectiles:
+            projectiles.append(current_time, projectile)
+            projectile_expiry.push(projectile.exit_time, projectile)
+            telemetry.record(current_time, tm.SPAWN, GRADE_LEVELS.index(projectile.grade), difficulty_level)
+        projectile_sprites.add(new_projectiles)
+    
+    # Stress the particle system along with the projectiles
+    if stress_ramp:
+        with alloc_tracker.section("particles"):
+            color = particle_colors.get(difficulty_level % MAX_MULTIPLIER + 1, WHITE)
+            particles.extend(Particle(CENTER_X, CENTER_Y, color) for _ in range(burst))
+    
+    # Play projectile launch sound
+    audio.play("projectile")
+
+def retire_projectiles():
+    """Retire projectiles that left the screen"""
+    # Remove projectiles that went out of bounds - no per-projectile work for the others
+    for projectile in projectile_expiry.pop_expired(sim_clock):
+        projectile.in_flight = False
+        projectile_sprites.remove(projectile)
+    projectiles.trim()
+
+def projectiles_near_player():
+    """Get the projectiles close enough to the player to possibly have hit it since the last update
+    
+    All projectiles start at the center at the same speed, so their distance from the center only
+    depends on their age. Those at the player's distance were spawned in a narrow time window.
+    """
+    speed = PROJECTILE_SPEED * FPS
+    near, far = radial_band(player.rect.union(previous_player_rect), CENTER_X, CENTER_Y, PROJECTILE_SIZE)
+    return projectiles.spawned_between(previous_projectile_clock - far / speed, projectile_clock - near / speed)
+
+def check_projectile_collisions():
+    """End the game if any projectile hit the player"""
+    global game_state, high_score, game_over_time
+    
+    for projectile in projectiles_near_player():
+        if projectile.check_collision(previous_player_rect, player.rect, previous_projectile_clock, projectile_clock):
+            # The player is invulnerable in the stress mode
+            if stress_ramp:
+                continue
+            
+            game_state = STATE_GAME_OVER
+            game_over_time = time.time()
+            
+            # Play appropriate game over sound based on score/grade
+            percentage = score_percentage(score)
+            telemetry.record(projectile_clock, tm.GAME_OVER, GRADE_LEVELS.index(projectile.grade),
+                             difficulty_level, score, percentage)
+            
+            # Archive the run's statistics once the frame has slack
+            _, grade, _ = get_grade_info(score)
+            row = run_history.finish(projectile_clock, score, percentage, GRADE_LEVELS.index(grade),
+                                     difficulty_level, GRADE_LEVELS.index(projectile.grade))
+            if row:
+                deferred.submit("save run history", run_history.save, row, priority=LOW, max_delay=2.0)
+            
+            # Just two sound effects - one for failing grades, one for passing grades
+            if percentage >= 60:  # 3.00 and better (passing)
+                audio.play("game_over_pass")
+            else:  # 4.00 and 5.00 (failing or conditional)
+                audio.play("game_over_fail")
+            
+            # Update high score if needed
+            if score > high_score and not attract_mode:
+                high_score = score
+                deferred.submit("save high score", save_high_score, max_delay=1.0, key="save high score")
+            break
+
+def draw_start_screen(frame):
+    """Draw the start screen"""
+    screen.fill(BLACK)
+    
+    # Draw author
+    font_author = get_font(20)
+    author_text = font_author.render("Developed by: ThatDott", True, WHITE)
+    author_rect = author_text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/6 + 4))
+    
+    # Draw title
+    font_title = get_font(72)
+    title_text = font_title.render("THE LAST BLUEBOOK", True, WHITE)
+    title_rect = title_text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/6 - 30))
+    
+    # Draw context
+    font_context = get_font(28)
+    context_text = [
+        "Finals week. Last sem. 200-items exam.",
+        "Ikaw ang last bluebook para mosalba sa imong grado!.",
+        "Collect correct answers to increase your score.",
+        "Dodge the flying grades — from Singko all the way to Uno!",
+        "The longer you survive, the higher the grades that chase you.",
+        "Reach 60% or more to pass... kung dili, Singko!",
+    ]
+    
+    # Draw instructions
+    font_instructions = get_font(24)
+    instructions = [
+        "ARROW KEYS: Move your bluebook",
+        "Collect CORRECT ANSWERS to increase your score",
+        "Avoid flying GRADES – all can end your exam",
+        "Every 5 points, the exam gets harder!",
+        "Collect answers quickly to boost your multiplier",
+        "Press M to mute/unmute the background music"
+    ]
+    
+    # Draw player and projectile examples with labels
+    screen.blit(player_image, (SCREEN_WIDTH/2 + 98, SCREEN_HEIGHT/2 + 90))
+    screen.blit(point_image, (SCREEN_WIDTH/2 + 215, SCREEN_HEIGHT/2 + 100))
+    
+    # Use the appropriate projectile image for the example
+    example_projectile = default_projectile_image
+    if "5.00" in projectile_images:
+        example_projectile = projectile_images["5.00"]  # Start with the worst grade
+    screen.blit(example_projectile, (SCREEN_WIDTH/2 + 305, SCREEN_HEIGHT/2 + 118))
+    
+    label_font = get_font(20)
+    textbook_label = label_font.render("YOU", True, WHITE)
+    correct_label = label_font.render("COLLECT", True, WHITE)
+    wrong_label = label_font.render("AVOID", True, WHITE)
+    
+    screen.blit(textbook_label, (SCREEN_WIDTH/2 + 100, SCREEN_HEIGHT/2 + 150))
+    screen.blit(correct_label, (SCREEN_WIDTH/2 + 200, SCREEN_HEIGHT/2 + 150))
+    screen.blit(wrong_label, (SCREEN_WIDTH/2 + 300, SCREEN_HEIGHT/2 + 150))
+    
+    # Draw high score
+    high_score_text = font_instructions.render(f"Best Score: {frame.high_score}", True, WHITE)
+    high_score_rect = high_score_text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT - 30))
+    
+    # Draw start instruction
+    start_text = font_instructions.render("Move to start the exam!", True, YELLOW)
+    start_rect = start_text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT - 60))
+    
+    # Render everything
+    screen.blit(author_text, author_rect)
+    screen.blit(title_text, title_rect)
+    
+    # Render context
+    for i, line in enumerate(context_text):
+        context_line = font_context.render(line, True, WHITE)
+        context_rect = context_line.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/4 + i * 30))
+        screen.blit(context_line, context_rect)
+    
+    # Render instructions
+    for i, line in enumerate(instructions):
+        instruction_text = font_instructions.render(line, True, WHITE)
+        instruction_rect = instruction_text.get_rect(left=50, top=SCREEN_HEIGHT/2 + 60 + i * 25)
+        screen.blit(instruction_text, instruction_rect)
+    
+    screen.blit(high_score_text, high_score_rect)
+    screen.blit(start_text, start_rect)
+
+def draw_multiplier_bar(frame):
+    """Draw the multiplier timer bar and current multiplier"""
+    score_multiplier = frame.multiplier
+    # Get multiplier color based on level
+    if score_multiplier == 1:
+        multiplier_color = WHITE  # Lowest multiplier (1x)
+    elif score_multiplier == 2:
+        multiplier_color = GREEN  # 2x multiplier
+    elif score_multiplier == 3:
+        multiplier_color = BLUE   # 3x multiplier
+    elif score_multiplier == 4:
+        multiplier_color = ORANGE # 4x multiplier
+    else:
+        multiplier_color = PURPLE # Highest multiplier (5x)
+    
+    # Always draw multiplier text with color based on level
+    font = get_font(36)
+    multiplier_text = font.render(f"{score_multiplier}x", True, multiplier_color)
+    multiplier_rect = multiplier_text.get_rect(topleft=(20, 20))
+    screen.blit(multiplier_text, multiplier_rect)
+    
+    # Draw timer bar background
+    bar_width = 150
+    bar_height = 15
+    bar_x = 60
+    bar_y = 30
+    pygame.draw.rect(screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 1)
+    
+    # Draw timer bar fill only if multiplier > 1
+    if score_multiplier > 1:
+        fill_width = int((frame.multiplier_timer / MULTIPLIER_DURATION) * bar_width)
+        if fill_width > 0:
+            pygame.draw.rect(screen, multiplier_color, (bar_x, bar_y, fill_width, bar_height))
+            
+        # Add pulsing effect to the multiplier text when active (skipped at reduced quality)
+        if not quality.settings.pulse:
+            return
+        pulse_scale = 1.0 + 0.2 * math.sin(frame.time * 8)  # Pulsing between 0.8 and 1.2 times original size
+        pulse_font = get_font(int(36 * pulse_scale))
+        pulse_text = pulse_font.render(f"{score_multiplier}x", True, multiplier_color)
+        pulse_rect = pulse_text.get_rect(center=multiplier_rect.center)
+        screen.blit(pulse_text, pulse_rect)
+
+def projectile_render_time():
+    """Get the time projectiles are drawn at"""
+    # With fixed simulation steps, draw where projectiles are now rather than at the last tick
+    if sim_step is not None and game_state == STATE_PLAYING:
+        return projectile_clock + sim_accumulator
+    return projectile_clock
+
+def draw_game(frame):
+    """Draw the game screen"""
+    # Clear the screen
+    screen.fill(BLACK)
+    
+    # Draw all particles
+    with alloc_tracker.section("particles"):
+        for particle in frame.particles:
+            draw_particle(screen, *particle)
+
+    # Draw all sprites
+    with alloc_tracker.section("projectiles"):
+        screen.blit(generator.image, generator.rect)
+        screen.blit(player_image, frame.player_topleft)
+        screen.blit(point_image, point_image.get_rect(center=frame.point_center))
+        screen.blits(frame.projectiles, doreturn=False)
+    
+    # Draw all score popups
+    with alloc_tracker.section("popups"):
+        for popup in frame.popups:
+            draw_score_popup(screen, *popup)
+
+    with alloc_tracker.section("hud"):
+        draw_hud(frame)
+
+def draw_hud(frame):
+    """Draw the score, level, high score and multiplier during gameplay"""
+    # Get percentage only (not grade or message during gameplay)
+    percentage = score_percentage(frame.score)
+    
+    # Draw score, percentage, level and high score
+    font = get_font(36)
+    score_text = font.render(f"Score: {frame.score} ({percentage:.1f}%)  Level: {frame.difficulty_level}", True, WHITE)
+    score_rect = score_text.get_rect(center=(SCREEN_WIDTH/2, 30))
+    
+    high_score_text = font.render(f"High Score: {frame.high_score}", True, WHITE)
+    high_score_rect = high_score_text.get_rect(topright=(SCREEN_WIDTH - 20, 20))
+    
+    screen.blit(score_text, score_rect)
+    screen.blit(high_score_text, high_score_rect)
+    
+    # Draw multiplier bar if active
+    draw_multiplier_bar(frame)
+
+def draw_game_over(frame):
+    """Draw the game over screen"""
+    # Draw the game in the background
+    draw_game(frame)
+    
+    with alloc_tracker.section("screens"):
+        draw_game_over_overlay(frame)
+
+def draw_game_over_overlay(frame):
+    """Draw the results on top of the frozen game"""
+    score = frame.score
+    
+    # Draw semi-transparent overlay
+    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+    overlay.fill((0, 0, 0, 128))  # Black with alpha
+    screen.blit(overlay, (0, 0))
+    
+    # Get grade information
+    percentage, grade, message = get_grade_info(score)
+    
+    # Draw game over message
+    font_large = get_font(72)
+    font_small = get_font(36)
+    
+    game_over_text = font_large.render("GAME OVER", True, WHITE)
+    game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2 - 80))
+    
+    final_score_text = font_small.render(f"Final Score: {score} ({percentage:.1f}%)", True, WHITE)
+    final_score_rect = final_score_text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2 - 20))
+    
+    grade_text = font_small.render(f"Grade: {grade}", True, WHITE)
+    grade_rect = grade_text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2 + 10))
+    
+    message_text = font_small.render(message, True, YELLOW)
+    message_rect = message_text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2 + 40))
+    
+    # Show if high score was achieved
+    if score == frame.high_score and score > 0:
+        new_high_text = font_small.render("NEW HIGH SCORE!", True, YELLOW)
+        new_high_rect = new_high_text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2 + 70))
+        screen.blit(new_high_text, new_high_rect)
+    
+    restart_text = font_small.render("Press 'R' to Return to Start", True, WHITE)
+    restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2 + 110))
+    
+    screen.blit(game_over_text, game_over_rect)
+    screen.blit(final_score_text, final_score_rect)
+    screen.blit(grade_text, grade_rect)
+    screen.blit(message_text, message_rect)
+    screen.blit(restart_text, restart_rect)
+
+def draw_demo_banner():
+    """Tell passers-by the game is playing itself"""
+    font = get_font(32)
+    text = font.render("DEMO - PRESS ANY KEY TO PLAY", True, YELLOW)
+    screen.blit(text, text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT - 30)))
+
+def debug_overlay_lines():
+    """Get the lines shown in the debug overlay"""
+    lines = input_sampler.overlay_lines() + renderer.overlay_lines() + clock.overlay_lines()
+    lines.append("update {update:.2f}  collision {collision:.2f}  draw {draw:.2f} ms".format(
+        **{name: value * 1000 for name, value in frame_timings.items()}))
+    if render_thread:
+        lines += render_thread.overlay_lines()
+    lines += quality.overlay_lines()
+    if attract_mode:
+        lines += autopilot.overlay_lines()
+    lines += deferred.overlay_lines() + timers.overlay_lines() + audio.overlay_lines()
+    if telemetry.enabled:
+        lines += telemetry.overlay_lines()
+    if stress_ramp:
+        lines += stress_ramp.overlay_lines()
+        lines.append(f"projectiles {len(projectile_sprites)}  particles {len(particles)}  fps {clock.get_fps():.1f}")
+    return lines
+
+def draw_debug_overlay(lines):
+    """Draw debug statistics in the bottom left corner"""
+    font = get_font(20)
+    
+    for i, line in enumerate(lines):
+        text = font.render(line, True, CYAN)
+        text_rect = text.get_rect(bottomleft=(10, SCREEN_HEIGHT - 10 - (len(lines) - 1 - i) * 18))
+        screen.blit(text, text_rect)
+
+def take_snapshot():
+    """Capture everything needed to draw the current frame"""
+    global snapshot_id
+    
+    snapshot_id += 1
+    render_time = projectile_render_time()
+    projectile_blits = []
+    for projectile in projectile_sprites:
+        projectile.move_to(render_time)
+        projectile_blits.append((projectile.image, projectile.rect.topleft))
+    
+    return FrameSnapshot(
+        frame_id=snapshot_id,
+        publish_time=time.perf_counter(),
+        game_state=game_state,
+        time=time.time(),
+        score=score,
+        high_score=high_score,
+        difficulty_level=difficulty_level,
+        multiplier=score_multiplier,
+        multiplier_timer=multiplier_expiry.remaining(sim_clock) if multiplier_expiry else 0,
+        player_topleft=player.rect.topleft,
+        point_center=point.rect.center,
+        projectiles=projectile_blits,
+        particles=[particle.snapshot() for particle in particles],
+        popups=[popup.snapshot() for popup in score_popups],
+        overlay_lines=debug_overlay_lines() if show_debug_overlay else None,
+        input_sample_time=input_sampler.sample_time,
+        key_event_start=input_sampler.event_drain_start if input_sampler.had_key_event else None,
+        demo=attract_mode,
+    )
+
+def draw_canvas(frame):
+    """Draw a snapshot to the canvas based on its game state"""
+    if frame.game_state == STATE_START_SCREEN:
+        with alloc_tracker.section("screens"):
+            draw_start_screen(frame)
+    elif frame.game_state == STATE_PLAYING:
+        draw_game(frame)
+    elif frame.game_state == STATE_GAME_OVER:
+        draw_game_over(frame)
+    
+    if frame.demo and frame.game_state != STATE_START_SCREEN:
+        with alloc_tracker.section("hud"):
+            draw_demo_banner()
+    
+    if frame.overlay_lines:
+        with alloc_tracker.section("hud"):
+            draw_debug_overlay(frame.overlay_lines)
+
+def draw_on_render_thread(frame, canvas):
+    """Draw a snapshot to one of the pipeline's canvases (only the render thread draws while it runs)"""
+    global screen
+    draw_start = time.perf_counter()
+    screen = canvas
+    draw_canvas(frame)
+    frame_timings["draw"] = time.perf_counter() - draw_start
+
+def draw_frame(frame):
+    """Draw a snapshot and show it"""
+    draw_start = time.perf_counter()
+    draw_canvas(frame)
+    
+    # Scale the canvas to the window and update the display
+    renderer.present()
+    frame_timings["draw"] = time.perf_counter() - draw_start
+    input_sampler.record_present(frame.input_sample_time, frame.key_event_start)
+
+def draw(wait_for_render=False):
+    """Draw the current frame - or hand it to the render thread in pipelined mode
+    
+    In pipelined mode the newest canvas the render thread finished is presented here, since only
+    the main thread may present; wait_for_render waits briefly for the frame just published.
+    """
+    frame = take_snapshot()
+    if not render_thread:
+        draw_frame(frame)
+        return
+    
+    snapshot_buffer.publish(frame)
+    canvas, drawn = canvas_buffer.take_ready(frame.frame_id, 0.1 if wait_for_render else 0.0)
+    if canvas is not None:
+        renderer.present(canvas)
+        input_sampler.record_present(drawn.input_sample_time, drawn.key_event_start)
+
+def draw_loading_screen(font_title, font_status):
+    """Draw the loading splash with a progress bar"""
+    screen.fill(BLACK)
+    
+    title_text = font_title.render("THE LAST BLUEBOOK", True, WHITE)
+    title_rect = title_text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2 - 40))
+    screen.blit(title_text, title_rect)
+    
+    # Draw progress bar
+    bar_width = 300
+    bar_height = 15
+    bar_x = (SCREEN_WIDTH - bar_width) // 2
+    bar_y = SCREEN_HEIGHT // 2 + 10
+    pygame.draw.rect(screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 1)
+    fill_width = int(asset_loader.progress * bar_width)
+    if fill_width > 0:
+        pygame.draw.rect(screen, YELLOW, (bar_x, bar_y, fill_width, bar_height))
+    
+    status = f"Loading {asset_loader.current}..." if asset_loader.current else "Loading..."
+    status_text = font_status.render(status, True, WHITE)
+    status_rect = status_text.get_rect(center=(SCREEN_WIDTH/2, bar_y + 40))
+    screen.blit(status_text, status_rect)
+    
+    renderer.present()
+
+def finish_loading():
+    """Set up everything that needs the loaded assets (runs on the main thread)"""
+    convert_images()
+    create_sprites()
+    
+    # Background music is streamed from disk rather than kept in memory
+    if audio.load_music(os.path.join(sounds_dir, "background_music.mp3"), volume=0.5):
+        audio.play_music()
+    else:
+        print("Background music file not found. Please add it to the sounds directory.")
+
+def run_startup():
+    """Show the loading splash while assets load in the background; returns False if the window is closed"""
+    # The default font needs no system font scan, so the splash can show right away
+    font_title = pygame.font.Font(None, 72)
+    font_status = pygame.font.Font(None, 24)
+    
+    asset_loader.start()
+    splash_shown = False
+    
+    while not asset_loader.is_done():
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return False
+            if event.type == pygame.VIDEORESIZE:
+                renderer.handle_resize()
+        
+        draw_loading_screen(font_title, font_status)
+        if not splash_shown:
+            startup_profiler.mark("splash shown")
+            splash_shown = True
+        clock.tick(30)
+    
+    if asset_loader.error is not None:
+        raise asset_loader.error
+    
+    with startup_profiler.phase("finish loading"):
+        finish_loading()
+    return True
+
+def write_stress_report():
+    """Write the stress mode scaling report and its raw samples"""
+    report_path = args.stress_report
+    samples_path = os.path.splitext(report_path)[0] + ".csv"
+    stress_ramp.write_samples(samples_path)
+    knees = stress_ramp.write_report(report_path)
+    print(f"Stress report written to {report_path} (samples in {samples_path})")
+    for name, entities in knees.items():
+        print(f"  {name} stops scaling linearly at ~{entities} entities")
+
+def write_alloc_report():
+    """Write the allocation profiler report"""
+    alloc_tracker.stop()
+    over_budget = alloc_tracker.write_report(args.alloc_report)
+    print(f"Allocation report written to {args.alloc_report}")
+    for name in over_budget:
+        print(f"  {name} allocates more than {args.alloc_budget} KB per frame")
+
+def main():
+    """Main game loop"""
+    global point_pos, render_thread, canvas_buffer
+    
+    # Cabinet host: decode everything once for the instances to share
+    if args.build_asset_pack:
+        asset_loader.run_blocking()
+        write_asset_pack(args.build_asset_pack)
+        pygame.quit()
+        sys.exit()
+    
+    # Load assets behind a splash screen
+    if not run_startup():
+        pygame.quit()
+        sys.exit()
+    
+    # Load high score
+    load_high_score()
+    
+    alloc_tracker.start()
+    telemetry.start()
+    
+    # Start the render thread in pipelined mode
+    if snapshot_buffer:
+        warm_fonts(immediately=True)  # From here on only the render thread uses fonts
+        canvas_buffer = CanvasBuffer([renderer.new_canvas() for _ in range(3)])
+        render_thread = RenderThread(snapshot_buffer, draw_on_render_thread, canvas_buffer)
+        render_thread.start()
+    
+    # Initialize point position
+    point_pos = generate_point_position()
+    point.update(point_pos[0], point_pos[1])
+
+    # The stress mode skips the start screen
+    if stress_ramp:
+        start_game()
+    elif args.attract:
+        start_attract()
+
+    running = True
+    first_frame = True
+    
+    while running:
+        # Nothing moves on the start and game over screens, so sleep until input arrives
+        idle = idle_enabled and not first_frame and game_state != STATE_PLAYING
+        if idle:
+            input_sampler.wait_for_event(idle_redraw_ms)
+            clock.reset()
+        else:
+            # Control the game speed - wait first so input is read right before the update
+            clock.tick(FPS)
+        frame_start = time.perf_counter()
+        flip_seconds = renderer.flip_seconds
+        
+        # Handle events
+        running = handle_events()
+        
+        # Update game state
+        run_simulation(0.0 if idle else clock.get_time() / 1000)
+        
+        # Draw everything (nothing else is coming soon on idle screens, so don't leave their frame waiting)
+        draw(wait_for_render=idle or first_frame)
+        alloc_tracker.end_frame()
+        
+        # Let the quality governor see how much of the budget this frame used - not counting the
+        # flip, which just waits for the display under vsync
+        work_ms = (time.perf_counter() - frame_start - (renderer.flip_seconds - flip_seconds)) * 1000
+        if render_thread:
+            work_ms = max(work_ms, frame_timings["draw"] * 1000)
+        if not idle:
+            quality.render_scale_usable = renderer.scale_path != "direct"
+            quality.record(work_ms)
+        
+        # Spend what is left of the frame on deferred work (idle screens have time to spare)
+        if idle:
+            deferred.run(time.perf_counter() + 1.0 / FPS)
+        else:
+            deferred.run(clock.next_deadline(FPS))
+        
+        if first_frame:
+            startup_profiler.mark("first frame")
+            if args.profile_startup:
+                startup_profiler.report()
+            first_frame = False
+            warm_fonts()
+            
+            if args.first_frame_marker:
+                with open(args.first_frame_marker, "w") as f:
+                    f.write(f"{startup_profiler.marks['first frame']:.6f}\n")
+                running = False
+        
+        if stress_ramp:
+            stress_ramp.record(len(projectile_sprites), len(particles), clock.get_time(), frame_timings)
+            if stress_ramp.finished:
+                running = False
+    
+    if render_thread:
+        render_thread.stop()
+    
+    telemetry.stop()
+    deferred.flush()  # Nothing queued (like a high score save) is lost
+    
+    if args.pacing_report:
+        clock.write_report(args.pacing_report)
+    
+    if stress_ramp:
+        write_stress_report()
+    
+    if alloc_tracker.enabled:
+        write_alloc_report()
+    
+    # Clean up
+    audio.stop_music()  # Stop music before quitting
+    pygame.quit()
+    sys.exit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Frame pacing for The Last Bluebook
+Waits for fixed frame deadlines with an OS sleep followed by a short calibrated spin-wait,
+and keeps a histogram of how far each frame interval lands from the target
+"""
+import time
+from collections import deque
+
+# How much of the calibrated sleep overshoot each mode covers with spinning, and the spin cap.
+# More spinning means more precise frames at the cost of CPU time.
+PACING_MODES = {
+    "sleep": (None, 0.0),       # Plain sleep, like pygame.time.Clock.tick
+    "balanced": (0.90, 0.002),  # Spin through the typical overshoot, at most 2 ms
+    "precise": (0.99, 0.004),   # Spin through nearly every overshoot, at most 4 ms
+}
+
+JITTER_BIN_MS = 0.25
+JITTER_RANGE_MS = 8.0  # Deviations beyond ±this land in the outermost bins
+
+
+class JitterHistogram:
+    """Histogram of frame interval minus the target interval, in milliseconds"""
+    def __init__(self, bin_ms=JITTER_BIN_MS, range_ms=JITTER_RANGE_MS):
+        self.bin_ms = bin_ms
+        self.range_ms = range_ms
+        self.bins = int(2 * range_ms / bin_ms)
+        self.counts = [0] * self.bins
+        self.total = 0
+        self.abs_sum = 0.0
+        self.max_abs = 0.0
+
+    def add(self, deviation_ms):
+        index = int((deviation_ms + self.range_ms) // self.bin_ms)
+        self.counts[min(self.bins - 1, max(0, index))] += 1
+        self.total += 1
+        self.abs_sum += abs(deviation_ms)
+        self.max_abs = max(self.max_abs, abs(deviation_ms))
+
+    def bin_edges(self):
+        return [-self.range_ms + i * self.bin_ms for i in range(self.bins + 1)]
+
+    def percentile_abs(self, fraction):
+        """Approximate percentile of the absolute deviation, from the bins"""
+        if not self.total:
+            return 0.0
+        center = self.bins // 2
+        # Fold the histogram around zero
+        folded = [self.counts[center + i] + self.counts[center - 1 - i] for i in range(center)]
+        target = fraction * self.total
+        seen = 0
+        for i, count in enumerate(folded):
+            seen += count
+            if seen >= target:
+                return min((i + 1) * self.bin_ms, self.max_abs)
+        return self.max_abs
+
+    def summary(self):
+        """Get mean, 99th percentile and max absolute deviation in milliseconds"""
+        mean = self.abs_sum / self.total if self.total else 0.0
+        return mean, self.percentile_abs(0.99), self.max_abs
+
+    def rows(self):
+        """Get (bin start, bin end, count) for every non-empty bin"""
+        edges = self.bin_edges()
+        return [(edges[i], edges[i + 1], count) for i, count in enumerate(self.counts) if count]
+
+
+class FramePacer:
+    """Drop-in replacement for pygame.time.Clock with deadline-based, spin-assisted waiting"""
+    def __init__(self, mode="balanced", vsync=False, calibration_window=240):
+        self.coverage, self.max_spin = PACING_MODES[mode]
+        self.mode = mode
+        self.vsync = vsync  # The display flip waits for the vertical blank; only pace coarsely
+
+        self.deadline = None
+        self.last_frame = None
+        self.frame_time = 0.0  # Seconds between the last two ticks
+        self.intervals = deque(maxlen=60)
+        self.sleep_overshoot = deque(maxlen=calibration_window)
+        self.spin_margin = 0.0
+        self.spin_time = 0.0   # Total seconds spent spinning
+
+        self.jitter = JitterHistogram()
+
+    def tick(self, fps=0):
+        """Wait until the next frame is due; returns the milliseconds since the previous tick"""
+        now = time.perf_counter()
+        if fps:
+            period = 1.0 / fps
+            if self.deadline is None or now - self.deadline > period:
+                # First frame, or too far behind to catch up: restart the schedule
+                self.deadline = now + period
+            else:
+                self.deadline += period
+            self._wait_until(self.deadline, period)
+            now = time.perf_counter()
+
+        if self.last_frame is not None:
+            self.frame_time = now - self.last_frame
+            self.intervals.append(self.frame_time)
+            if fps:
+                self.jitter.add((self.frame_time - 1.0 / fps) * 1000)
+        self.last_frame = now
+        return self.get_time()
+
+    def reset(self):
+        """Restart the frame schedule from now, e.g. after the loop blocked on input"""
+        self.deadline = self.last_frame = time.perf_counter()
+        self.frame_time = 0.0
+
+    def _wait_until(self, deadline, period):
+        if self.vsync:
+            # Leave the last stretch to the blocking flip so frames line up with the refresh
+            deadline -= min(0.002, period / 4)
+
+        sleep_for = deadline - self.spin_margin - time.perf_counter()
+        if sleep_for > 0:
+            before = time.perf_counter()
+            time.sleep(sleep_for)
+            self._calibrate(time.perf_counter() - before - sleep_for)
+
+        if self.coverage is not None:
+            spin_start = time.perf_counter()
+            while time.perf_counter() < deadline:
+                pass
+            self.spin_time += time.perf_counter() - spin_start
+
+    def _calibrate(self, overshoot):
+        """Size the spin margin to cover the configured share of recent sleep overshoots"""
+        self.sleep_overshoot.append(max(0.0, overshoot))
+        if self.coverage is None:
+            return
+        ordered = sorted(self.sleep_overshoot)
+        index = min(len(ordered) - 1, int(len(ordered) * self.coverage))
+        self.spin_margin = min(self.max_spin, ordered[index])
+
+    def next_deadline(self, fps):
+        """Get the perf_counter() time the next tick(fps) waits for"""
+        if not fps or self.deadline is None:
+            return time.perf_counter()
+        return self.deadline + 1.0 / fps
+
+    def get_time(self):
+        """Milliseconds between the last two ticks (like Clock.get_time)"""
+        return self.frame_time * 1000
+
+    def get_fps(self):
+        if not self.intervals:
+            return 0.0
+        return len(self.intervals) / sum(self.intervals)
+
+    def overlay_lines(self):
+        mean, p99, worst = self.jitter.summary()
+        vsync = " vsync" if self.vsync else ""
+        return [f"pacing {self.mode}{vsync}  spin {self.spin_margin * 1000:.2f} ms  "
+                f"jitter avg {mean:.2f}  p99 {p99:.2f}  max {worst:.1f} ms"]
+
+    def write_report(self, path):
+        """Write the jitter summary and histogram"""
+        mean, p99, worst = self.jitter.summary()
+        with open(path, "w") as f:
+            f.write("The Last Bluebook - frame pacing report\n")
+            f.write(f"Mode {self.mode}{' with vsync' if self.vsync else ''}, {self.jitter.total} frames, "
+                    f"{self.spin_time:.2f} s spent spinning\n")
+            f.write(f"Jitter (|interval - target|): avg {mean:.3f} ms  p99 {p99:.2f} ms  max {worst:.2f} ms\n\n")
+            f.write(f"{'from ms':>8} {'to ms':>8} {'frames':>8}\n")
+            for start, end, count in self.jitter.rows():
+                f.write(f"{start:>8.2f} {end:>8.2f} {count:>8}\n")
@@ -0,0 +1,165 @@
+"""
+Frame snapshots and the optional pipelined renderer for The Last Bluebook
+The simulation publishes an immutable snapshot of everything that is drawn each frame;
+in pipelined mode a render thread draws the latest one to a canvas while the next frame is
+simulated, and the main thread presents the newest finished canvas (SDL only supports
+presenting from the main thread on Windows and macOS)
+"""
+import threading
+import time
+from collections import namedtuple
+
+from input_timing import LatencyStats
+
+FrameSnapshot = namedtuple("FrameSnapshot", [
+    "frame_id",
+    "publish_time",      # perf_counter() when the snapshot was taken
+    "game_state",
+    "time",              # Game time, for time-based effects like the multiplier pulse
+    "score",
+    "high_score",
+    "difficulty_level",
+    "multiplier",
+    "multiplier_timer",
+    "player_topleft",
+    "point_center",
+    "projectiles",       # (image, (x, y)) pairs ready for Surface.blits
+    "particles",         # (x, y, size, color, alpha)
+    "popups",            # (x, y, value, color, alpha, scale, y_offset)
+    "overlay_lines",     # Debug overlay text, or None when the overlay is hidden
+    "input_sample_time", # When the keyboard state behind this frame was read
+    "key_event_start",   # Start of the window key events arrived in, or None if there were none
+    "demo",              # The autopilot is playing (attract mode)
+])
+
+
+class SnapshotBuffer:
+    """Double buffer of snapshots: the simulation fills the back slot and flips, the renderer reads the front"""
+    def __init__(self):
+        self.slots = [None, None]
+        self.front = 0
+        self.rendered_id = -1  # Newest snapshot the renderer has taken
+        self.closed = False
+        self.condition = threading.Condition()
+
+        self.published = 0
+        self.dropped = 0       # Snapshots replaced before the renderer got to them
+        self.overlapped = 0    # Snapshots published while a frame was being rendered
+        self.render_busy = False
+
+    def publish(self, snapshot):
+        with self.condition:
+            front = self.slots[self.front]
+            if front is not None and front.frame_id > self.rendered_id:
+                self.dropped += 1
+            if self.render_busy:
+                self.overlapped += 1
+            back = 1 - self.front
+            self.slots[back] = snapshot
+            self.front = back
+            self.published += 1
+            self.condition.notify()
+
+    def take_latest(self, timeout=0.1):
+        """Wait for a snapshot newer than the last one taken; None on timeout or close"""
+        with self.condition:
+            while not self.closed:
+                snapshot = self.slots[self.front]
+                if snapshot is not None and snapshot.frame_id > self.rendered_id:
+                    self.rendered_id = snapshot.frame_id
+                    self.render_busy = True
+                    return snapshot
+                if not self.condition.wait(timeout):
+                    return None
+            return None
+
+    def finish_render(self):
+        with self.condition:
+            self.render_busy = False
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+
+class CanvasBuffer:
+    """Triple buffer of canvases: the render thread draws into one while the main thread presents another"""
+    def __init__(self, canvases):
+        self.drawing, self.ready, self.presenting = canvases
+        self.ready_frame = None  # Snapshot drawn on the ready canvas, None once it has been taken
+        self.condition = threading.Condition()
+
+    def swap_drawn(self, snapshot):
+        """Hand over the canvas just drawn (render thread); returns the canvas to draw the next frame on"""
+        with self.condition:
+            self.drawing, self.ready = self.ready, self.drawing
+            self.ready_frame = snapshot
+            self.condition.notify()
+            return self.drawing
+
+    def take_ready(self, frame_id=-1, timeout=0.0):
+        """Get (canvas, snapshot) of the newest drawn frame not presented yet (main thread)
+
+        Waits up to timeout for a frame at least as new as frame_id; (None, None) if nothing new was drawn.
+        """
+        with self.condition:
+            self.condition.wait_for(
+                lambda: self.ready_frame is not None and self.ready_frame.frame_id >= frame_id, timeout)
+            snapshot = self.ready_frame
+            if snapshot is None:
+                return None, None
+            self.ready_frame = None
+            self.presenting, self.ready = self.ready, self.presenting
+            return self.presenting, snapshot
+
+
+class RenderThread:
+    """Draws the latest published snapshot to a canvas on a dedicated thread"""
+    def __init__(self, buffer, render, canvases):
+        self.buffer = buffer
+        self.render = render  # Function drawing one snapshot to a canvas
+        self.canvases = canvases
+        self.snapshot_age = LatencyStats()
+        self.render_time = LatencyStats()
+        self.rendered = 0
+        self.error = None
+        self.thread = threading.Thread(target=self._run, name="render", daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.buffer.close()
+        self.thread.join(timeout=2.0)
+
+    def _run(self):
+        canvas = self.canvases.drawing
+        try:
+            while not self.buffer.closed:
+                snapshot = self.buffer.take_latest()
+                if snapshot is None:
+                    continue
+                start = time.perf_counter()
+                self.snapshot_age.add((start - snapshot.publish_time) * 1000)
+                try:
+                    self.render(snapshot, canvas)
+                finally:
+                    self.buffer.finish_render()
+                canvas = self.canvases.swap_drawn(snapshot)
+                self.render_time.add((time.perf_counter() - start) * 1000)
+                self.rendered += 1
+        except Exception as e:
+            self.error = e
+            raise
+
+    def overlay_lines(self):
+        buffer = self.buffer
+        published = max(1, buffer.published)
+        age_mean, age_p95, age_max = self.snapshot_age.summary()
+        render_mean, render_p95, _ = self.render_time.summary()
+        return [
+            f"pipelined  snapshot age avg {age_mean:.1f}  p95 {age_p95:.1f}  max {age_max:.1f} ms",
+            f"render avg {render_mean:.1f}  p95 {render_p95:.1f} ms  overlap {buffer.overlapped / published:.0%}"
+            f"  dropped {buffer.dropped} ({buffer.dropped / published:.1%})",
+        ]
@@ -0,0 +1,106 @@
+"""
+Adaptive quality for The Last Bluebook
+Watches rolling frame times against a budget and steps effects down (and back up) with hysteresis
+"""
+from collections import deque, namedtuple
+
+QualityLevel = namedtuple("QualityLevel", [
+    "name",
+    "particle_interval",  # Seconds between player trail particle spawns
+    "max_particles",
+    "popup_animation",    # Score popups grow, shrink and drift; otherwise they only fade
+    "pulse",              # Multiplier text pulse effect
+    "render_scale",       # Multiplied with the configured render scale
+])
+
+# Best first; each level gives up a bit more than the one before
+QUALITY_LEVELS = [
+    QualityLevel("full", 0.05, 40, True, True, 1.0),
+    QualityLevel("fewer particles", 0.1, 20, True, True, 1.0),
+    QualityLevel("static popups", 0.1, 20, False, True, 1.0),
+    QualityLevel("no pulse", 0.1, 20, False, False, 1.0),
+    QualityLevel("minimal particles", 0.2, 8, False, False, 1.0),
+    QualityLevel("render 75%", 0.2, 8, False, False, 0.75),
+    QualityLevel("render 50%", 0.2, 8, False, False, 0.5),
+]
+
+
+class QualityGovernor:
+    def __init__(self, budget_ms, enabled=True, window=60, recover_window=180,
+                 down_ratio=1.0, up_ratio=0.7, levels=QUALITY_LEVELS):
+        self.budget_ms = budget_ms
+        self.enabled = enabled
+        self.levels = levels
+        self.level = 0
+        self.down_ratio = down_ratio  # Step down when the window's p90 is over budget * down_ratio
+        self.up_ratio = up_ratio      # Step up when the recovery window's p90 is under budget * up_ratio
+
+        self.frame_times = deque(maxlen=window)
+        self.recover_times = deque(maxlen=recover_window)
+
+        self.frames = 0
+        self.overruns = 0          # Frames over budget since the start
+        self.steps_down = 0
+        self.steps_up = 0
+        self.frames_at_level = [0] * len(levels)
+        self.render_scale_usable = True  # False while the canvas is shown unscaled, which ignores render scale
+        self.scale_held = False          # The last step down was skipped because render scale would do nothing
+        self.on_change = None      # Called with the new QualityLevel whenever the level changes
+
+    @property
+    def settings(self):
+        return self.levels[self.level]
+
+    def record(self, frame_ms):
+        """Record the work time of one frame and change the quality level if needed"""
+        self.frames += 1
+        self.frames_at_level[self.level] += 1
+        if frame_ms > self.budget_ms:
+            self.overruns += 1
+        if not self.enabled:
+            return
+
+        self.frame_times.append(frame_ms)
+        self.recover_times.append(frame_ms)
+
+        # Wait for a full window at the current level before judging it
+        if len(self.frame_times) < self.frame_times.maxlen:
+            return
+        if self._p90(self.frame_times) > self.budget_ms * self.down_ratio:
+            if self.level < len(self.levels) - 1:
+                # Lowering the render scale only helps when the canvas is being scaled anyway
+                self.scale_held = (not self.render_scale_usable and
+                                   self.levels[self.level + 1].render_scale != self.settings.render_scale)
+                if not self.scale_held:
+                    self.steps_down += 1
+                    self._set_level(self.level + 1)
+            return
+        self.scale_held = False
+        if len(self.recover_times) == self.recover_times.maxlen and self.level > 0:
+            # Recover only after a long stretch with plenty of headroom
+            if self._p90(self.recover_times) < self.budget_ms * self.up_ratio:
+                self.steps_up += 1
+                self._set_level(self.level - 1)
+
+    def _set_level(self, level):
+        self.level = level
+        self.frame_times.clear()
+        self.recover_times.clear()
+        if self.on_change:
+            self.on_change(self.settings)
+
+    @staticmethod
+    def _p90(samples):
+        ordered = sorted(samples)
+        return ordered[int(len(ordered) * 0.9)]
+
+    def overlay_lines(self):
+        recent = self._p90(self.frame_times) if self.frame_times else 0.0
+        state = "" if self.enabled else " (fixed)"
+        if self.scale_held and self.enabled:
+            state = " (render scale held: direct path)"
+        return [
+            f"quality {self.level} {self.settings.name}{state}  p90 {recent:.1f} / {self.budget_ms:.1f} ms",
+            f"overruns {self.overruns} ({self.overruns / max(1, self.frames):.1%})"
+            f"  steps down {self.steps_down} up {self.steps_up}",
+        ]
@@ -0,0 +1,130 @@
+"""
+Resolution-independent presentation for The Last Bluebook
+The game draws to a fixed logical canvas, which is scaled to fit the window when presented
+"""
+import time
+
+import pygame
+
+
+class Renderer:
+    def __init__(self, logical_size, window_size=None, render_scale=1.0, smooth=True, fullscreen=False, vsync=False,
+                 display=0):
+        self.logical_size = logical_size
+        self.render_scale = render_scale
+        self.smooth = smooth  # smoothscale for non-integer scale factors, nearest neighbour otherwise
+
+        flags = pygame.FULLSCREEN if fullscreen else pygame.RESIZABLE
+        self.vsync = vsync
+        self.window = pygame.display.set_mode(window_size or logical_size, flags, display=display,
+                                              vsync=1 if vsync else 0)
+
+        # Everything in the game is drawn here, always at the logical resolution
+        self.canvas = pygame.Surface(logical_size).convert()
+
+        self.dest_rect = None
+        self.target = None    # Subsurface of the window the scaled canvas is written into
+        self.internal = None  # Intermediate surface when rendering below the window resolution
+        self.bars = []        # Letterbox areas around the canvas
+        self.scale_path = "direct"
+        self.resize_pending = False
+        self.flip_seconds = 0.0  # Total time spent in display flips, which block under vsync
+        self._layout()
+
+    def _layout(self):
+        """Work out where the canvas goes in the window and preallocate the scaling surfaces"""
+        self.window = pygame.display.get_surface()
+        window_width, window_height = self.window.get_size()
+        logical_width, logical_height = self.logical_size
+
+        # Fit the canvas inside the window, keeping its aspect ratio
+        fit = min(window_width / logical_width, window_height / logical_height)
+        # Snap to a whole factor when it is close, so the fast integer path can be used
+        if fit >= 1 and abs(fit - round(fit)) < 0.01:
+            fit = round(fit)
+        dest_width = max(1, int(logical_width * fit))
+        dest_height = max(1, int(logical_height * fit))
+        self.dest_rect = pygame.Rect(0, 0, dest_width, dest_height)
+        self.dest_rect.center = (window_width // 2, window_height // 2)
+        self.target = self.window.subsurface(self.dest_rect)
+
+        self.bars = [
+            rect for rect in (
+                pygame.Rect(0, 0, window_width, self.dest_rect.top),
+                pygame.Rect(0, self.dest_rect.bottom, window_width, window_height - self.dest_rect.bottom),
+                pygame.Rect(0, 0, self.dest_rect.left, window_height),
+                pygame.Rect(self.dest_rect.right, 0, window_width - self.dest_rect.right, window_height),
+            ) if rect.width > 0 and rect.height > 0
+        ]
+
+        # Render scale only applies when the canvas is scaled at all
+        internal_size = (max(1, int(dest_width * self.render_scale)), max(1, int(dest_height * self.render_scale)))
+        if self.dest_rect.size == self.logical_size:
+            self.internal = None
+            self.scale_path = "direct"
+        elif internal_size == self.dest_rect.size:
+            self.internal = None
+            self.scale_path = self._filter_for(self.dest_rect.size)
+        else:
+            self.internal = pygame.Surface(internal_size).convert()
+            self.scale_path = self._filter_for(internal_size) + "+upscale"
+
+    def _filter_for(self, size):
+        """Pick the scaling filter for scaling the canvas to the given size"""
+        logical_width, logical_height = self.logical_size
+        integer_scale = size[0] % logical_width == 0 and size[1] % logical_height == 0
+        if integer_scale or not self.smooth:
+            return "integer" if integer_scale else "nearest"
+        return "smooth"
+
+    def _scale_canvas(self, canvas, size, dest_surface, path):
+        if path.startswith("smooth"):
+            pygame.transform.smoothscale(canvas, size, dest_surface)
+        else:
+            pygame.transform.scale(canvas, size, dest_surface)
+
+    def set_render_scale(self, render_scale):
+        """Change the render scale; like a resize, it takes effect at the next present()"""
+        if render_scale != self.render_scale:
+            self.render_scale = render_scale
+            self.resize_pending = True
+
+    def handle_resize(self):
+        """Call after the window has been resized; the layout is redone by the next present()"""
+        self.resize_pending = True
+
+    def overlay_lines(self):
+        """Get text lines describing the current presentation path"""
+        width, height = self.dest_rect.size
+        return [f"render {width}x{height}  scale {self.render_scale:g}  path {self.scale_path}"]
+
+    def new_canvas(self):
+        """Get another canvas like the main one, e.g. for drawing on another thread"""
+        return self.canvas.copy()
+
+    def present(self, canvas=None):
+        """Scale the canvas (the main one unless given) into the window and flip the display
+
+        Call from the main thread only.
+        """
+        if canvas is None:
+            canvas = self.canvas
+        if self.resize_pending:
+            self.resize_pending = False
+            self._layout()
+
+        if self.scale_path == "direct":
+            self.window.blit(canvas, self.dest_rect)
+        elif self.internal is None:
+            self._scale_canvas(canvas, self.dest_rect.size, self.target, self.scale_path)
+        else:
+            # Filtered scale at the reduced resolution, then a cheap nearest-neighbour upscale
+            self._scale_canvas(canvas, self.internal.get_size(), self.internal, self.scale_path)
+            pygame.transform.scale(self.internal, self.dest_rect.size, self.target)
+
+        for bar in self.bars:
+            self.window.fill((0, 0, 0), bar)
+
+        flip_start = time.perf_counter()
+        pygame.display.flip()
+        self.flip_seconds += time.perf_counter() - flip_start
@@ -0,0 +1,76 @@
+"""
+Recorded runs for The Last Bluebook
+A run is its random seed, the simulation clock it started at, the tick rate and the arrow keys
+held on every tick - enough for simulation.py to replay it exactly and check the claimed score
+"""
+import os
+import json
+import time
+
+VERSION = 1
+
+# Arrow keys are stored as one hex digit per tick
+LEFT = 1
+RIGHT = 2
+UP = 4
+DOWN = 8
+
+
+def encode_keys(left, right, up, down):
+    return (LEFT if left else 0) | (RIGHT if right else 0) | (UP if up else 0) | (DOWN if down else 0)
+
+
+def save_run(path, run):
+    with open(path, "w") as f:
+        json.dump(run, f)
+
+
+def load_run(path):
+    with open(path) as f:
+        run = json.load(f)
+    if run.get("version") != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} run")
+    return run
+
+
+class RunRecorder:
+    """Records the inputs of each run and writes it out at game over"""
+    def __init__(self, directory=None):
+        self.enabled = directory is not None
+        self.directory = directory
+        self.recording = False
+        self.run = None
+        self.ticks = []
+
+    def start(self, seed, start_clock, sim_hz):
+        if not self.enabled:
+            return
+        self.recording = True
+        self.run = {"version": VERSION, "seed": seed, "start_clock": start_clock, "sim_hz": sim_hz}
+        self.ticks = []
+
+    def record_tick(self, left, right, up, down):
+        """Record the arrow keys held during one simulation tick"""
+        if self.recording:
+            self.ticks.append(format(encode_keys(left, right, up, down), "x"))
+
+    def cancel(self):
+        self.recording = False
+        self.run = None
+        self.ticks = []
+
+    def finish(self, score, grade, level):
+        """Write the finished run with its claimed result; returns the file written"""
+        if not self.recording:
+            return None
+        self.run["inputs"] = "".join(self.ticks)
+        self.run["claim"] = {"score": score, "grade": grade, "level": level}
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"run-{time.strftime('%Y%m%d-%H%M%S')}-{self.run['seed']:016x}.json")
+        try:
+            save_run(path, self.run)
+        except OSError as e:
+            print(f"Error saving run: {e}")
+            path = None
+        self.cancel()
+        return path
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Verify recorded runs of The Last Bluebook before their scores reach the board
+Usage: python replay_verify.py [runs/ or run files...] [--workers N] [--chunk-size 32]
+
+Every run is re-simulated headlessly from its seed and per-tick inputs, and its final score,
+grade and level are checked against the claim. Runs are spread over a process pool in chunks
+so large backlogs are cleared quickly. Exits with status 1 if any run fails.
+"""
+import os
+import sys
+import glob
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from replay import load_run
+from simulation import replay_run, sprite_sizes
+
+images_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "images")
+sizes = None  # Collision sizes, loaded once per worker
+
+
+def init_worker():
+    global sizes
+    sizes = sprite_sizes(images_dir)
+
+
+def verify_chunk(paths):
+    """Verify a batch of runs; returns (path, ticks, problem or None) for each"""
+    if sizes is None:
+        init_worker()
+    results = []
+    for path in paths:
+        try:
+            simulation, problem = replay_run(load_run(path), sizes)
+            results.append((path, simulation.ticks, problem))
+        except (OSError, ValueError, KeyError) as e:
+            results.append((path, 0, f"unreadable: {e}"))
+    return results
+
+
+def run_paths(paths):
+    """Expand directories into the run files in them"""
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            found += sorted(glob.glob(os.path.join(path, "run-*.json")))
+        else:
+            found.append(path)
+    return found
+
+
+def verify(paths, workers=None, chunk_size=32):
+    """Verify every run; returns the results and the seconds it took"""
+    chunks = [paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size)]
+    start = time.perf_counter()
+    if workers == 1:
+        results = [result for chunk in chunks for result in verify_chunk(chunk)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+            results = [result for chunk_results in pool.map(verify_chunk, chunks) for result in chunk_results]
+    return results, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("paths", nargs="*", default=["runs"], help="Run files or directories")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per CPU)")
+    parser.add_argument("--chunk-size", type=int, default=32, help="Runs handed to a worker at a time")
+    args = parser.parse_args()
+
+    paths = run_paths(args.paths)
+    if not paths:
+        print("No runs found")
+        return 0
+
+    results, seconds = verify(paths, args.workers, args.chunk_size)
+    failed = [(path, problem) for path, _, problem in results if problem]
+    ticks = sum(ticks for _, ticks, _ in results)
+
+    for path, problem in failed:
+        print(f"FAIL {path}: {problem}")
+    print(f"{len(results) - len(failed)}/{len(results)} runs verified in {seconds:.2f} s "
+          f"({len(results) / seconds:.1f} runs/s, {ticks / seconds / 1000:.0f}k ticks/s)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
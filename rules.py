@@ -0,0 +1,76 @@
+"""
+Game rules for The Last Bluebook
+Shared by the game and the tools that analyze or replay its runs, so they can't drift apart
+"""
+import math
+
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 600
+CENTER_X = SCREEN_WIDTH // 2
+CENTER_Y = SCREEN_HEIGHT // 2
+FPS = 60  # Speeds are given in pixels per frame at this rate
+
+PLAYER_SIZE = 50
+PLAYER_SPEED = 5
+PROJECTILE_SIZE = 15
+POINT_SIZE = 15
+PROJECTILE_SPEED = 4
+BASE_PROJECTILE_INTERVAL = 1.0  # Seconds between projectiles at level 1
+MAX_ANGLE_DEVIATION = 60        # Degrees projectiles may miss the player by (±60° = 120° total range)
+MIN_DISTANCE_FROM_CENTER = 150  # Points never appear closer than this to the generator
+MULTIPLIER_DURATION = 5.0       # Seconds to collect the next point to keep the multiplier going
+MAX_MULTIPLIER = 5
+
+# Grades from best to worst; telemetry and the run history store grades as indexes into this list
+GRADE_LEVELS = ["1.00", "1.25", "1.50", "1.75", "2.00", "2.25", "2.50", "2.75", "3.00", "4.00", "5.00"]
+
+# Lowest percentage for each grade, best first
+GRADE_THRESHOLDS = [(95.2, "1.00"), (90.8, "1.25"), (86.4, "1.50"), (82, "1.75"), (77.6, "2.00"),
+                    (73.2, "2.25"), (68.8, "2.50"), (64.4, "2.75"), (60, "3.00"), (55, "4.00")]
+
+
+def score_percentage(score):
+    return (score / 200) * 100
+
+
+def grade_for_score(score):
+    """Get the grade for a score, as shown on the game over screen"""
+    percentage = score_percentage(score)
+    for threshold, grade in GRADE_THRESHOLDS:
+        if percentage >= threshold:
+            return grade
+    return "5.00"
+
+
+def level_for_score(score):
+    return (score // 5) + 1
+
+
+def projectile_interval_for_level(level):
+    """Seconds between projectile spawns at a difficulty level"""
+    return BASE_PROJECTILE_INTERVAL / (1 + (level - 1) * 0.2)
+
+
+def next_multiplier(multiplier, since_last_point):
+    """Multiplier after collecting a point since_last_point seconds after the one before"""
+    if since_last_point < MULTIPLIER_DURATION:
+        return min(multiplier + 1, MAX_MULTIPLIER)
+    return 1
+
+
+def point_position(rng):
+    """Pick a random position for the point away from the center"""
+    while True:
+        x = rng.randint(POINT_SIZE, SCREEN_WIDTH - POINT_SIZE)
+        y = rng.randint(POINT_SIZE + 30, SCREEN_HEIGHT - POINT_SIZE)
+        dx = x - CENTER_X
+        dy = y - CENTER_Y
+        if math.sqrt(dx*dx + dy*dy) >= MIN_DISTANCE_FROM_CENTER:
+            return [x, y]
+
+
+def projectile_velocity(rng, target_x, target_y):
+    """Velocity in pixels per second of a projectile fired from the center at a target, with random deviation"""
+    base_angle = math.atan2(target_y - CENTER_Y, target_x - CENTER_X)
+    angle = base_angle + math.radians(rng.uniform(-MAX_ANGLE_DEVIATION, MAX_ANGLE_DEVIATION))
+    return math.cos(angle) * PROJECTILE_SPEED * FPS, math.sin(angle) * PROJECTILE_SPEED * FPS
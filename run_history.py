@@ -0,0 +1,313 @@
+"""
+Run history archive for The Last Bluebook
+One row per finished run, stored column by column: every field is a raw little-endian file that is
+memory-mapped as a NumPy array, and every chunk of rows keeps each field's min and max so queries
+skip chunks that cannot match. Rows are only ever appended. Use run_history_report.py to summarize
+an archive.
+"""
+import os
+import json
+
+import numpy as np
+
+VERSION = 1
+CHUNK_ROWS = 65536
+TRACKED_LEVELS = 20  # The time to reach levels 2 to 20 is kept for every run
+
+# Field -> dtype
+FIELDS = {
+    "end_time": "<f8",           # Clock at game over (seconds since the epoch)
+    "duration": "<f4",           # Seconds from the start of the run to game over
+    "score": "<i4",
+    "percentage": "<f4",         # As shown on the game over screen
+    "grade": "u1",               # Index into rules.GRADE_LEVELS of the final grade
+    "level": "<u2",              # Final difficulty level
+    "killer_grade": "u1",        # Index into rules.GRADE_LEVELS of the projectile that ended the run
+    "max_multiplier": "u1",
+    "multiplier_uptime": "<f4",  # Share of the run spent with a multiplier above 1x
+}
+# Seconds from the start of the run to reaching each level (NaN if it never did)
+LEVEL_TIME_FIELDS = [f"time_to_level_{level}" for level in range(2, TRACKED_LEVELS + 1)]
+FIELDS.update((field, "<f4") for field in LEVEL_TIME_FIELDS)
+
+
+def check_field(name):
+    if name not in FIELDS:
+        raise ValueError(f"unknown field {name!r}")
+    return name
+
+
+class RunHistory:
+    """Append-only columnar archive of finished runs
+
+    A new archive is created if the directory doesn't hold one, unless create is False.
+    """
+    def __init__(self, directory, chunk_rows=CHUNK_ROWS, create=True):
+        self.directory = directory
+        self.meta_path = os.path.join(directory, "meta.json")
+        if not create and not os.path.exists(self.meta_path):
+            raise FileNotFoundError(f"{directory} is not a run history (no meta.json)")
+        os.makedirs(directory, exist_ok=True)
+        if os.path.exists(self.meta_path):
+            with open(self.meta_path) as f:
+                meta = json.load(f)
+            if meta.get("version") != VERSION:
+                raise ValueError(f"{directory} is not a version {VERSION} run history")
+        else:
+            meta = {"version": VERSION, "rows": 0, "chunk_rows": chunk_rows}
+            self._write_meta(meta)
+        self.rows = meta["rows"]
+        self.chunk_rows = meta["chunk_rows"]
+        self.columns = {}  # Field -> memmap, reopened after appends
+        self.indexes = {}  # Field -> (chunks, 2) array of per-chunk min and max
+
+    def _path(self, field, suffix=".bin"):
+        return os.path.join(self.directory, field + suffix)
+
+    def _write_meta(self, meta):
+        temp_path = self.meta_path + ".tmp"
+        with open(temp_path, "w") as f:
+            json.dump(meta, f)
+        os.replace(temp_path, self.meta_path)  # The row count is the commit point of an append
+
+    def __len__(self):
+        return self.rows
+
+    def append(self, columns):
+        """Append rows given as field -> sequence of values (every field, same length)"""
+        arrays = {}
+        for field, dtype in FIELDS.items():
+            arrays[field] = np.asarray(columns[field], dtype=dtype).reshape(-1)
+        count = len(arrays["score"])
+        if any(len(array) != count for array in arrays.values()):
+            raise ValueError("every field needs the same number of rows")
+        if not count:
+            return
+
+        for field, array in arrays.items():
+            with open(self._path(field), "ab") as f:
+                f.truncate(self.rows * array.itemsize)  # Drop anything left by an append that never committed
+                f.write(array.tobytes())
+            self._update_index(field, array)
+
+        self.rows += count
+        self._write_meta({"version": VERSION, "rows": self.rows, "chunk_rows": self.chunk_rows})
+        self.columns.clear()
+
+    def append_row(self, **values):
+        self.append({field: [value] for field, value in values.items()})
+
+    def _update_index(self, field, array):
+        """Fold the new rows into the min/max of the chunks they land in"""
+        index = self.index(field)
+        first_chunk = self.rows // self.chunk_rows
+        last_chunk = (self.rows + len(array) - 1) // self.chunk_rows
+        grown = np.full((last_chunk + 1, 2), np.nan)
+        grown[:len(index)] = index[:last_chunk + 1]
+
+        for chunk in range(first_chunk, last_chunk + 1):
+            start = max(0, chunk * self.chunk_rows - self.rows)
+            part = array[start:(chunk + 1) * self.chunk_rows - self.rows].astype(np.float64)
+            low, high = np.fmin.reduce(part), np.fmax.reduce(part)
+            if chunk < len(index):
+                low, high = np.fmin(low, index[chunk, 0]), np.fmax(high, index[chunk, 1])
+            grown[chunk, 0] = low
+            grown[chunk, 1] = high
+
+        temp_path = self._path(field, ".minmax.tmp.npy")
+        np.save(temp_path, grown)
+        os.replace(temp_path, self._path(field, ".minmax.npy"))
+        self.indexes[field] = grown
+
+    def index(self, field):
+        """Per-chunk min and max of a field (NaN values are ignored)"""
+        if field not in self.indexes:
+            path = self._path(field, ".minmax.npy")
+            chunks = -(-self.rows // self.chunk_rows)
+            if os.path.exists(path):
+                self.indexes[field] = np.load(path)[:chunks]
+            else:
+                self.indexes[field] = np.empty((0, 2))
+        return self.indexes[field]
+
+    def column(self, field):
+        """Memory-mapped values of a field"""
+        if field not in self.columns:
+            dtype = FIELDS[check_field(field)]
+            if self.rows:
+                # A plain ndarray view of the map slices faster than the memmap subclass
+                values = np.memmap(self._path(field), dtype=dtype, mode="r", shape=(self.rows,))
+                self.columns[field] = values.view(np.ndarray)
+            else:
+                self.columns[field] = np.empty(0, dtype=dtype)
+        return self.columns[field]
+
+    def chunks(self, where=None):
+        """Yield (start, stop, mask or None) for every chunk with rows matching where
+
+        where maps field names to a value or an inclusive (low, high) range with None for an open end.
+        The mask is None when the chunk's min/max show that every row matches.
+        """
+        filters = []
+        for name, condition in (where or {}).items():
+            low, high = condition if isinstance(condition, tuple) else (condition, condition)
+            exact = np.dtype(FIELDS[check_field(name)]).kind in "iu"  # Float chunks may hide NaN rows
+            filters.append((self.column(name), self.index(name), low, high, exact))
+
+        for chunk in range(-(-self.rows // self.chunk_rows)):
+            start = chunk * self.chunk_rows
+            stop = min(self.rows, start + self.chunk_rows)
+            mask = None
+            for values, index, low, high, exact in filters:
+                chunk_min, chunk_max = index[chunk]
+                if (low is not None and chunk_max < low) or (high is not None and chunk_min > high):
+                    break  # No row in this chunk can match
+                if exact and (low is None or chunk_min >= low) and (high is None or chunk_max <= high):
+                    continue  # Every row matches
+                part = values[start:stop]
+                matches = np.ones(len(part), dtype=bool)
+                if low is not None:
+                    matches &= part >= low
+                if high is not None:
+                    matches &= part <= high
+                mask = matches if mask is None else mask & matches
+            else:
+                yield start, stop, mask
+
+    def count(self, where=None):
+        return sum(stop - start if mask is None else int(np.count_nonzero(mask))
+                   for start, stop, mask in self.chunks(where))
+
+    def values(self, name, where=None):
+        """Get the matching values of a field as one array"""
+        column = self.column(name)
+        parts = [column[start:stop] if mask is None else column[start:stop][mask]
+                 for start, stop, mask in self.chunks(where)]
+        return np.concatenate(parts) if parts else column[:0]
+
+    def aggregate(self, name, where=None, percentiles=()):
+        """Count, mean, std, min and max (and any percentiles) of a field over matching rows, ignoring NaN"""
+        if percentiles:
+            # Percentiles need every value at once anyway
+            parts = [self._values_without_nan(self.values(name, where))]
+        else:
+            column = self.column(name)
+            parts = (self._values_without_nan(column[start:stop] if mask is None else column[start:stop][mask])
+                     for start, stop, mask in self.chunks(where))
+
+        count = 0
+        total = 0.0
+        squares = 0.0
+        low = np.inf
+        high = -np.inf
+        for part in parts:
+            if len(part):
+                count += len(part)
+                total += part.sum(dtype=np.float64)
+                squares += np.square(part, dtype=np.float64).sum()
+                low = min(low, part.min())
+                high = max(high, part.max())
+
+        result = {"count": count}
+        if count:
+            mean = total / count
+            result.update(mean=mean, std=max(0.0, squares / count - mean * mean) ** 0.5, min=low, max=high)
+            if percentiles:
+                for p, value in zip(percentiles, np.percentile(parts[0], percentiles)):
+                    result[f"p{p:g}"] = value
+        return result
+
+    @staticmethod
+    def _values_without_nan(values):
+        if values.dtype.kind == "f":
+            nan = np.isnan(values)
+            if nan.any():
+                return values[~nan]
+        return values
+
+    def histogram(self, name, bins=20, range=None, where=None):
+        """Histogram of a field over matching rows; returns (counts, bin edges)"""
+        if range is None:
+            # The chunk index gives the overall range without reading the data
+            index = self.index(check_field(name))
+            low = np.fmin.reduce(index[:, 0]) if len(index) else np.nan
+            high = np.fmax.reduce(index[:, 1]) if len(index) else np.nan
+            if np.isnan(low):
+                low = high = 0.0
+            range = (low, high) if low < high else (low, low + 1)
+        edges = np.histogram_bin_edges([], bins=bins, range=range)
+        counts = np.zeros(len(edges) - 1, dtype=np.int64)
+        column = self.column(name)
+        for start, stop, mask in self.chunks(where):
+            part = column[start:stop] if mask is None else column[start:stop][mask]
+            counts += np.histogram(part, bins=edges)[0]
+        return counts, edges
+
+    def value_counts(self, name, where=None, minlength=0):
+        """Count how often each small non-negative integer value occurs (grades, levels)"""
+        counts = np.zeros(minlength, dtype=np.int64)
+        column = self.column(name)
+        for start, stop, mask in self.chunks(where):
+            part = column[start:stop] if mask is None else column[start:stop][mask]
+            chunk_counts = np.bincount(part, minlength=len(counts))
+            chunk_counts[:len(counts)] += counts
+            counts = chunk_counts
+        return counts
+
+
+class RunHistoryRecorder:
+    """Collects a run's statistics while it is played (does nothing unless enabled)"""
+    def __init__(self, directory=None):
+        self.enabled = directory is not None
+        self.directory = directory
+        self.history = None  # Opened on the first save
+        self.recording = False
+
+    def start(self, clock):
+        if not self.enabled:
+            return
+        self.recording = True
+        self.start_clock = clock
+        self.level_times = [np.nan] * len(LEVEL_TIME_FIELDS)
+        self.multiplier_since = None
+        self.multiplier_seconds = 0.0
+        self.max_multiplier = 1
+
+    def level_up(self, level, clock):
+        if self.recording and 2 <= level <= TRACKED_LEVELS:
+            self.level_times[level - 2] = clock - self.start_clock
+
+    def multiplier_changed(self, multiplier, clock):
+        if not self.recording:
+            return
+        self.max_multiplier = max(self.max_multiplier, multiplier)
+        if multiplier > 1 and self.multiplier_since is None:
+            self.multiplier_since = clock
+        elif multiplier == 1 and self.multiplier_since is not None:
+            self.multiplier_seconds += clock - self.multiplier_since
+            self.multiplier_since = None
+
+    def finish(self, clock, score, percentage, grade, level, killer_grade):
+        """End the run; returns its row for save() (None when not recording)"""
+        if not self.recording:
+            return None
+        self.multiplier_changed(1, clock)
+        self.recording = False
+        duration = clock - self.start_clock
+        row = {
+            "end_time": clock, "duration": duration, "score": score, "percentage": percentage,
+            "grade": grade, "level": level, "killer_grade": killer_grade,
+            "max_multiplier": self.max_multiplier,
+            "multiplier_uptime": self.multiplier_seconds / duration if duration > 0 else 0.0,
+        }
+        row.update(zip(LEVEL_TIME_FIELDS, self.level_times))
+        return row
+
+    def save(self, row):
+        """Append a finished run to the archive"""
+        try:
+            if self.history is None:
+                self.history = RunHistory(self.directory)
+            self.history.append_row(**row)
+        except (OSError, ValueError) as e:
+            print(f"Error saving run history: {e}")
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Summarize The Last Bluebook's run history archive
+Usage: python run_history_report.py [history/] [--where FIELD=LOW:HIGH ...] [--histogram FIELD] [--bins 20]
+
+Reads the memory-mapped columns written with --run-history and prints score and percentage
+distributions, grades, what ended the runs, multiplier uptime and the time taken to reach each
+level. --where filters runs by inclusive ranges (either end may be left open), e.g.
+--where level=5: --where killer_grade=9 --where time_to_level_5=:60
+"""
+import sys
+import time
+import argparse
+
+from rules import GRADE_LEVELS
+from run_history import RunHistory, LEVEL_TIME_FIELDS, check_field
+
+
+def parse_where(conditions):
+    """Turn FIELD=VALUE and FIELD=LOW:HIGH strings into query filters"""
+    where = {}
+    for condition in conditions:
+        name, equals, value = condition.partition("=")
+        if not equals or not value:
+            raise ValueError(f"expected FIELD=VALUE or FIELD=LOW:HIGH, got {condition!r}")
+        check_field(name)  # Reject unknown fields early
+        if ":" in value:
+            low, high = value.split(":", 1)
+            where[name] = (float(low) if low else None, float(high) if high else None)
+        else:
+            where[name] = float(value)
+    return where
+
+
+def print_histogram(counts, edges, width=40):
+    peak = max(1, counts.max())
+    for count, low, high in zip(counts, edges, edges[1:]):
+        print(f"  {low:>8.1f} - {high:<8.1f} {count:>9} {'#' * int(width * count / peak)}")
+
+
+def summarize(history, where, histogram_field=None, bins=20):
+    """Print the summary of the matching runs"""
+    runs = history.count(where)
+    print(f"{runs} of {len(history)} runs")
+    if not runs:
+        return
+
+    score = history.aggregate("score", where, percentiles=(50, 90, 99))
+    print(f"\nScore: avg {score['mean']:.1f}  median {score['p50']:.0f}  p90 {score['p90']:.0f}  "
+          f"p99 {score['p99']:.0f}  max {score['max']:.0f}")
+    duration = history.aggregate("duration", where)
+    print(f"Run length: avg {duration['mean']:.1f} s  max {duration['max']:.1f} s")
+    uptime = history.aggregate("multiplier_uptime", where)
+    print(f"Multiplier uptime: avg {uptime['mean']:.1%}")
+
+    print("\nPercentage:")
+    print_histogram(*history.histogram("percentage", bins=10, range=(0, 100), where=where))
+
+    grades = history.value_counts("grade", where, minlength=len(GRADE_LEVELS))
+    killers = history.value_counts("killer_grade", where, minlength=len(GRADE_LEVELS))
+    print(f"\n{'grade':>7} {'final':>9} {'ended by':>9}")
+    for index, grade in enumerate(GRADE_LEVELS):
+        if grades[index] or killers[index]:
+            print(f"  {grade:>5} {grades[index]:>9} {killers[index]:>9}")
+
+    print("\nTime to reach each level:")
+    for level, field in enumerate(LEVEL_TIME_FIELDS, 2):
+        times = history.aggregate(field, where, percentiles=(50,))
+        if not times["count"]:
+            break
+        print(f"  {level:>3} {times['count'] / runs:>6.1%} of runs, median {times['p50']:.1f} s")
+
+    if histogram_field:
+        print(f"\n{histogram_field}:")
+        print_histogram(*history.histogram(histogram_field, bins=bins, where=where))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("directory", nargs="?", default="history", help="Run history directory")
+    parser.add_argument("--where", action="append", default=[], metavar="FIELD=LOW:HIGH",
+                        help="Only include runs with FIELD in the inclusive range (repeatable)")
+    parser.add_argument("--histogram", default=None, metavar="FIELD", help="Also print a histogram of FIELD")
+    parser.add_argument("--bins", type=int, default=20)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        history = RunHistory(args.directory, create=False)
+        where = parse_where(args.where)
+        if args.histogram:
+            check_field(args.histogram)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    summarize(history, where, args.histogram, args.bins)
+    print(f"\nSummarized in {(time.perf_counter() - start) * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
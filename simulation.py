@@ -0,0 +1,183 @@
+"""
+Headless re-simulation of recorded runs for The Last Bluebook
+Replays a run tick by tick with the game's rules - no display, audio, sprites or effects - so the
+result can be checked against the score the run claims. The rules and timers are the game's own
+(rules.py, timers.py); pygame is only used for its Rect arithmetic, so positions round identically.
+"""
+import os
+import random
+
+import pygame
+
+from collision import swept_hit_time, swept_rects_hit
+from trajectory import ExpiryHeap, SpawnIndex, exit_time, radial_band
+from replay import LEFT, RIGHT, UP, DOWN
+from timers import TimerScheduler
+from rules import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, CENTER_X, CENTER_Y, FPS, PLAYER_SIZE, PLAYER_SPEED, PROJECTILE_SIZE,
+    POINT_SIZE, PROJECTILE_SPEED, BASE_PROJECTILE_INTERVAL, MULTIPLIER_DURATION, GRADE_LEVELS,
+    grade_for_score, level_for_score, projectile_interval_for_level, next_multiplier, point_position,
+    projectile_velocity,
+)
+
+
+def sprite_sizes(images_dir):
+    """Get the collision sizes the game uses, which depend on the images that exist"""
+    grade_size = (PROJECTILE_SIZE * 2, int(PROJECTILE_SIZE * 2 * 0.4))
+    return {
+        "player": (int(0.67 * PLAYER_SIZE), PLAYER_SIZE),
+        "point": (POINT_SIZE * 2, POINT_SIZE * 2),
+        "projectiles": {grade: grade_size for grade in GRADE_LEVELS
+                        if os.path.exists(os.path.join(images_dir, f"projectile_{grade}.png"))},
+        "default_projectile": (PROJECTILE_SIZE * 2, PROJECTILE_SIZE * 2),
+    }
+
+
+class SimProjectile:
+    __slots__ = ("spawn_time", "dx", "dy", "width", "height", "exit_time", "in_flight")
+
+    def __init__(self, spawn_time, dx, dy, size):
+        self.spawn_time = spawn_time
+        self.dx = dx
+        self.dy = dy
+        self.width, self.height = size
+        self.in_flight = True
+        self.exit_time = exit_time(spawn_time, CENTER_X, CENTER_Y, dx, dy,
+                                   -PROJECTILE_SIZE, -PROJECTILE_SIZE,
+                                   SCREEN_WIDTH + PROJECTILE_SIZE, SCREEN_HEIGHT + PROJECTILE_SIZE)
+
+    def position(self, t):
+        elapsed = t - self.spawn_time
+        return CENTER_X + self.dx * elapsed, CENTER_Y + self.dy * elapsed
+
+
+class Simulation:
+    """One run of the game, advanced a tick at a time from recorded inputs"""
+    def __init__(self, seed, start_clock, sim_hz, sizes):
+        self.rng = random.Random(seed)
+        self.sizes = sizes
+        self.step = 1.0 / sim_hz
+        self.tick_scale = FPS * self.step
+        self.ticks = 0
+
+        # start_game()
+        self.player_pos = [SCREEN_WIDTH // 4, SCREEN_HEIGHT // 4]
+        self.player_rect = pygame.Rect((0, 0), sizes["player"])
+        self.player_rect.topleft = self.player_pos
+        self.previous_player_rect = self.player_rect.copy()
+        self.projectiles = SpawnIndex()
+        self.projectile_expiry = ExpiryHeap()
+
+        self.game_over = False
+        self.score = 0
+        self.difficulty_level = 1
+        self.clock = start_clock
+        self.projectile_clock = start_clock
+        self.previous_projectile_clock = start_clock
+
+        # Armed in the same order as the game's, so timers due together fire in the same order
+        self.timers = TimerScheduler(start_clock)
+        self.spawn_timer = self.timers.every(BASE_PROJECTILE_INTERVAL, self.spawn_projectile)
+        self.multiplier_expiry = self.timers.timer(MULTIPLIER_DURATION, self.expire_multiplier)
+
+        self.point_rect = pygame.Rect((0, 0), sizes["point"])
+        self.point_rect.center = point_position(self.rng)
+
+        self.score_multiplier = 1
+        self.last_point_time = start_clock
+
+    def tick(self, keys):
+        """Run one simulation tick with the arrow keys encoded in keys (see replay.py)"""
+        self.ticks += 1
+        self.clock += self.step
+        if self.game_over:
+            return
+        self.move_player(keys)
+        self.previous_projectile_clock = self.projectile_clock
+        self.projectile_clock = self.clock
+        self.timers.advance(self.clock)
+        self.retire_projectiles()
+        self.check_projectile_collisions()
+        self.check_point_collision()
+
+    def move_player(self, keys):
+        self.previous_player_rect = self.player_rect.copy()
+        step = PLAYER_SPEED * self.tick_scale
+        if keys & LEFT:
+            self.player_pos[0] -= step
+        if keys & RIGHT:
+            self.player_pos[0] += step
+        if keys & UP:
+            self.player_pos[1] -= step
+        if keys & DOWN:
+            self.player_pos[1] += step
+        self.player_pos[0] = max(0, min(self.player_pos[0], SCREEN_WIDTH - PLAYER_SIZE))
+        self.player_pos[1] = max(0, min(self.player_pos[1], SCREEN_HEIGHT - PLAYER_SIZE))
+        self.player_rect.topleft = (self.player_pos[0], self.player_pos[1])
+
+    def expire_multiplier(self):
+        self.score_multiplier = 1
+
+    def spawn_projectile(self):
+        target_x = self.player_pos[0] + PLAYER_SIZE/2
+        target_y = self.player_pos[1] + PLAYER_SIZE/2
+        size = self.sizes["projectiles"].get(grade_for_score(self.score), self.sizes["default_projectile"])
+        dx, dy = projectile_velocity(self.rng, target_x, target_y)
+        projectile = SimProjectile(self.clock, dx, dy, size)
+        self.projectiles.append(self.clock, projectile)
+        self.projectile_expiry.push(projectile.exit_time, projectile)
+
+    def retire_projectiles(self):
+        for projectile in self.projectile_expiry.pop_expired(self.clock):
+            projectile.in_flight = False
+        self.projectiles.trim()
+
+    def check_projectile_collisions(self):
+        speed = PROJECTILE_SPEED * FPS
+        previous = self.previous_player_rect
+        current = self.player_rect
+        near, far = radial_band(current.union(previous), CENTER_X, CENTER_Y, PROJECTILE_SIZE)
+        for projectile in self.projectiles.spawned_between(self.previous_projectile_clock - far / speed,
+                                                           self.projectile_clock - near / speed):
+            start_time = max(self.previous_projectile_clock, projectile.spawn_time)
+            start_x, start_y = projectile.position(start_time)
+            end_x, end_y = projectile.position(self.projectile_clock)
+            width, height = projectile.width, projectile.height
+            if swept_hit_time(
+                start_x - width / 2, start_y - height / 2, width, height, end_x - start_x, end_y - start_y,
+                previous.x, previous.y, previous.width, previous.height,
+                current.x - previous.x, current.y - previous.y,
+            ) is not None:
+                self.game_over = True
+                break
+
+    def check_point_collision(self):
+        if swept_rects_hit(self.previous_player_rect, self.player_rect, self.point_rect, self.point_rect):
+            self.score += self.score_multiplier
+            self.score_multiplier = next_multiplier(self.score_multiplier, self.clock - self.last_point_time)
+            self.last_point_time = self.clock
+            self.timers.restart(self.multiplier_expiry)
+            self.point_rect.center = point_position(self.rng)
+
+            new_level = level_for_score(self.score)
+            if new_level > self.difficulty_level:
+                self.difficulty_level = new_level
+                self.timers.set_delay(self.spawn_timer, projectile_interval_for_level(self.difficulty_level))
+
+
+def replay_run(run, sizes):
+    """Re-simulate a recorded run; returns (simulation, problem or None)"""
+    simulation = Simulation(run["seed"], run["start_clock"], run["sim_hz"], sizes)
+    inputs = run["inputs"]
+    for i, digit in enumerate(inputs):
+        if simulation.game_over:
+            return simulation, f"game over at tick {i} of {len(inputs)}"
+        simulation.tick(int(digit, 16))
+    if not simulation.game_over:
+        return simulation, f"still alive after {len(inputs)} ticks"
+
+    claim = run["claim"]
+    actual = {"score": simulation.score, "grade": grade_for_score(simulation.score),
+              "level": simulation.difficulty_level}
+    mismatches = [f"{key} {claim.get(key)} != {value}" for key, value in actual.items() if claim.get(key) != value]
+    return simulation, "; ".join(mismatches) or None
@@ -0,0 +1,101 @@
+"""
+Startup helpers for The Last Bluebook
+Background asset loading with progress reporting and a profiler for the startup phases
+"""
+import sys
+import threading
+import time
+import traceback
+
+
+class StartupProfiler:
+    def __init__(self, process_start):
+        self.process_start = process_start  # perf_counter() taken as early as possible in main.py
+        self.phases = []                    # (name, seconds) in the order they finished
+        self.marks = {}                     # Milestone name -> seconds since process start
+        self.lock = threading.Lock()
+
+    def record(self, name, seconds):
+        with self.lock:
+            self.phases.append((name, seconds))
+
+    def phase(self, name):
+        """Time a with-block as a startup phase"""
+        return _Phase(self, name)
+
+    def mark(self, name):
+        """Record a milestone, e.g. the first frame being shown"""
+        self.marks[name] = time.perf_counter() - self.process_start
+
+    def report(self, out=None):
+        out = out or sys.stdout
+        out.write("Startup profile\n")
+        for name, seconds in self.phases:
+            out.write(f"  {name:<24} {seconds * 1000:>9.1f} ms\n")
+        for name, seconds in sorted(self.marks.items(), key=lambda item: item[1]):
+            out.write(f"  @ {name:<22} {seconds * 1000:>9.1f} ms after start\n")
+
+
+class _Phase:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class AssetLoader:
+    """Runs loading jobs on a background thread while the main thread keeps the window alive"""
+    def __init__(self):
+        self.jobs = []  # (name, weight, function)
+        self.total_weight = 0
+        self.done_weight = 0
+        self.current = ""
+        self.error = None
+        self.finished = threading.Event()
+        self.thread = None
+
+    def add(self, name, weight, function):
+        """Queue a job; weight is its share of the progress bar"""
+        self.jobs.append((name, weight, function))
+        self.total_weight += weight
+
+    def start(self):
+        self.thread = threading.Thread(target=self._run, name="asset-loader", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        try:
+            for name, weight, function in self.jobs:
+                self.current = name
+                function()
+                self.done_weight += weight
+        except Exception as e:
+            traceback.print_exc()
+            self.error = e
+        finally:
+            self.current = ""
+            self.finished.set()
+
+    @property
+    def progress(self):
+        """Fraction of the queued work that has finished"""
+        if self.total_weight == 0:
+            return 1.0
+        return self.done_weight / self.total_weight
+
+    def is_done(self):
+        return self.finished.is_set()
+
+    def run_blocking(self):
+        """Run every job on the calling thread (for tools that have no window to keep alive)"""
+        self._run()
+        if self.error is not None:
+            raise self.error
@@ -0,0 +1,136 @@
+"""
+Bullet hell stress mode for The Last Bluebook
+Ramps projectile spawning up until the engine breaks and reports how each subsystem scales
+"""
+import csv
+import math
+import time
+
+SUBSYSTEMS = ["update", "collision", "draw"]
+
+
+class StressRamp:
+    def __init__(self, stage_duration=2.0, start_interval=0.25, min_interval=1 / 60,
+                 max_burst=4096, max_entities=50000, min_fps=5):
+        self.stage_duration = stage_duration
+        self.min_interval = min_interval
+        self.max_burst = max_burst
+        self.max_entities = max_entities
+        self.min_fps = min_fps
+
+        self.spawn_interval = start_interval  # Time between spawns for the current stage
+        self.burst = 1                        # Projectiles spawned per spawn tick
+        self.stage = 0
+        self.stage_start = time.perf_counter()
+        self.stage_frame_times = []
+        self.finished = False
+        self.finish_reason = ""
+
+        # One row per frame: entity counts and timings in milliseconds
+        self.samples = []
+
+    def record(self, projectile_count, particle_count, frame_ms, timings):
+        """Record one frame and advance the ramp when the stage is over"""
+        self.samples.append((
+            self.stage, projectile_count, particle_count, frame_ms,
+            *(timings.get(name, 0.0) * 1000 for name in SUBSYSTEMS)
+        ))
+        self.stage_frame_times.append(frame_ms)
+
+        if projectile_count + particle_count >= self.max_entities:
+            self.finished = True
+            self.finish_reason = f"reached {self.max_entities} entities"
+
+        current_time = time.perf_counter()
+        if current_time - self.stage_start >= self.stage_duration:
+            self._next_stage(current_time)
+
+    def _next_stage(self, current_time):
+        # Give up once a whole stage runs below the FPS floor
+        mean_frame_ms = sum(self.stage_frame_times) / max(1, len(self.stage_frame_times))
+        if mean_frame_ms > 1000 / self.min_fps:
+            self.finished = True
+            self.finish_reason = f"stage {self.stage} averaged {1000 / mean_frame_ms:.1f} FPS"
+
+        # Spawn more often until every frame spawns, then spawn bigger bursts
+        if self.spawn_interval > self.min_interval:
+            self.spawn_interval = max(self.min_interval, self.spawn_interval / 2)
+        elif self.burst < self.max_burst:
+            self.burst *= 2
+        else:
+            self.finished = True
+            self.finish_reason = "reached maximum burst size"
+
+        self.stage += 1
+        self.stage_start = current_time
+        self.stage_frame_times = []
+
+    def overlay_lines(self):
+        return [f"stress stage {self.stage}  interval {self.spawn_interval * 1000:.0f} ms  burst {self.burst}"]
+
+    def write_samples(self, path):
+        """Write the raw per-frame samples as CSV"""
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["stage", "projectiles", "particles", "frame_ms"] + [f"{name}_ms" for name in SUBSYSTEMS])
+            writer.writerows(self.samples)
+
+    def scaling_curve(self):
+        """Average timings per power-of-two bucket of entity count"""
+        buckets = {}
+        for stage, projectiles, particles, frame_ms, *timings in self.samples:
+            entities = projectiles + particles
+            bucket = 0 if entities == 0 else 2 ** int(math.log2(entities))
+            buckets.setdefault(bucket, []).append((frame_ms, *timings))
+
+        curve = []
+        for bucket in sorted(buckets):
+            rows = buckets[bucket]
+            means = [sum(column) / len(rows) for column in zip(*rows)]
+            curve.append((bucket, len(rows), *means))
+        return curve
+
+    def find_knees(self, curve, tolerance=1.5, min_entities=64):
+        """Find the entity count where each subsystem's cost per entity stops being flat"""
+        knees = {}
+        for index, name in enumerate(SUBSYSTEMS):
+            best_per_entity = None
+            for bucket, frames, frame_ms, *timings in curve:
+                if bucket < min_entities:
+                    continue
+                per_entity = timings[index] / bucket
+                if best_per_entity is None or per_entity < best_per_entity:
+                    best_per_entity = per_entity
+                elif per_entity > best_per_entity * tolerance:
+                    knees[name] = bucket
+                    break
+        return knees
+
+    def write_report(self, path):
+        """Write the scaling curve and the point where each subsystem goes superlinear"""
+        curve = self.scaling_curve()
+        knees = self.find_knees(curve)
+
+        with open(path, "w") as f:
+            f.write("The Last Bluebook - stress test scaling report\n")
+            f.write(f"Stopped after stage {self.stage}: {self.finish_reason or 'window closed'}\n\n")
+            f.write(f"{'entities':>9} {'frames':>7} {'fps':>7} {'frame ms':>9}")
+            for name in SUBSYSTEMS:
+                f.write(f" {name + ' ms':>13} {'us/entity':>10}")
+            f.write("\n")
+
+            for bucket, frames, frame_ms, *timings in curve:
+                fps = 1000 / frame_ms if frame_ms > 0 else 0
+                f.write(f"{bucket:>9} {frames:>7} {fps:>7.1f} {frame_ms:>9.2f}")
+                for value in timings:
+                    per_entity = value * 1000 / bucket if bucket else 0
+                    f.write(f" {value:>13.3f} {per_entity:>10.3f}")
+                f.write("\n")
+
+            f.write("\nCost per entity grows superlinearly from:\n")
+            for name in SUBSYSTEMS:
+                if name in knees:
+                    f.write(f"  {name}: ~{knees[name]} entities\n")
+                else:
+                    f.write(f"  {name}: stayed linear over the tested range\n")
+        return knees
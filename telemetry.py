@@ -0,0 +1,173 @@
+"""
+Gameplay telemetry for The Last Bluebook
+The game loop packs fixed-size binary records into a preallocated ring buffer; a background
+thread flushes them in batches to rotating log files. Use telemetry_reader.py to analyze the logs.
+"""
+import os
+import struct
+import threading
+import time
+
+MAGIC = b"BLBKTLM1"
+VERSION = 1
+HEADER = struct.Struct("<8sHH4x")  # Magic, version, record size
+
+# t (seconds since run start), kind, grade index, level, a, b, run number
+RECORD = struct.Struct("<dBBHffI")
+
+# Event kinds
+RUN_START = 1
+SPAWN = 2             # grade = projectile grade
+PICKUP = 3            # a = multiplier the point was scored with, b = score after the pickup
+LEVEL_UP = 4          # level = new level, a = new projectile interval
+MULTIPLIER_RESET = 5  # a = multiplier that was lost, b = 0 for timeout, 1 for a late pickup
+GAME_OVER = 6         # grade = grade of the projectile that ended the run, a = score, b = percentage
+
+KIND_NAMES = {
+    RUN_START: "run_start",
+    SPAWN: "spawn",
+    PICKUP: "pickup",
+    LEVEL_UP: "level_up",
+    MULTIPLIER_RESET: "multiplier_reset",
+    GAME_OVER: "game_over",
+}
+
+NO_GRADE = 255
+
+
+class TelemetryRing:
+    """Single-producer ring buffer of packed records"""
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.buffer = bytearray(capacity * RECORD.size)
+        self.written = 0  # Records ever written (only the game loop changes this)
+        self.flushed = 0  # Records ever taken by the flusher (only the flusher changes this)
+        self.dropped = 0  # Records overwritten before they could be flushed
+
+    def append(self, t, kind, grade, level, a, b, run):
+        RECORD.pack_into(self.buffer, (self.written % self.capacity) * RECORD.size,
+                         t, kind, grade, level, a, b, run)
+        self.written += 1
+
+    def pending(self):
+        return self.written - self.flushed
+
+    def take(self):
+        """Copy out every record not flushed yet, oldest first"""
+        end = self.written
+        start = max(self.flushed, end - self.capacity)
+        if start == end:
+            return b""
+
+        size = RECORD.size
+        first = (start % self.capacity) * size
+        last = (end % self.capacity) * size
+        if first < last:
+            data = bytes(self.buffer[first:last])
+        else:
+            data = bytes(self.buffer[first:]) + bytes(self.buffer[:last])
+
+        # The writer may have lapped us while copying; drop whatever it overwrote
+        overwritten = max(0, self.written - self.capacity - start)
+        if overwritten:
+            data = data[overwritten * size:]
+            start += overwritten
+        self.dropped += start - self.flushed
+        self.flushed = end
+        return data
+
+
+class Telemetry:
+    def __init__(self, directory=None, capacity=16384, flush_interval=1.0,
+                 max_file_bytes=4 * 1024 * 1024, max_files=20):
+        self.enabled = directory is not None
+        self.paused = False  # Set while demo runs are playing so they don't mix with real ones
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.max_file_bytes = max_file_bytes
+        self.max_files = max_files
+
+        self.ring = TelemetryRing(capacity)
+        self.flush_threshold = capacity // 2
+        self.run = 0
+        self.run_start = 0.0
+
+        self.file = None
+        self.file_bytes = 0
+        self.file_index = 0
+        self.session = time.strftime("%Y%m%d-%H%M%S")
+
+        self.wake = threading.Event()
+        self.stopping = False
+        self.thread = None
+
+    def start(self):
+        if not self.enabled:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        self.thread = threading.Thread(target=self._flush_loop, name="telemetry", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Flush everything left and close the log"""
+        if not self.enabled or self.thread is None:
+            return
+        self.stopping = True
+        self.wake.set()
+        self.thread.join(timeout=5.0)
+        if self.file:
+            self.file.close()
+            self.file = None
+
+    def start_run(self, now):
+        """Begin a new run; event times are relative to its start"""
+        if not self.enabled or self.paused:
+            return
+        self.run += 1
+        self.run_start = now
+        self.record(now, RUN_START)
+
+    def record(self, now, kind, grade=NO_GRADE, level=0, a=0.0, b=0.0):
+        """Append an event (cheap enough for the game loop)"""
+        if not self.enabled or self.paused:
+            return
+        ring = self.ring
+        ring.append(now - self.run_start, kind, grade, level, a, b, self.run)
+        if ring.written - ring.flushed >= self.flush_threshold:
+            self.wake.set()
+
+    def _flush_loop(self):
+        while not self.stopping:
+            self.wake.wait(self.flush_interval)
+            self.wake.clear()
+            self._flush()
+        self._flush()
+
+    def _flush(self):
+        data = self.ring.take()
+        if not data:
+            return
+        if self.file is None or self.file_bytes >= self.max_file_bytes:
+            self._rotate()
+        self.file.write(data)
+        self.file.flush()
+        self.file_bytes += len(data)
+
+    def _rotate(self):
+        """Start a new log file, deleting the oldest ones beyond max_files"""
+        if self.file:
+            self.file.close()
+        self.file_index += 1
+        path = os.path.join(self.directory, f"telemetry-{self.session}-{self.file_index:04d}.bin")
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+        self.file_bytes = HEADER.size
+
+        logs = sorted(name for name in os.listdir(self.directory)
+                      if name.startswith("telemetry-") and name.endswith(".bin"))
+        for name in logs[:-self.max_files]:
+            os.remove(os.path.join(self.directory, name))
+
+    def overlay_lines(self):
+        ring = self.ring
+        return [f"telemetry  {ring.written} events  pending {ring.pending()}  dropped {ring.dropped}"]
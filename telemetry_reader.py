@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Load The Last Bluebook telemetry logs into NumPy arrays
+Usage: python telemetry_reader.py [telemetry/ or log files...] [--csv events.csv]
+
+Each log is a short header followed by packed fixed-size records, so a whole file becomes
+one structured array without parsing. Prints a summary of the loaded runs.
+"""
+import os
+import sys
+import glob
+import argparse
+
+import numpy as np
+
+import telemetry as tm
+from rules import GRADE_LEVELS
+
+# Must match telemetry.RECORD field for field (little endian, no padding)
+RECORD_DTYPE = np.dtype([
+    ("t", "<f8"),
+    ("kind", "u1"),
+    ("grade", "u1"),
+    ("level", "<u2"),
+    ("a", "<f4"),
+    ("b", "<f4"),
+    ("run", "<u4"),
+])
+
+
+def read_log(path):
+    """Read one log file into a structured array"""
+    with open(path, "rb") as f:
+        header = f.read(tm.HEADER.size)
+        if len(header) < tm.HEADER.size:
+            return np.empty(0, dtype=RECORD_DTYPE)
+        magic, version, record_size = tm.HEADER.unpack(header)
+        if magic != tm.MAGIC or version != tm.VERSION or record_size != RECORD_DTYPE.itemsize:
+            raise ValueError(f"{path} is not a version {tm.VERSION} telemetry log")
+        data = f.read()
+
+    # A log still being written may end in a partial record
+    usable = len(data) - len(data) % RECORD_DTYPE.itemsize
+    return np.frombuffer(data[:usable], dtype=RECORD_DTYPE)
+
+
+def log_paths(paths):
+    """Expand directories into their log files, in the order they were written"""
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            found += sorted(glob.glob(os.path.join(path, "telemetry-*.bin")))
+        else:
+            found.append(path)
+    return found
+
+
+def load(paths):
+    """Load every record from the given files and directories"""
+    arrays = [read_log(path) for path in log_paths(paths)]
+    if not arrays:
+        return np.empty(0, dtype=RECORD_DTYPE)
+    return np.concatenate(arrays)
+
+
+def summarize(events):
+    """Print what happened in the loaded runs"""
+    kinds = events["kind"]
+    print(f"{len(events)} events")
+    for kind, name in tm.KIND_NAMES.items():
+        print(f"  {name:<17} {np.count_nonzero(kinds == kind)}")
+
+    game_overs = events[kinds == tm.GAME_OVER]
+    if len(game_overs):
+        scores = game_overs["a"]
+        print(f"\n{len(game_overs)} runs ended: score avg {scores.mean():.1f}  median {np.median(scores):.0f}"
+              f"  max {scores.max():.0f}  length avg {game_overs['t'].mean():.1f} s")
+        print(f"  passed (60%+) {np.count_nonzero(game_overs['b'] >= 60) / len(game_overs):.0%}")
+
+        print("\nEnded by grade:")
+        counts = np.bincount(game_overs["grade"], minlength=len(GRADE_LEVELS))
+        for index in np.flatnonzero(counts):
+            print(f"  {GRADE_LEVELS[index] if index < len(GRADE_LEVELS) else '?':>5} {counts[index]}")
+
+    pickups = events[kinds == tm.PICKUP]
+    if len(pickups):
+        print("\nPickups by multiplier:")
+        counts = np.bincount(pickups["a"].astype(np.int64))
+        for multiplier in np.flatnonzero(counts):
+            print(f"  x{multiplier} {counts[multiplier]}")
+
+    resets = events[kinds == tm.MULTIPLIER_RESET]
+    if len(resets):
+        print(f"\nMultiplier resets: {np.count_nonzero(resets['b'] == 0)} timed out, "
+              f"{np.count_nonzero(resets['b'] == 1)} late pickups, lost x{resets['a'].mean():.1f} on average")
+
+    level_ups = events[kinds == tm.LEVEL_UP]
+    if len(level_ups):
+        print("\nMedian time to reach each level:")
+        for level in np.unique(level_ups["level"]):
+            print(f"  {level:>3} {np.median(level_ups['t'][level_ups['level'] == level]):.1f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("paths", nargs="*", default=["telemetry"], help="Log files or directories")
+    parser.add_argument("--csv", default=None, help="Also write every event to this CSV file")
+    args = parser.parse_args()
+
+    events = load(args.paths)
+    summarize(events)
+
+    if args.csv:
+        np.savetxt(args.csv, events, delimiter=",", header=",".join(RECORD_DTYPE.names), comments="",
+                   fmt=["%.6f", "%d", "%d", "%d", "%g", "%g", "%d"])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
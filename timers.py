@@ -0,0 +1,140 @@
+"""
+Timers for The Last Bluebook
+Everything that happens on a cadence (projectile spawns, multiplier expiry, particle trails) registers
+a timer here instead of polling the clock. The scheduler is advanced once per simulation tick with
+that tick's timestamp, so with fixed simulation steps it is fully deterministic.
+"""
+import math
+import heapq
+
+
+def _ulp(x):
+    """Gap between x and the next float of its magnitude (math.ulp needs Python 3.9)"""
+    return math.ldexp(1.0, math.frexp(x)[1] - 53)
+
+
+class Timer:
+    """A callback due `delay` seconds after `start`, and again after every firing if it repeats"""
+    __slots__ = ("start", "delay", "callback", "repeat", "active", "entry")
+
+    def __init__(self, delay, callback, repeat):
+        self.start = 0.0
+        self.delay = delay
+        self.callback = callback
+        self.repeat = repeat
+        self.active = False
+        self.entry = None  # Counter of the timer's current heap entry; older entries are stale
+
+    def remaining(self, now):
+        """Seconds until the timer is due (0 when it is not running)"""
+        if not self.active:
+            return 0.0
+        return max(0.0, self.delay - (now - self.start))
+
+
+class TimerScheduler:
+    """Min-heap of timers keyed by due time, fired in due order as the clock advances"""
+    def __init__(self, now=0.0):
+        self.now = now
+        self.heap = []
+        self.counter = 0  # Tie breaker, so timers due together fire in the order they were armed
+        self.active_count = 0
+        self.fired_count = 0
+
+    def timer(self, delay, callback, repeat=False):
+        """Create a timer without starting it; restart() starts it"""
+        return Timer(delay, callback, repeat)
+
+    def after(self, delay, callback):
+        """Call callback once, delay seconds from now"""
+        return self._arm(Timer(delay, callback, False), self.now)
+
+    def every(self, interval, callback):
+        """Call callback every interval seconds from now, timed from each firing"""
+        return self._arm(Timer(interval, callback, True), self.now)
+
+    def restart(self, timer, delay=None):
+        """(Re)start a timer from now, optionally with a new delay"""
+        if delay is not None:
+            timer.delay = delay
+        self._arm(timer, self.now)
+
+    def set_delay(self, timer, delay):
+        """Change a timer's delay without moving its start, like changing a polled interval"""
+        timer.delay = delay
+        if timer.active:
+            self._arm(timer, timer.start)
+
+    def cancel(self, timer):
+        if timer.active:
+            timer.active = False
+            timer.entry = None
+            self.active_count -= 1
+
+    def _arm(self, timer, start):
+        if not timer.active:
+            timer.active = True
+            self.active_count += 1
+        timer.start = start
+        timer.entry = self.counter
+        heapq.heappush(self.heap, (start + timer.delay, self.counter, timer))
+        self.counter += 1
+        self._compact()
+        return timer
+
+    def advance(self, now):
+        """Move the clock to now and fire every timer that has come due, earliest first
+
+        A timer fires once now - start >= delay, the same test the game used when it polled, so
+        runs replay identically. Each timer fires at most once per call.
+        """
+        self.now = now
+        limit = now + 2 * _ulp(now)  # start + delay can round a hair above the exact test
+        due = []
+        early = []
+        while self.heap and self.heap[0][0] <= limit:
+            entry = heapq.heappop(self.heap)
+            timer = entry[2]
+            if timer.entry != entry[1]:
+                continue  # Cancelled or re-armed since
+            if now - timer.start >= timer.delay:
+                due.append(timer)
+            else:
+                early.append(entry)
+        for entry in early:
+            heapq.heappush(self.heap, entry)
+
+        for timer in due:
+            if timer.entry is None:
+                continue  # Cancelled by an earlier callback
+            if timer.repeat:
+                self._arm(timer, now)
+            else:
+                timer.active = False
+                timer.entry = None
+                self.active_count -= 1
+            self.fired_count += 1
+            timer.callback()
+        return len(due)
+
+    def reset(self, now):
+        """Cancel every timer and restart the clock at now, e.g. for a new run"""
+        for _, counter, timer in self.heap:
+            if timer.entry == counter:
+                timer.active = False
+                timer.entry = None
+        self.heap = []
+        self.active_count = 0
+        self.now = now
+
+    def _compact(self):
+        """Drop stale entries once they outnumber the live ones"""
+        if len(self.heap) > 2 * self.active_count + 64:
+            self.heap = [entry for entry in self.heap if entry[2].entry == entry[1]]
+            heapq.heapify(self.heap)
+
+    def __len__(self):
+        return self.active_count
+
+    def overlay_lines(self):
+        return [f"timers {self.active_count} active  fired {self.fired_count}  heap {len(self.heap)}"]
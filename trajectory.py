@@ -0,0 +1,96 @@
+"""
+Closed-form straight-line trajectories for The Last Bluebook
+Projectiles store only where and when they started, so positions are evaluated on demand
+and off-screen removal is a pop from a heap ordered by the precomputed exit time
+"""
+import heapq
+import math
+from bisect import bisect_left, bisect_right
+
+
+def exit_time(spawn_time, x0, y0, vx, vy, left, top, right, bottom):
+    """Get the time a point moving from (x0, y0) at (vx, vy) per second leaves the rectangle"""
+    travel = math.inf
+    if vx > 0:
+        travel = min(travel, (right - x0) / vx)
+    elif vx < 0:
+        travel = min(travel, (left - x0) / vx)
+    if vy > 0:
+        travel = min(travel, (bottom - y0) / vy)
+    elif vy < 0:
+        travel = min(travel, (top - y0) / vy)
+    return spawn_time + max(0.0, travel)
+
+
+def radial_band(rect, center_x, center_y, margin):
+    """Get the min and max distance from the center to any point of the rect grown by margin"""
+    left = rect.left - margin
+    right = rect.right + margin
+    top = rect.top - margin
+    bottom = rect.bottom + margin
+
+    # Nearest point of the rect (the center itself when it is inside)
+    nearest_x = min(max(center_x, left), right)
+    nearest_y = min(max(center_y, top), bottom)
+    near = math.hypot(nearest_x - center_x, nearest_y - center_y)
+
+    far = math.hypot(max(abs(left - center_x), abs(right - center_x)),
+                     max(abs(top - center_y), abs(bottom - center_y)))
+    return near, far
+
+
+class ExpiryHeap:
+    """Min-heap of items keyed by the time they expire"""
+    def __init__(self):
+        self.heap = []
+        self.counter = 0  # Tie breaker so items themselves are never compared
+
+    def push(self, expiry, item):
+        heapq.heappush(self.heap, (expiry, self.counter, item))
+        self.counter += 1
+
+    def pop_expired(self, now):
+        """Remove and return every item whose expiry time has passed"""
+        expired = []
+        while self.heap and self.heap[0][0] <= now:
+            expired.append(heapq.heappop(self.heap)[2])
+        return expired
+
+    def clear(self):
+        self.heap = []
+
+    def __len__(self):
+        return len(self.heap)
+
+
+class SpawnIndex:
+    """Items in spawn order, so those spawned within a time window can be found by bisection
+
+    Items must have an ``in_flight`` attribute; retired items are dropped from the front lazily.
+    """
+    def __init__(self):
+        self.times = []
+        self.items = []
+
+    def append(self, spawn_time, item):
+        self.times.append(spawn_time)
+        self.items.append(item)
+
+    def spawned_between(self, start, end):
+        """Get the live items spawned in [start, end]"""
+        first = bisect_left(self.times, start)
+        last = bisect_right(self.times, end)
+        return [item for item in self.items[first:last] if item.in_flight]
+
+    def trim(self):
+        """Drop retired items from the front"""
+        retired = 0
+        while retired < len(self.items) and not self.items[retired].in_flight:
+            retired += 1
+        if retired:
+            del self.times[:retired]
+            del self.items[:retired]
+
+    def clear(self):
+        self.times = []
+        self.items = []